@@ -0,0 +1,69 @@
+"""
+Attendee export memory benchmark
+Seeds events with 10,000, 100,000 and 1,000,000 tickets in a scratch database
+and streams their attendee export in every available format, discarding the
+bytes as a slow client would never see them pile up. Reports throughput, size
+and how far resident memory rose above where it started; the rise must not
+grow with the number of tickets
+"""
+
+import argparse
+import asyncio
+import time
+from benchmark_support import SCRATCH_DATABASE_URL, rss_mib, scratch_database, seed_bookings, seed_event, seed_users
+from src.container import container
+
+TICKETS_PER_BOOKING = 4
+
+
+async def export(event_id: int, export_format: str) -> tuple:
+    """Bytes, seconds and peak resident memory rise (MiB) of one streamed export"""
+    baseline = rss_mib()
+    peak = baseline
+    size = 0
+    started = time.perf_counter()
+    stream = await container.export_use_cases.stream_attendees(event_id, export_format)
+    async for chunk in stream.chunks:
+        size += len(chunk)
+        peak = max(peak, rss_mib())
+    return size, time.perf_counter() - started, peak - baseline
+
+
+async def benchmark(sizes: list, database_url: str):
+    """Print export size, throughput and memory rise per format and ticket count"""
+    formats = container.export_use_cases.get_formats()
+    async with scratch_database(database_url):
+        user_ids = await seed_users(1000)
+        print(f"{'tickets':>10} {'format':<8} {'MiB':>9} {'seconds':>8} {'rows/s':>10} {'RSS rise MiB':>13}")
+        rises = {export_format: [] for export_format in formats}
+        for size in sizes:
+            event = await seed_event(capacity=size)
+            await seed_bookings(event, user_ids, size // TICKETS_PER_BOOKING, tickets_per_booking=TICKETS_PER_BOOKING)
+            tickets = size // TICKETS_PER_BOOKING * TICKETS_PER_BOOKING
+            for export_format in formats:
+                # Warm up allocator and statement caches so only the export's own memory shows
+                await export(event.id, export_format)
+                export_size, seconds, rise = await export(event.id, export_format)
+                rises[export_format].append(rise)
+                print(
+                    f"{tickets:>10,} {export_format:<8} {export_size / 2**20:>9.1f} {seconds:>8.1f}"
+                    f" {tickets / seconds:>10,.0f} {rise:>13.1f}"
+                )
+
+    for export_format, format_rises in rises.items():
+        # One chunk of records in flight is expected; growth with the event is not
+        assert max(format_rises) <= min(format_rises) + 32, (
+            f"{export_format}: memory rise grows with the export ({format_rises})"
+        )
+    print("✅ Memory rise independent of event size")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streamed attendee export memory by event size")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Tickets per event"
+    )
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.sizes, args.database_url))
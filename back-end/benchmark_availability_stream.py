@@ -0,0 +1,121 @@
+"""
+Live availability load test
+Opens thousands of idle Server-Sent Events connections to
+/api/v1/availability/stream, driving the application directly over ASGI (no
+server or sockets) against a scratch database. Reports memory per subscriber,
+CPU spent while they idle and how long one booking takes to reach all of them,
+then disconnects them all and checks that every hub subscription was closed
+"""
+
+import argparse
+import asyncio
+import time
+import httpx
+from benchmark_support import SCRATCH_DATABASE_URL, rss_mib, scratch_database, seed_event, seed_users
+from src.container import container
+from src.main import app
+
+
+class StreamClient:
+    """One SSE connection: counts availability messages until told to disconnect"""
+
+    def __init__(self, event_id: int):
+        self.event_id = event_id
+        self.messages = 0
+        self.received = asyncio.Event()
+        self.disconnect = asyncio.Event()
+        self._requested = False
+
+    async def run(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/availability/stream",
+            "raw_path": b"/api/v1/availability/stream",
+            "query_string": f"event_ids={self.event_id}".encode(),
+            "root_path": "",
+            "headers": [(b"host", b"benchmark"), (b"accept", b"text/event-stream")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("benchmark", 80),
+        }
+        await app(scope, self._receive, self._send)
+
+    async def _receive(self) -> dict:
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: dict):
+        if message["type"] == "http.response.body" and b"event: availability" in message.get("body", b""):
+            self.messages += 1
+            self.received.set()
+
+
+async def wait_all(clients: list, messages: int):
+    """Until every client got ``messages`` availability messages"""
+    while any(client.messages < messages for client in clients):
+        await asyncio.gather(*(client.received.wait() for client in clients if client.messages < messages))
+        for client in clients:
+            client.received.clear()
+
+
+async def benchmark(subscribers: int, idle_seconds: float, database_url: str):
+    """Print memory, idle CPU and fan-out latency of ``subscribers`` live streams"""
+    hub = container.availability_hub
+    async with scratch_database(database_url):
+        event = await seed_event(capacity=subscribers * 2)
+        user_ids = await seed_users(1)
+
+        baseline = rss_mib()
+        clients = [StreamClient(event.id) for _ in range(subscribers)]
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(client.run()) for client in clients]
+        # Every stream starts with a snapshot of the event
+        await wait_all(clients, 1)
+        opened = time.perf_counter() - started
+        assert hub.subscription_count == subscribers, f"{hub.subscription_count} subscriptions open"
+        per_subscriber_kib = (rss_mib() - baseline) * 1024 / subscribers
+
+        cpu_started = time.process_time()
+        await asyncio.sleep(idle_seconds)
+        idle_cpu = time.process_time() - cpu_started
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/bookings", json={"user_id": user_ids[0], "event_id": event.id, "quantity": 1}
+            )
+            assert response.status_code == 201, response.text
+            await wait_all(clients, 2)
+            fan_out = time.perf_counter() - started
+
+        for client in clients:
+            client.disconnect.set()
+        await asyncio.gather(*tasks)
+        # Subscriptions are closed by the responses' background tasks
+        await asyncio.sleep(0)
+        leaked = hub.subscription_count
+
+    print(f"{subscribers:,} idle subscribers to event {event.id}")
+    print(f"opened (snapshot delivered to all): {opened:.2f}s")
+    print(f"memory: {per_subscriber_kib:.1f} KiB per subscriber ({rss_mib() - baseline:.1f} MiB in total)")
+    print(f"CPU while idle for {idle_seconds:.0f}s: {idle_cpu * 1000:.0f} ms")
+    print(f"booking to all subscribers: {fan_out * 1000:.0f} ms")
+    assert leaked == 0, f"{leaked} subscriptions left open after every client disconnected"
+    print("✅ Every subscription closed after its client disconnected")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the live availability stream with idle subscribers")
+    parser.add_argument("--subscribers", type=int, default=10000, help="Concurrent stream connections")
+    parser.add_argument("--idle-seconds", type=float, default=5, help="How long the streams stay idle")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.subscribers, args.idle_seconds, args.database_url))
@@ -0,0 +1,85 @@
+"""
+Batch loading benchmark
+Fires waves of concurrent get_by_id calls for the same event (a hot event
+page during an on-sale) through the plain repository and the batching one
+(DB_BATCH_LOADING_REPOSITORIES) against the configured database and reports
+time and queries per wave for each
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from tortoise import Tortoise
+from src.infrastructure.database.connection import init_db
+from src.infrastructure.database.models import EventModel
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+
+class QueryCounter(logging.Handler):
+    """Counts the statements Tortoise logs for every database client"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.queries = 0
+
+    def emit(self, record: logging.LogRecord):
+        self.queries += 1
+
+
+async def wave(repository: EventRepositoryImpl, event_id: int, concurrency: int) -> list:
+    """``concurrency`` simultaneous lookups of one event"""
+    return await asyncio.gather(*(repository.get_by_id(event_id) for _ in range(concurrency)))
+
+
+async def measure(repository: EventRepositoryImpl, event_id: int, concurrency: int, waves: int, counter: QueryCounter) -> tuple:
+    """Milliseconds and queries per wave"""
+    counter.queries = 0
+    started = time.perf_counter()
+    for _ in range(waves):
+        await wave(repository, event_id, concurrency)
+    elapsed = time.perf_counter() - started
+    return elapsed * 1000 / waves, counter.queries / waves
+
+
+async def benchmark(concurrency: int, waves: int):
+    """Print plain and batched time and queries per wave"""
+    await init_db()
+    counter = QueryCounter()
+    logger = logging.getLogger("tortoise.db_client")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    try:
+        event = await EventModel.first()
+        if event is None:
+            print("❌ The database has no events; run create_sample_data.py first")
+            return
+        paths = {
+            "plain": EventRepositoryImpl(),
+            "batched": EventRepositoryImpl(batch_loading=True),
+        }
+
+        # Same events from both paths, and warm statement caches before timing
+        expected = await wave(paths["plain"], event.id, concurrency)
+        assert await wave(paths["batched"], event.id, concurrency) == expected, "paths disagree"
+
+        print(f"{concurrency} concurrent get_by_id calls for event {event.id}, {waves} waves per path")
+        print(f"{'path':<10} {'ms/wave':>9} {'queries/wave':>13}")
+        for name, repository in paths.items():
+            milliseconds, queries = await measure(repository, event.id, concurrency, waves, counter)
+            print(f"{name:<10} {milliseconds:>9.1f} {queries:>13.1f}")
+
+        loader = paths["batched"]._loader
+        print(f"batched: {loader.loads:,} loads, {loader.coalesced:,} coalesced, {loader.batches:,} batches")
+    finally:
+        logger.removeHandler(counter)
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent event lookups: one query each against batched")
+    parser.add_argument("--concurrency", type=int, default=1000, help="Simultaneous lookups per wave")
+    parser.add_argument("--waves", type=int, default=20, help="Waves per path")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.concurrency, args.waves))
@@ -0,0 +1,84 @@
+"""
+Booking aggregation benchmark
+Seeds events with 100 to 1,000,000 confirmed bookings in a scratch database
+and sums each event's booked quantity two ways: loading every confirmed
+booking as an entity and summing in Python (what get_total_booked_quantity_for_event
+did before BookingRepository.aggregate) and the SQL aggregate. Reports the
+Python memory peak (tracemalloc) and median latency of each; the aggregate's
+memory must not grow with the number of bookings. The loading path is skipped
+above --load-limit bookings
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from benchmark_support import SCRATCH_DATABASE_URL, scratch_database, seed_bookings, seed_event, seed_users
+from src.domain.entities.booking import BookingStatus
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+
+bookings = BookingRepositoryImpl()
+
+
+async def loading(event_id: int) -> int:
+    """Every confirmed booking loaded and summed in Python"""
+    return sum(booking.quantity for booking in await bookings.get_confirmed_bookings_for_event(event_id))
+
+
+async def aggregating(event_id: int) -> int:
+    """SUM(quantity) computed by the database"""
+    return (await bookings.aggregate(event_id=event_id, status=BookingStatus.CONFIRMED))[0].total_quantity
+
+
+async def measure(total, event_id: int, repeat: int) -> tuple:
+    """Result, Python memory peak in KiB and median milliseconds of ``total``"""
+    tracemalloc.start()
+    result = await total(event_id)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await total(event_id)
+        samples.append(time.perf_counter() - started)
+    return result, peak / 1024, statistics.median(samples) * 1000
+
+
+async def benchmark(sizes: list, load_limit: int, repeat: int, database_url: str):
+    """Print memory and latency per path for each booking count"""
+    async with scratch_database(database_url):
+        user_ids = await seed_users(100)
+        print(f"{'bookings':>10} {'load KiB':>10} {'load ms':>9} {'aggregate KiB':>14} {'aggregate ms':>13}")
+        aggregate_peaks = []
+        for size in sizes:
+            event = await seed_event(capacity=size)
+            await seed_bookings(event, user_ids, size)
+
+            total, peak, milliseconds = await measure(aggregating, event.id, repeat)
+            assert total == size, f"aggregate counted {total} tickets of {size}"
+            aggregate_peaks.append(peak)
+            loaded = "skipped".rjust(10) + " " * 10
+            if size <= load_limit:
+                total, load_peak, load_ms = await measure(loading, event.id, repeat)
+                assert total == size, f"loading counted {total} tickets of {size}"
+                loaded = f"{load_peak:>10,.0f} {load_ms:>9.1f}"
+            print(f"{size:>10,} {loaded} {peak:>14,.1f} {milliseconds:>13.2f}")
+
+        # Allow for allocator noise, not for growth with the bookings
+        assert max(aggregate_peaks) <= min(aggregate_peaks) * 2 + 64, "aggregate memory grows with bookings"
+        print(f"✅ Aggregate memory peak between {min(aggregate_peaks):.1f} and {max(aggregate_peaks):.1f} KiB at every size")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark booking sums: loading rows against SQL aggregates")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000, 1000000], help="Bookings per event"
+    )
+    parser.add_argument("--load-limit", type=int, default=100000, help="Largest event to sum by loading its bookings")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path and size")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.sizes, args.load_limit, args.repeat, args.database_url))
@@ -0,0 +1,74 @@
+"""
+Booking details benchmark
+Seeds one event with a growing number of bookings (two tickets each) in a
+scratch database and loads the event's bookings with their users, event and
+tickets two ways: a query per related row of each booking (what the booking
+listings did before get_details_by_*) and get_details_by_event_id, which joins
+users and events and prefetches tickets. Reports queries and time for each;
+the details path must cost the same number of queries at every size
+"""
+
+import argparse
+import asyncio
+import time
+from benchmark_support import SCRATCH_DATABASE_URL, counting_queries, scratch_database, seed_bookings, seed_event, seed_users
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.repositories.ticket_repository_impl import TicketRepositoryImpl
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+bookings = BookingRepositoryImpl()
+users = UserRepositoryImpl()
+events = EventRepositoryImpl()
+tickets = TicketRepositoryImpl()
+
+
+async def per_booking(event_id: int) -> int:
+    """Related rows fetched one booking at a time; returns the ticket count"""
+    ticket_count = 0
+    for booking in await bookings.get_by_event_id(event_id):
+        await users.get_by_id(booking.user_id)
+        await events.get_by_id(booking.event_id)
+        ticket_count += len(await tickets.get_by_booking_id(booking.id))
+    return ticket_count
+
+
+async def joined(event_id: int) -> int:
+    """Related rows joined and prefetched; returns the ticket count"""
+    return sum(len(details.tickets) for details in await bookings.get_details_by_event_id(event_id))
+
+
+async def measure(load, event_id: int) -> tuple:
+    """Queries, milliseconds and tickets of one load"""
+    with counting_queries() as counter:
+        started = time.perf_counter()
+        ticket_count = await load(event_id)
+        elapsed = time.perf_counter() - started
+    return counter.queries, elapsed * 1000, ticket_count
+
+
+async def benchmark(sizes: list, database_url: str):
+    """Print queries and time per path for each booking count"""
+    async with scratch_database(database_url):
+        user_ids = await seed_users(100)
+        print(f"{'bookings':>9} {'per-booking queries':>20} {'ms':>9} {'details queries':>16} {'ms':>9}")
+        details_queries = set()
+        for size in sizes:
+            event = await seed_event(capacity=size * 2)
+            await seed_bookings(event, user_ids, size, tickets_per_booking=2)
+            old_queries, old_ms, old_tickets = await measure(per_booking, event.id)
+            new_queries, new_ms, new_tickets = await measure(joined, event.id)
+            assert old_tickets == new_tickets == size * 2, "paths disagree"
+            details_queries.add(new_queries)
+            print(f"{size:>9,} {old_queries:>20,} {old_ms:>9.1f} {new_queries:>16,} {new_ms:>9.1f}")
+        assert len(details_queries) == 1, f"details query count grows with bookings: {sorted(details_queries)}"
+        print(f"✅ get_details_by_event_id: {details_queries.pop()} queries at every size")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark loading booking details: per-booking queries against joined")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 2000], help="Bookings per event")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.sizes, args.database_url))
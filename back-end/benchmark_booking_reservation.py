@@ -0,0 +1,67 @@
+"""
+Booking reservation benchmark
+Fires concurrent POST /api/v1/bookings requests at one event through the
+application (in process, no server needed) against a scratch database and
+checks that seats are never oversold and that no request fails with a server
+error: every request either books or is turned away with a 400. Reports
+bookings per second
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+import httpx
+from tortoise.functions import Sum
+from benchmark_support import SCRATCH_DATABASE_URL, scratch_database, seed_event, seed_users
+from src.infrastructure.database.models import BookingModel, TicketModel
+from src.main import app
+
+
+async def benchmark(requests: int, capacity: int, quantity: int, database_url: str):
+    """Print accepted and rejected bookings, seats sold and throughput"""
+    async with scratch_database(database_url):
+        event = await seed_event(capacity)
+        user_ids = await seed_users(requests)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+            async def book(user_id: int) -> int:
+                response = await client.post(
+                    "/api/v1/bookings",
+                    json={"user_id": user_id, "event_id": event.id, "quantity": quantity}
+                )
+                return response.status_code
+
+            started = time.perf_counter()
+            statuses = Counter(await asyncio.gather(*(book(user_id) for user_id in user_ids)))
+            elapsed = time.perf_counter() - started
+
+        booked = (await BookingModel.filter(event_id=event.id).annotate(sold=Sum("quantity")).values("sold"))[0]["sold"] or 0
+        tickets = await TicketModel.filter(booking__event_id=event.id).count()
+
+    accepted = statuses[201]
+    print(f"{requests} concurrent bookings of {quantity} ticket(s) for {capacity} seats in {elapsed:.2f}s")
+    print(f"status codes: {dict(sorted(statuses.items()))}")
+    print(f"seats sold: {booked} (tickets: {tickets}); capacity: {capacity}")
+    print(f"throughput: {requests / elapsed:,.0f} requests/s, {accepted / elapsed:,.0f} bookings/s")
+
+    server_errors = sum(count for code, count in statuses.items() if code >= 500)
+    assert server_errors == 0, f"{server_errors} requests failed with a server error"
+    assert set(statuses) <= {201, 400}, f"unexpected status codes: {dict(statuses)}"
+    assert booked <= capacity, f"oversold: {booked} seats sold for {capacity}"
+    assert booked == tickets == accepted * quantity, "bookings and tickets disagree"
+    assert accepted == min(requests, capacity // quantity), "seats left unsold while requests were turned away"
+    print("✅ No oversell and no server errors")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent bookings of one event")
+    parser.add_argument("--requests", type=int, default=500, help="Concurrent booking requests")
+    parser.add_argument("--capacity", type=int, default=300, help="Seats of the event")
+    parser.add_argument("--quantity", type=int, default=2, help="Tickets per booking")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.requests, args.capacity, args.quantity, args.database_url))
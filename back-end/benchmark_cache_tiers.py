@@ -0,0 +1,87 @@
+"""
+Event cache tier benchmark
+Looks one event up repeatedly through the database and through the cached
+event repository on each cache tier (EVENT_CACHE_BACKEND): in-process memory,
+the shared memory file and, given --redis-url, Redis. Reports the latency of a
+raw cache hit and of a repository hit (cache hit plus version stamp lookup)
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from tortoise import Tortoise
+from src.infrastructure.cache import InMemoryLRUCache, RedisCache, SharedMemoryCache
+from src.infrastructure.database.connection import init_db
+from src.infrastructure.database.models import EventModel
+from src.infrastructure.repositories.cached_event_repository import CachedEventRepository
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+
+async def latencies(call, repeat: int) -> tuple:
+    """Median and 99th percentile latency of ``call`` in microseconds"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        await call()
+        samples.append(time.perf_counter_ns() - started)
+    samples.sort()
+    return statistics.median(samples) / 1000, samples[int(len(samples) * 0.99)] / 1000
+
+
+def tiers(redis_url: str, shm_path: str) -> dict:
+    """The caches to compare, keyed by name"""
+    caches = {
+        "memory": InMemoryLRUCache(ttl_seconds=300),
+        "shared_memory": SharedMemoryCache(shm_path, ttl_seconds=300),
+    }
+    if redis_url:
+        caches["redis"] = RedisCache.from_url(redis_url, ttl_seconds=300, prefix="benchmark:")
+    return caches
+
+
+async def benchmark(repeat: int, redis_url: str):
+    """Print hit latencies per tier against the database lookup"""
+    await init_db()
+    shm_path = os.path.join(tempfile.mkdtemp(), "event-cache")
+    caches = tiers(redis_url, shm_path)
+    try:
+        event_model = await EventModel.first()
+        if event_model is None:
+            print("❌ The database has no events; run create_sample_data.py first")
+            return
+        event_id = event_model.id
+        database = EventRepositoryImpl()
+        event = await database.get_by_id(event_id)
+
+        print(f"Event {event_id}, {repeat} lookups per path")
+        print(f"{'path':<26} {'p50 µs':>9} {'p99 µs':>9}")
+        median, p99 = await latencies(lambda: database.get_by_id(event_id), repeat)
+        print(f"{'database get_by_id':<26} {median:>9.1f} {p99:>9.1f}")
+        for name, cache in caches.items():
+            await cache.set("event", event)
+            assert await cache.get("event") == event, f"{name}: cache returned another event"
+            median, p99 = await latencies(lambda: cache.get("event"), repeat)
+            print(f"{name + ' get':<26} {median:>9.1f} {p99:>9.1f}")
+
+            repository = CachedEventRepository(database, cache)
+            # Fill the cache; every later lookup is a hit
+            assert await repository.get_by_id(event_id) == event, f"{name}: repository returned another event"
+            median, p99 = await latencies(lambda: repository.get_by_id(event_id), repeat)
+            print(f"{name + ' get_by_id':<26} {median:>9.1f} {p99:>9.1f}")
+    finally:
+        for cache in caches.values():
+            await cache.close()
+        os.remove(shm_path)
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark event cache hit latency per tier")
+    parser.add_argument("--repeat", type=int, default=20000, help="Lookups per path")
+    parser.add_argument("--redis-url", default="", help="Also measure Redis, e.g. redis://localhost:6379/0")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.repeat, args.redis_url))
@@ -0,0 +1,88 @@
+"""
+Connection pool benchmark
+Runs the same concurrent query load against several asyncpg pool sizes and
+reports throughput and connection wait times, to help choose DB_POOL_MAX_SIZE
+"""
+
+import argparse
+import asyncio
+import time
+from tortoise import Tortoise, connections
+from src.infrastructure.database.connection import DATABASE_URL, build_connection_config
+from src.infrastructure.database.pool import TortoisePoolMonitor
+
+# Representative read: what an availability lookup costs the database
+DEFAULT_QUERY = 'SELECT "id", "capacity", "total_tickets_sold" FROM "events" ORDER BY "id" LIMIT 20'
+
+
+async def run_load(pool_size: int, concurrency: int, requests: int, query: str) -> dict:
+    """Run ``requests`` queries from ``concurrency`` workers on a pool of ``pool_size``"""
+    connection_config = build_connection_config(DATABASE_URL)
+    connection_config["credentials"].update(minsize=pool_size, maxsize=pool_size)
+    await Tortoise.init(config={
+        "connections": {"default": connection_config},
+        "apps": {"models": {"models": ["src.infrastructure.database.models"], "default_connection": "default"}},
+    })
+    try:
+        connection = connections.get("default")
+        # Open every connection before timing so pool growth is not measured
+        await asyncio.gather(*(connection.execute_query("SELECT 1") for _ in range(pool_size)))
+
+        remaining = requests
+        latencies = []
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                await connection.execute_query(query)
+                latencies.append(time.perf_counter() - started)
+
+        monitor = TortoisePoolMonitor()
+        before = monitor.stats()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        after = monitor.stats()
+    finally:
+        await Tortoise.close_connections()
+
+    latencies.sort()
+    acquisitions = after.acquisitions - before.acquisitions
+    return {
+        "pool_size": pool_size,
+        "throughput": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "avg_wait_ms": (after.total_wait_ms - before.total_wait_ms) / acquisitions if acquisitions else 0.0,
+        "max_wait_ms": after.max_wait_ms,
+    }
+
+
+async def benchmark(pool_sizes: list, concurrency: int, requests: int, query: str):
+    """Print one result line per pool size"""
+    if build_connection_config(DATABASE_URL)["engine"] != "src.infrastructure.database.asyncpg_pooled":
+        print("❌ The pool benchmark needs a PostgreSQL DATABASE_URL")
+        return
+
+    print(f"{concurrency} concurrent workers, {requests} queries per pool size")
+    print(f"{'pool':>5} {'queries/s':>11} {'p50 ms':>8} {'p99 ms':>8} {'avg wait ms':>12} {'max wait ms':>12}")
+    for pool_size in pool_sizes:
+        result = await run_load(pool_size, concurrency, requests, query)
+        print(
+            f"{result['pool_size']:>5} {result['throughput']:>11,.0f} {result['p50_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['avg_wait_ms']:>12.3f} {result['max_wait_ms']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark query throughput against connection pool size")
+    parser.add_argument("--pool-sizes", default="2,5,10,20,40", help="Comma separated pool sizes to try")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent workers")
+    parser.add_argument("--requests", type=int, default=20000, help="Queries per pool size")
+    parser.add_argument("--query", default=DEFAULT_QUERY, help="SQL to run")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.pool_sizes.split(",")]
+    asyncio.run(benchmark(sizes, args.concurrency, args.requests, args.query))
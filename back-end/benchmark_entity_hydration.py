@@ -0,0 +1,79 @@
+"""
+Entity hydration benchmark
+Builds Ticket entities from one million in-memory rows the way repositories
+used to (a plain dataclass validated in __post_init__), through the validating
+constructor of the slotted entity, and through its trusted from_row
+constructor, and reports time and memory for each
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+from src.domain.entities.ticket import Ticket, TicketStatus
+
+
+@dataclass
+class DictTicket:
+    """The ticket entity as it was before slots, for comparison"""
+    id: Optional[int]
+    booking_id: int
+    ticket_code: str
+    status: TicketStatus
+
+    def __post_init__(self):
+        if self.booking_id <= 0:
+            raise ValueError("Booking ID must be positive")
+
+        if not self.ticket_code or len(self.ticket_code.strip()) == 0:
+            raise ValueError("Ticket code cannot be empty")
+
+        if len(self.ticket_code) < 8:
+            raise ValueError("Ticket code must be at least 8 characters")
+
+
+def hydrate(build, rows: list) -> tuple:
+    """Seconds and bytes allocated to build one entity per row"""
+    # Timed and measured in separate runs: tracing allocations slows every call
+    gc.collect()
+    started = time.perf_counter()
+    entities = [build(*row) for row in rows]
+    elapsed = time.perf_counter() - started
+    del entities
+
+    gc.collect()
+    tracemalloc.start()
+    entities = [build(*row) for row in rows]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return elapsed, allocated
+
+
+def benchmark(count: int):
+    """Print time and memory per hydration path"""
+    rows = [
+        (index, index // 2 + 1, f"TKT-20300101-{index:08d}", TicketStatus.ACTIVE)
+        for index in range(1, count + 1)
+    ]
+    paths = {
+        "dataclass + validation": DictTicket,
+        "slots + validation": Ticket,
+        "slots + from_row": Ticket.from_row,
+    }
+
+    print(f"Hydrating {count:,} tickets")
+    print(f"{'path':<24} {'seconds':>8} {'MiB':>8} {'bytes/row':>10}")
+    for name, build in paths.items():
+        elapsed, allocated = hydrate(build, rows)
+        print(f"{name:<24} {elapsed:>8.2f} {allocated / 2 ** 20:>8.1f} {allocated / count:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark building ticket entities from rows")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Tickets to hydrate")
+    args = parser.parse_args()
+
+    benchmark(args.count)
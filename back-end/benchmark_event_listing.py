@@ -0,0 +1,75 @@
+"""
+Event listing benchmark
+Seeds a scratch database with 100,000 events and requests GET /api/v1/events
+through the application (in process): the whole unpaged catalog, the first
+page, a filtered page, a page with its total, and every page of the catalog
+one after the other by cursor. Keyset pages must cost the same at any depth
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+from benchmark_support import SCRATCH_DATABASE_URL, counting_queries, scratch_database, seed_events
+from src.main import app
+
+
+async def timed_get(client: httpx.AsyncClient, params: dict) -> tuple:
+    """Response body, milliseconds and queries of one listing request"""
+    with counting_queries() as counter:
+        started = time.perf_counter()
+        response = await client.get("/api/v1/events", params=params)
+        elapsed = time.perf_counter() - started
+    assert response.status_code == 200, response.text
+    return response.json(), elapsed * 1000, counter.queries, len(response.content)
+
+
+async def benchmark(events: int, page_size: int, database_url: str):
+    """Print time, queries and payload per listing mode, then page latency by depth"""
+    async with scratch_database(database_url):
+        await seed_events(events)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            print(f"{events:,} events, pages of {page_size}")
+            print(f"{'request':<28} {'ms':>9} {'queries':>8} {'KiB':>9} {'events':>8}")
+            modes = {
+                "unpaged (whole catalog)": {},
+                "first page": {"limit": page_size},
+                "first page with total": {"limit": page_size, "include_total": "true"},
+                "active at one venue": {"limit": page_size, "status": "active", "venue": "Venue 7"},
+            }
+            for name, params in modes.items():
+                body, milliseconds, queries, size = await timed_get(client, params)
+                print(f"{name:<28} {milliseconds:>9.1f} {queries:>8} {size / 1024:>9,.1f} {len(body['data']):>8,}")
+
+            latencies = []
+            seen = 0
+            params = {"limit": page_size}
+            while True:
+                body, milliseconds, queries, _ = await timed_get(client, params)
+                assert queries == 1, f"page {len(latencies) + 1} took {queries} queries"
+                latencies.append(milliseconds)
+                seen += len(body["data"])
+                cursor = body["pagination"]["next_cursor"]
+                if cursor is None:
+                    break
+                params = {"limit": page_size, "cursor": cursor}
+
+    assert seen == events, f"walked {seen} of {events} events"
+    tenth = max(1, len(latencies) // 10)
+    print(f"walked all {len(latencies):,} pages by cursor, one query each")
+    print(f"page ms: first tenth median {statistics.median(latencies[:tenth]):.1f}, "
+          f"last tenth median {statistics.median(latencies[-tenth:]):.1f}, "
+          f"p99 {sorted(latencies)[int(len(latencies) * 0.99)]:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the event listing: unpaged against keyset pages")
+    parser.add_argument("--events", type=int, default=100000, help="Events to seed")
+    parser.add_argument("--page-size", type=int, default=50, help="Events per page (1-200)")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.events, args.page_size, args.database_url))
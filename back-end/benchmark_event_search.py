@@ -0,0 +1,98 @@
+"""
+Event search benchmark
+Seeds a scratch database with generated events (10,000 and 100,000 by default;
+pass --sizes 1000000 for a million) and times EventRepository.search for exact,
+prefix, misspelled and multi-word queries. SQLite measures the in-process
+index; on PostgreSQL the scratch database gets migration 006 first, so the
+tsvector and trigram indexes are measured
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from tortoise import Tortoise
+from benchmark_support import SCRATCH_DATABASE_URL, SEED_BATCH_SIZE, scratch_database
+from src.infrastructure.database.models import EventModel
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+SEARCH_MIGRATION = Path(__file__).parent / "migrations" / "006_event_search.sql"
+ADJECTIVES = ["Summer", "Midnight", "Electric", "Acoustic", "Grand", "Underground", "Royal", "Golden", "Wild", "Silent"]
+GENRES = ["Jazz", "Rock", "Symphony", "Comedy", "Opera", "Techno", "Folk", "Ballet", "Blues", "Hip Hop"]
+KINDS = ["Night", "Festival", "Gala", "Session", "Showcase", "Tour", "Marathon", "Revue", "Live", "Weekend"]
+CITIES = ["Berlin", "Lisbon", "Chicago", "Osaka", "Nairobi", "Toronto", "Madrid", "Seoul", "Dublin", "Austin"]
+PLACES = ["Arena", "Hall", "Theatre", "Park", "Club", "Stadium", "Warehouse", "Pavilion"]
+QUERIES = {
+    "exact word": "symphony",
+    "prefix": "sympho",
+    "misspelled": "symphonie",
+    "two words": "jazz lisbon",
+    "misspelled pair": "tecno festval",
+    "no match": "zzyzx",
+}
+
+
+async def seed_catalog(count: int, start: int, rng: random.Random):
+    """Insert generated events ``start`` to ``start + count``"""
+    first_date = datetime.now(timezone.utc) + timedelta(days=1)
+    for batch_start in range(start, start + count, SEED_BATCH_SIZE):
+        events = []
+        for index in range(batch_start, min(batch_start + SEED_BATCH_SIZE, start + count)):
+            genre = rng.choice(GENRES)
+            city = rng.choice(CITIES)
+            events.append(EventModel(
+                title=f"{rng.choice(ADJECTIVES)} {genre} {rng.choice(KINDS)} {index}",
+                description=f"An evening of {genre.lower()} in {city} with guests from {rng.choice(CITIES)}",
+                venue=f"{city} {rng.choice(PLACES)}",
+                date_time=first_date + timedelta(minutes=index),
+                capacity=500,
+                price=Decimal("40.00")
+            ))
+        await EventModel.bulk_create(events)
+
+
+async def benchmark(sizes: list, repeat: int, limit: int, database_url: str):
+    """Print search latency per query for each catalog size"""
+    async with scratch_database(database_url):
+        connection = Tortoise.get_connection("default")
+        if connection.capabilities.dialect == "postgres":
+            await connection.execute_script(SEARCH_MIGRATION.read_text())
+
+        rng = random.Random(6)
+        seeded = 0
+        print(f"{'events':>10} {'query':<16} {'p50 ms':>8} {'p99 ms':>8} {'results':>8}")
+        for size in sorted(sizes):
+            await seed_catalog(size - seeded, seeded, rng)
+            seeded = size
+            # A new repository loads (or checks) its search index on the first query
+            repository = EventRepositoryImpl()
+            started = time.perf_counter()
+            await repository.search("warm up", limit)
+            print(f"{size:>10,} {'first search':<16} {(time.perf_counter() - started) * 1000:>8.1f}")
+
+            for name, query in QUERIES.items():
+                samples = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    results = await repository.search(query, limit)
+                    samples.append((time.perf_counter() - started) * 1000)
+                samples.sort()
+                print(
+                    f"{size:>10,} {name:<16} {statistics.median(samples):>8.1f}"
+                    f" {samples[int(len(samples) * 0.99)]:>8.1f} {len(results):>8}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ranked event search latency by catalog size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="Events in the catalog")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="Results per search")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.sizes, args.repeat, args.limit, args.database_url))
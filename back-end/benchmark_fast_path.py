@@ -0,0 +1,88 @@
+"""
+Repository fast path benchmark
+Runs the hottest repository lookups through the ORM path and the raw SQL fast
+path (DB_FAST_PATH_REPOSITORIES) against the configured database and reports
+lookups per second for each
+"""
+
+import argparse
+import asyncio
+import time
+from tortoise import Tortoise
+from src.domain.entities.booking import BookingStatus
+from src.infrastructure.database.connection import init_db
+from src.infrastructure.database.models import BookingModel, TicketModel
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.repositories.ticket_repository_impl import TicketRepositoryImpl
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def lookups(fast_path: bool, ticket_code: str, event_id: int, user_id: int) -> dict:
+    """The benchmarked calls, keyed by name, for one path"""
+    tickets = TicketRepositoryImpl(fast_path=fast_path)
+    events = EventRepositoryImpl(fast_path=fast_path)
+    users = UserRepositoryImpl(fast_path=fast_path)
+    bookings = BookingRepositoryImpl(fast_path=fast_path)
+    return {
+        "ticket by code": lambda: tickets.get_by_ticket_code(ticket_code),
+        "event by id": lambda: events.get_by_id(event_id),
+        "user by id": lambda: users.get_by_id(user_id),
+        "confirmed bookings": lambda: bookings.get_confirmed_bookings_for_event(event_id),
+    }
+
+
+def same_result(orm_result, fast_result) -> bool:
+    """Whether both paths returned the same entities (lists in any order)"""
+    if isinstance(orm_result, list):
+        return sorted(orm_result, key=lambda entity: entity.id) == sorted(fast_result, key=lambda entity: entity.id)
+    return orm_result == fast_result
+
+
+async def measure(call, concurrency: int, requests: int) -> float:
+    """Lookups per second for ``requests`` calls from ``concurrency`` workers"""
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def benchmark(concurrency: int, requests: int):
+    """Print ORM and fast path throughput for each lookup"""
+    await init_db()
+    try:
+        ticket = await TicketModel.first().select_related("booking")
+        if ticket is None:
+            print("❌ The database has no tickets; run create_sample_data.py first")
+            return
+        booking = ticket.booking
+        orm = lookups(False, ticket.ticket_code, booking.event_id, booking.user_id)
+        fast = lookups(True, ticket.ticket_code, booking.event_id, booking.user_id)
+
+        confirmed = await BookingModel.filter(event_id=booking.event_id, status=BookingStatus.CONFIRMED).count()
+        print(f"{concurrency} concurrent workers, {requests} lookups per path ({confirmed} confirmed bookings)")
+        print(f"{'lookup':<20} {'ORM /s':>10} {'fast /s':>10} {'speedup':>8}")
+        for name in orm:
+            # Same result from both paths, and warm statement caches before timing
+            assert same_result(await orm[name](), await fast[name]()), f"{name}: paths disagree"
+            orm_rate = await measure(orm[name], concurrency, requests)
+            fast_rate = await measure(fast[name], concurrency, requests)
+            print(f"{name:<20} {orm_rate:>10,.0f} {fast_rate:>10,.0f} {fast_rate / orm_rate:>7.2f}x")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark repository lookups: ORM path against raw SQL fast path")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent workers")
+    parser.add_argument("--requests", type=int, default=20000, help="Lookups per path and query")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.concurrency, args.requests))
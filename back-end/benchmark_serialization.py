@@ -0,0 +1,123 @@
+"""
+Response serialization benchmark
+Encodes the events list and the event booking details with many rows through
+the dict path (schemas dumped to dicts, validated against the response model
+and encoded by FastAPI) and the fast path (FAST_JSON_RESPONSES) and reports
+the time per response for each
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from src.domain.entities.booking import BookingStatus
+from src.domain.entities.event import EventStatus
+from src.domain.entities.ticket import TicketStatus
+from src.domain.entities.user import UserRole
+from src.presentation.schemas.api_response_schemas import ApiPageResponse, BookingPageApiResponse, EventPageApiResponse
+from src.presentation.schemas.booking_schemas import BookingWithDetailsSchema
+from src.presentation.schemas.event_schemas import EventResponseSchema
+from src.presentation.schemas.ticket_schemas import TicketResponseSchema
+from src.presentation.schemas.user_schemas import UserResponseSchema
+from src.presentation.utils.response_utils import FastJSONResponse, prepare_response_data
+
+
+def make_events(rows: int) -> list:
+    """Event schemas as the events list endpoint returns them"""
+    starts = datetime(2030, 1, 1, 20, tzinfo=timezone.utc)
+    return [
+        EventResponseSchema(
+            id=index,
+            title=f"Concert {index}",
+            description="An evening of live music with support acts",
+            venue="Main Hall",
+            date_time=starts + timedelta(days=index),
+            capacity=500,
+            price=Decimal("49.90"),
+            status=EventStatus.ACTIVE,
+            created_at=datetime.now(timezone.utc)
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def make_bookings(rows: int) -> list:
+    """Booking detail schemas (user, event, two tickets) as the event bookings endpoint returns them"""
+    event = make_events(1)[0]
+    return [
+        BookingWithDetailsSchema(
+            id=index,
+            user_id=index,
+            event_id=event.id,
+            quantity=2,
+            total_amount=Decimal("99.80"),
+            booking_date=datetime.now(timezone.utc),
+            status=BookingStatus.CONFIRMED,
+            user=UserResponseSchema(id=index, name=f"User {index}", phone="0812345678", role=UserRole.CUSTOMER),
+            event=event,
+            tickets=[
+                TicketResponseSchema(
+                    id=index * 2 + offset,
+                    booking_id=index,
+                    ticket_code=f"TKT-20300101-{index:06d}{offset}",
+                    status=TicketStatus.ACTIVE
+                )
+                for offset in range(2)
+            ]
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+async def dict_path(schemas: list, response_model) -> bytes:
+    """What the endpoints did before: dicts, response model validation, FastAPI encoding"""
+    field = create_response_field(name="Response", type_=response_model, mode="serialization")
+    response = ApiPageResponse.success_response(data=prepare_response_data(schemas), message="Retrieved successfully")
+    content = await serialize_response(field=field, response_content=response)
+    return JSONResponse(content).body
+
+
+async def fast_path(schemas: list, response_model) -> bytes:
+    """The envelope with the schemas encoded straight to bytes"""
+    response = ApiPageResponse.success_response(data=schemas, message="Retrieved successfully")
+    return FastJSONResponse(response).body
+
+
+async def timed(path, schemas: list, response_model, repeat: int) -> float:
+    """Best time in milliseconds over ``repeat`` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await path(schemas, response_model)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def benchmark(rows: int, repeat: int):
+    """Print dict path and fast path times for each endpoint"""
+    cases = {
+        "events list": (make_events(rows), EventPageApiResponse),
+        "booking details": (make_bookings(rows), BookingPageApiResponse),
+    }
+
+    print(f"{rows} rows per response, best of {repeat}")
+    print(f"{'response':<18} {'dict ms':>9} {'fast ms':>9} {'speedup':>8} {'bytes':>11}")
+    for name, (schemas, response_model) in cases.items():
+        body = await fast_path(schemas, response_model)
+        assert body == await dict_path(schemas, response_model), f"{name}: paths disagree"
+        dict_ms = await timed(dict_path, schemas, response_model, repeat)
+        fast_ms = await timed(fast_path, schemas, response_model, repeat)
+        print(f"{name:<18} {dict_ms:>9.1f} {fast_ms:>9.1f} {dict_ms / fast_ms:>7.1f}x {len(body):>11,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark response serialization: dict path against fast path")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path; the best is reported")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.rows, args.repeat))
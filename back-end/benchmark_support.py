@@ -0,0 +1,164 @@
+"""
+Helpers shared by the benchmark scripts
+Volume benchmarks seed their own rows, so they run against a scratch database
+whose tables are created from the models: an in-memory SQLite database unless
+--database-url names another (use an empty database, never a live one)
+"""
+
+import logging
+import os
+import resource
+import sys
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import AsyncIterator, Iterator, List
+from tortoise import Tortoise
+from src.domain.entities.booking import BookingStatus
+from src.domain.entities.event import EventStatus
+from src.infrastructure.database.connection import build_connection_config
+from src.infrastructure.database.models import BookingModel, EventModel, TicketModel, UserModel
+
+SCRATCH_DATABASE_URL = "sqlite://:memory:"
+# Rows per INSERT when seeding
+SEED_BATCH_SIZE = 1000
+# Indexes of migration 001 that the models do not declare
+SCRATCH_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_events_venue ON events(venue)",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_user_id ON bookings(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_event_id ON bookings(event_id)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_booking_id ON tickets(booking_id)",
+]
+
+
+class QueryCounter(logging.Handler):
+    """Counts the statements Tortoise logs for every database client"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.queries = 0
+
+    def emit(self, record: logging.LogRecord):
+        self.queries += 1
+
+
+def rss_mib() -> float:
+    """Resident memory of this process in MiB (the peak where /proc is missing)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Bytes on macOS, KiB elsewhere
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def counting_queries() -> Iterator[QueryCounter]:
+    """Count the statements sent while the block runs"""
+    counter = QueryCounter()
+    logger = logging.getLogger("tortoise.db_client")
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    try:
+        yield counter
+    finally:
+        logger.removeHandler(counter)
+        logger.setLevel(level)
+
+
+@asynccontextmanager
+async def scratch_database(database_url: str = SCRATCH_DATABASE_URL) -> AsyncIterator[None]:
+    """Connect to ``database_url`` and create any missing tables and indexes"""
+    await Tortoise.init(config={
+        "connections": {"default": build_connection_config(database_url)},
+        "apps": {"models": {"models": ["src.infrastructure.database.models"], "default_connection": "default"}},
+    })
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        connection = Tortoise.get_connection("default")
+        for statement in SCRATCH_INDEXES:
+            await connection.execute_script(statement)
+        yield
+    finally:
+        await Tortoise.close_connections()
+
+
+async def seed_users(count: int) -> List[int]:
+    """Insert ``count`` customers and return their IDs"""
+    prefix = uuid.uuid4().hex[:8]
+    await UserModel.bulk_create(
+        [UserModel(name=f"Benchmark user {index}", phone=f"{prefix}{index}") for index in range(count)],
+        batch_size=SEED_BATCH_SIZE
+    )
+    return await UserModel.filter(phone__startswith=prefix).order_by("id").values_list("id", flat=True)
+
+
+async def seed_event(capacity: int, price: Decimal = Decimal("25.00"), title: str = "Benchmark event") -> EventModel:
+    """Insert an active event a month from now"""
+    return await EventModel.create(
+        title=title,
+        description="Seeded by a benchmark",
+        venue="Benchmark Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=capacity,
+        price=price
+    )
+
+
+async def seed_events(count: int, venues: int = 20) -> None:
+    """Insert ``count`` events an hour apart over ``venues`` venues; every tenth is cancelled"""
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    for batch_start in range(0, count, SEED_BATCH_SIZE):
+        await EventModel.bulk_create([
+            EventModel(
+                title=f"Benchmark event {index}",
+                description="Seeded by a benchmark",
+                venue=f"Venue {index % venues}",
+                date_time=start + timedelta(hours=index),
+                capacity=100 + index % 900,
+                price=Decimal("25.00"),
+                status=EventStatus.CANCELLED if index % 10 == 9 else EventStatus.ACTIVE
+            )
+            for index in range(batch_start, min(batch_start + SEED_BATCH_SIZE, count))
+        ])
+
+
+async def seed_bookings(event: EventModel, user_ids: List[int], count: int, tickets_per_booking: int = 0) -> None:
+    """Insert ``count`` confirmed bookings of ``event`` spread over ``user_ids``,
+    each with ``tickets_per_booking`` active tickets
+
+    Rows are inserted directly: the event's booking counters are not updated.
+    """
+    quantity = max(tickets_per_booking, 1)
+    last_booking = await BookingModel.filter(event_id=event.id).order_by("-id").first()
+    last_id = last_booking.id if last_booking else 0
+    for start in range(0, count, SEED_BATCH_SIZE):
+        await BookingModel.bulk_create(
+            [
+                BookingModel(
+                    user_id=user_ids[index % len(user_ids)],
+                    event_id=event.id,
+                    quantity=quantity,
+                    total_amount=event.price * quantity,
+                    status=BookingStatus.CONFIRMED
+                )
+                for index in range(start, min(start + SEED_BATCH_SIZE, count))
+            ]
+        )
+    if not tickets_per_booking:
+        return
+
+    booking_ids = await BookingModel.filter(event_id=event.id, id__gt=last_id).values_list("id", flat=True)
+    prefix = uuid.uuid4().hex[:8].upper()
+    tickets = []
+    for booking_id in booking_ids:
+        for index in range(tickets_per_booking):
+            tickets.append(TicketModel(booking_id=booking_id, ticket_code=f"BM-{prefix}-{booking_id}-{index}"))
+            if len(tickets) == SEED_BATCH_SIZE:
+                await TicketModel.bulk_create(tickets)
+                tickets = []
+    if tickets:
+        await TicketModel.bulk_create(tickets)
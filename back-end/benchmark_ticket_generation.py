@@ -0,0 +1,81 @@
+"""
+Ticket generation benchmark
+Generates the tickets of bookings of 1, 10, 100 and 1000 tickets in a scratch
+database two ways, each inside a transaction like create_booking: one ticket
+at a time (an existence check and an INSERT per code, as bookings did before
+create_many) and TicketService.generate_tickets_for_booking, which inserts
+them in bulk. Reports queries and time per booking for each
+"""
+
+import argparse
+import asyncio
+import time
+from tortoise.transactions import in_transaction
+from benchmark_support import SCRATCH_DATABASE_URL, counting_queries, scratch_database, seed_bookings, seed_event, seed_users
+from src.domain.entities.ticket import Ticket, TicketStatus
+from src.domain.services.ticket_service import TicketService
+from src.infrastructure.database.models import BookingModel
+from src.infrastructure.repositories.ticket_repository_impl import TicketRepositoryImpl
+
+tickets = TicketRepositoryImpl()
+service = TicketService(tickets)
+
+
+async def per_ticket(booking_id: int, quantity: int) -> list:
+    """A uniqueness check and an INSERT per ticket"""
+    created = []
+    while len(created) < quantity:
+        ticket_code = service.generate_unique_ticket_code()
+        if await tickets.exists_by_ticket_code(ticket_code):
+            continue
+        created.append(await tickets.create(
+            Ticket(id=None, booking_id=booking_id, ticket_code=ticket_code, status=TicketStatus.ACTIVE)
+        ))
+    return created
+
+
+async def bulk(booking_id: int, quantity: int) -> list:
+    """Codes generated in memory and inserted together"""
+    return await service.generate_tickets_for_booking(booking_id, quantity)
+
+
+async def measure(generate, booking_ids: list, quantity: int) -> tuple:
+    """Queries and milliseconds per booking"""
+    with counting_queries() as counter:
+        started = time.perf_counter()
+        for booking_id in booking_ids:
+            async with in_transaction("default"):
+                assert len(await generate(booking_id, quantity)) == quantity, "tickets missing"
+        elapsed = time.perf_counter() - started
+    return counter.queries / len(booking_ids), elapsed * 1000 / len(booking_ids)
+
+
+async def benchmark(quantities: list, repeat: int, database_url: str):
+    """Print queries and time per booking for each path and ticket count"""
+    async with scratch_database(database_url):
+        event = await seed_event(capacity=sum(quantities) * repeat * 2)
+        user_ids = await seed_users(1)
+        await seed_bookings(event, user_ids, len(quantities) * repeat * 2)
+        booking_ids = await BookingModel.filter(event_id=event.id).order_by("id").values_list("id", flat=True)
+
+        print(f"{repeat} bookings per row")
+        print(f"{'tickets':>8} {'per-ticket queries':>19} {'ms':>9} {'bulk queries':>13} {'ms':>9} {'speedup':>8}")
+        for quantity in quantities:
+            per_ticket_ids, booking_ids = booking_ids[:repeat], booking_ids[repeat:]
+            bulk_ids, booking_ids = booking_ids[:repeat], booking_ids[repeat:]
+            old_queries, old_ms = await measure(per_ticket, per_ticket_ids, quantity)
+            new_queries, new_ms = await measure(bulk, bulk_ids, quantity)
+            print(
+                f"{quantity:>8,} {old_queries:>19,.0f} {old_ms:>9.1f} {new_queries:>13,.0f} {new_ms:>9.1f}"
+                f" {old_ms / new_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ticket generation: one INSERT per ticket against bulk")
+    parser.add_argument("--quantities", type=int, nargs="+", default=[1, 10, 100, 1000], help="Tickets per booking")
+    parser.add_argument("--repeat", type=int, default=5, help="Bookings per path and ticket count")
+    parser.add_argument("--database-url", default=SCRATCH_DATABASE_URL, help="Empty scratch database to seed")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.quantities, args.repeat, args.database_url))
@@ -0,0 +1,57 @@
+"""
+Ticket code index export script for entry gates
+Writes a snapshot of issued ticket codes that a gate process memory-maps at
+startup through TICKET_CODE_INDEX_SNAPSHOT; tickets sold after the export are
+read from the database when a gate first sees one
+"""
+
+import argparse
+import asyncio
+import time
+from src.infrastructure.database.connection import init_db, close_db
+from src.infrastructure.repositories.ticket_repository_impl import TicketRepositoryImpl
+from src.infrastructure.cache.ticket_code_index import SortedHashTicketCodeIndex
+
+
+def benchmark(index: SortedHashTicketCodeIndex, ticket_codes: list, lookups: int = 200_000) -> float:
+    """Measure index lookups per second over a mix of known and unknown codes"""
+    probes = (ticket_codes or ["TKT-00000000-NONE"]) + [f"TKT-00000000-{i:08d}" for i in range(1000)]
+    started = time.perf_counter()
+    for i in range(lookups):
+        index.might_exist(probes[i % len(probes)])
+    return lookups / (time.perf_counter() - started)
+
+
+async def export_ticket_index(output: str, event_id: int = None, run_benchmark: bool = False):
+    """Build the index from the database and write it to ``output``"""
+    await init_db()
+    try:
+        tickets = await TicketRepositoryImpl().get_ticket_codes_after(0, event_id)
+    finally:
+        await close_db()
+
+    ticket_codes = [code for _, code in tickets]
+    index = SortedHashTicketCodeIndex(event_id=event_id)
+    index.load(ticket_codes, watermark=tickets[-1][0] if tickets else 0)
+    index.save_snapshot(output)
+
+    started = time.perf_counter()
+    snapshot = SortedHashTicketCodeIndex.from_snapshot(output)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    stats = snapshot.stats()
+    print(f"✅ Wrote {stats.indexed_codes} ticket codes up to ticket {snapshot.watermark} to {output}")
+    print(f"   {stats.bytes_used} bytes ({stats.bytes_per_ticket} bytes per ticket), snapshot loads in {load_ms:.2f} ms")
+
+    if run_benchmark:
+        print(f"   {benchmark(snapshot, ticket_codes):,.0f} lookups per second")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the ticket code index for entry gates")
+    parser.add_argument("output", help="Snapshot file to write")
+    parser.add_argument("--event-id", type=int, default=None, help="Only include tickets for this event")
+    parser.add_argument("--benchmark", action="store_true", help="Report lookups per second")
+    args = parser.parse_args()
+
+    asyncio.run(export_ticket_index(args.output, args.event_id, args.benchmark))
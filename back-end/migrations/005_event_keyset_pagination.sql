@@ -0,0 +1,12 @@
+-- Migration 005: Indexes for keyset pagination of the event catalog
+-- GET /api/v1/events pages through events ordered by (date_time, id); these
+-- composite indexes let each page seek directly to its cursor instead of
+-- scanning or sorting the whole table
+-- Created: 2025-09-05
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_events_date_time_id ON events(date_time, id);
+CREATE INDEX IF NOT EXISTS idx_events_status_date_time_id ON events(status, date_time, id);
+
+COMMIT;
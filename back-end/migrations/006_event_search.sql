@@ -0,0 +1,23 @@
+-- Migration 006: Full-text and fuzzy search over events
+-- Adds a generated tsvector column (title > venue > description) with a GIN
+-- index for ranked full-text search, and trigram indexes on title and venue
+-- so misspelled queries still find events
+-- Created: 2025-09-05
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Kept up to date by PostgreSQL on every INSERT/UPDATE, no trigger needed
+ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(venue, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_events_search_vector ON events USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_events_title_trgm ON events USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_events_venue_trgm ON events USING GIN (venue gin_trgm_ops);
+
+COMMIT;
@@ -0,0 +1,42 @@
+-- Migration 007: Hourly sales rollups per event
+-- Dashboards read sales curves from this table instead of scanning bookings.
+-- Rows are maintained by the application on the booking write path (in the
+-- same transaction as the booking) and can be rebuilt at any time with
+-- rebuild_sales_rollups.py. Cancellations are counted in the hour the
+-- cancelled booking was made, so a rebuild reproduces the live figures exactly.
+-- Created: 2025-09-06
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS event_sales_rollups (
+    id SERIAL PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    bookings INTEGER NOT NULL DEFAULT 0,
+    tickets_sold INTEGER NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    cancellations INTEGER NOT NULL DEFAULT 0,
+    cancelled_tickets INTEGER NOT NULL DEFAULT 0,
+    cancelled_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    CONSTRAINT uq_event_sales_rollups_event_bucket UNIQUE (event_id, bucket_start)
+);
+
+-- Backfill from existing bookings (UTC hours, same rules as the application)
+INSERT INTO event_sales_rollups (
+    event_id, bucket_start, bookings, tickets_sold, revenue,
+    cancellations, cancelled_tickets, cancelled_revenue
+)
+SELECT
+    event_id,
+    date_trunc('hour', booking_date AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    COUNT(*),
+    SUM(quantity),
+    SUM(total_amount),
+    COUNT(*) FILTER (WHERE status = 'cancelled'),
+    COALESCE(SUM(quantity) FILTER (WHERE status = 'cancelled'), 0),
+    COALESCE(SUM(total_amount) FILTER (WHERE status = 'cancelled'), 0)
+FROM bookings
+GROUP BY 1, 2
+ON CONFLICT (event_id, bucket_start) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Migration 008: Index bookings by last change
+-- reconcile_event_stats.py re-checks only events whose bookings changed since
+-- its previous run; this index keeps that lookup from scanning bookings.
+-- bookings.updated_at itself exists since migration 001 and is maintained by
+-- trigger_bookings_updated_at.
+-- Created: 2025-09-06
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_bookings_updated_at ON bookings(updated_at);
+
+COMMIT;
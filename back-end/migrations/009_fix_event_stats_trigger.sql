@@ -0,0 +1,71 @@
+-- Migration 009: Count only confirmed bookings in the event statistics trigger
+-- The update_event_stats trigger of migration 003 added a re-confirmed
+-- booking's tickets and revenue as zero (NEW minus OLD of the same booking),
+-- and counted bookings inserted or deleted while cancelled. It now takes the
+-- old row out of the counters if it was confirmed and puts the new row in if
+-- it is, the same rule BookingRepositoryImpl applies in EVENT_STATS_MODE=app.
+-- Created: 2025-09-08
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION update_event_stats() RETURNS TRIGGER AS $$
+BEGIN
+    -- Touches such as updated_at leave the counters alone
+    IF TG_OP = 'UPDATE' THEN
+        IF OLD.status = NEW.status AND OLD.quantity = NEW.quantity
+            AND OLD.total_amount = NEW.total_amount AND OLD.event_id = NEW.event_id THEN
+            RETURN NEW;
+        END IF;
+    END IF;
+
+    -- Take the old version out if it was counted
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF OLD.status = 'confirmed' THEN
+            UPDATE events SET
+                total_tickets_sold = total_tickets_sold - OLD.quantity,
+                total_revenue = total_revenue - OLD.total_amount,
+                total_bookings = total_bookings - 1
+            WHERE id = OLD.event_id;
+        END IF;
+    END IF;
+
+    -- Put the new version in if it counts
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NEW.status = 'confirmed' THEN
+            UPDATE events SET
+                total_tickets_sold = total_tickets_sold + NEW.quantity,
+                total_revenue = total_revenue + NEW.total_amount,
+                total_bookings = total_bookings + 1
+            WHERE id = NEW.event_id;
+        END IF;
+    END IF;
+
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_event_stats ON bookings;
+CREATE TRIGGER trigger_update_event_stats
+    AFTER INSERT OR UPDATE OR DELETE ON bookings
+    FOR EACH ROW
+    EXECUTE FUNCTION update_event_stats();
+
+-- Repair counters the old trigger got wrong
+UPDATE events SET
+    total_tickets_sold = COALESCE((
+        SELECT SUM(quantity)
+        FROM bookings
+        WHERE event_id = events.id AND status = 'confirmed'
+    ), 0),
+    total_revenue = COALESCE((
+        SELECT SUM(total_amount)
+        FROM bookings
+        WHERE event_id = events.id AND status = 'confirmed'
+    ), 0),
+    total_bookings = COALESCE((
+        SELECT COUNT(*)
+        FROM bookings
+        WHERE event_id = events.id AND status = 'confirmed'
+    ), 0);
+
+COMMIT;
@@ -0,0 +1,41 @@
+"""
+Sales rollup repair script
+Recomputes the hourly event sales rollups from the bookings table, e.g. after
+a manual data fix or if the rollups are suspected to have drifted
+"""
+
+import argparse
+import asyncio
+import time
+from src.infrastructure.database.connection import init_db, close_db
+from src.infrastructure.database.transaction_manager import TortoiseTransactionManager
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.repositories.sales_rollup_repository_impl import SalesRollupRepositoryImpl
+from src.application.use_cases.sales_rollup_use_cases import SalesRollupUseCases
+
+
+async def rebuild_sales_rollups(event_id: int = None):
+    """Rebuild the rollups of one event, or of every event"""
+    await init_db()
+    try:
+        use_cases = SalesRollupUseCases(
+            SalesRollupRepositoryImpl(),
+            EventRepositoryImpl(),
+            TortoiseTransactionManager()
+        )
+        started = time.perf_counter()
+        buckets = await use_cases.rebuild_rollups(event_id)
+        elapsed = time.perf_counter() - started
+    finally:
+        await close_db()
+
+    scope = f"event {event_id}" if event_id is not None else "all events"
+    print(f"✅ Rebuilt {buckets} hourly sales buckets for {scope} in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild event sales rollups from bookings")
+    parser.add_argument("--event-id", type=int, default=None, help="Only rebuild this event")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild_sales_rollups(args.event_id))
@@ -0,0 +1,94 @@
+"""
+Event statistics reconciliation job
+Recomputes total_tickets_sold, total_revenue and total_bookings from confirmed
+bookings, reports drift and repairs it. After the first (full) run, later
+runs only check events whose bookings changed since the previous run; the
+watermark is kept in a small state file. It is set back from the run's start
+by a safety margin, because a booking stamped before the run but committed
+after its snapshot would otherwise never be checked.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+from src.infrastructure.database.connection import init_db, close_db
+from src.infrastructure.database.transaction_manager import TortoiseTransactionManager
+from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+from src.application.use_cases.event_stats_reconciliation_use_cases import EventStatsReconciliationUseCases
+
+DEFAULT_STATE_FILE = ".event_stats_reconcile_state.json"
+# Longest a booking transaction is expected to stay open between stamping and committing its rows
+DEFAULT_SAFETY_MARGIN_SECONDS = 300
+
+
+def load_watermark(state_file: str):
+    """Start time of the last successful run, if any"""
+    if not os.path.exists(state_file):
+        return None
+    with open(state_file) as f:
+        return datetime.fromisoformat(json.load(f)["last_started_at"])
+
+
+def save_watermark(state_file: str, started_at: datetime, safety_margin: timedelta):
+    """Remember where the next incremental run starts, ``safety_margin`` before this one started"""
+    with open(state_file, "w") as f:
+        json.dump({"last_started_at": (started_at - safety_margin).isoformat()}, f)
+
+
+async def reconcile_event_stats(
+    full: bool, dry_run: bool, state_file: str, batch_size: int, safety_margin: timedelta
+):
+    """Run one reconciliation pass and print its drift metrics"""
+    since = None if full else load_watermark(state_file)
+
+    await init_db()
+    try:
+        use_cases = EventStatsReconciliationUseCases(
+            EventRepositoryImpl(),
+            BookingRepositoryImpl(),
+            TortoiseTransactionManager(),
+            batch_size=batch_size
+        )
+        report = await use_cases.reconcile(since=since, dry_run=dry_run)
+    finally:
+        await close_db()
+
+    # A dry run repairs nothing, so the next run must look at the same changes again
+    if not dry_run:
+        save_watermark(state_file, report.started_at, safety_margin)
+
+    mode = f"incremental since {since.isoformat()}" if since else "full"
+    elapsed = (report.finished_at - report.started_at).total_seconds()
+    print(f"✅ Reconciled event statistics ({mode}{', dry run' if dry_run else ''}) in {elapsed:.2f} s")
+    print(f"   Events checked: {report.events_checked}")
+    print(f"   Events drifted: {report.events_drifted} ({report.drift_ratio:.2%})")
+    print(f"   Events repaired: {report.events_repaired}")
+    print(f"   Drift: {report.tickets_drift} tickets, {report.revenue_drift} revenue, {report.bookings_drift} bookings")
+    for drift in report.drifts:
+        print(
+            f"   - Event {drift.event_id}: tickets {drift.stored_tickets_sold} -> {drift.actual_tickets_sold}, "
+            f"revenue {drift.stored_revenue} -> {drift.actual_revenue}, "
+            f"bookings {drift.stored_bookings} -> {drift.actual_bookings}"
+        )
+    if report.events_drifted > len(report.drifts):
+        print(f"   ... and {report.events_drifted - len(report.drifts)} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect and repair drift in event statistics")
+    parser.add_argument("--full", action="store_true", help="Check every event instead of recently changed ones")
+    parser.add_argument("--dry-run", action="store_true", help="Report drift without repairing it")
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE, help="Where the last run time is kept")
+    parser.add_argument("--batch-size", type=int, default=500, help="Events recomputed and repaired per statement")
+    parser.add_argument(
+        "--safety-margin", type=float, default=DEFAULT_SAFETY_MARGIN_SECONDS,
+        help="Seconds the next run looks back before this run started, to catch late commits"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(reconcile_event_stats(
+        args.full, args.dry_run, args.state_file, args.batch_size, timedelta(seconds=args.safety_margin)
+    ))
@@ -8,7 +8,7 @@ from .event_dto import EventResponseDTO
 from .ticket_dto import TicketResponseDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class BookingCreateDTO:
     """DTO for creating a new booking"""
     user_id: int
@@ -16,7 +16,7 @@ class BookingCreateDTO:
     quantity: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BookingResponseDTO:
     """DTO for booking response"""
     id: int
@@ -28,7 +28,7 @@ class BookingResponseDTO:
     status: BookingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class BookingWithDetailsDTO:
     """DTO for booking response with user, event, and ticket details"""
     id: int
@@ -41,3 +41,11 @@ class BookingWithDetailsDTO:
     user: UserResponseDTO
     event: EventResponseDTO
     tickets: List[TicketResponseDTO]
+
+
+@dataclass(slots=True)
+class BookingPageDTO:
+    """DTO for one page of bookings in ID order"""
+    bookings: List[BookingWithDetailsDTO]
+    has_more: bool
+    next_cursor: Optional[str] = None
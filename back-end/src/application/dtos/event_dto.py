@@ -1,11 +1,11 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from ...domain.entities.event import EventStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class EventCreateDTO:
     """DTO for creating a new event"""
     title: str
@@ -17,7 +17,7 @@ class EventCreateDTO:
     status: EventStatus = EventStatus.ACTIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class EventPatchDTO:
     """DTO for partially updating an event"""
     title: Optional[str] = None
@@ -29,7 +29,7 @@ class EventPatchDTO:
     status: Optional[EventStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventResponseDTO:
     """DTO for event response"""
     id: int
@@ -43,7 +43,16 @@ class EventResponseDTO:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
+class EventPageDTO:
+    """DTO for one page of events in (date_time, id) order"""
+    events: List[EventResponseDTO]
+    has_more: bool
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+@dataclass(slots=True)
 class EventAvailabilityDTO:
     """DTO for real-time event availability"""
     event_id: int
@@ -57,7 +66,7 @@ class EventAvailabilityDTO:
     last_updated: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventManagementDTO:
     """DTO for event management view with all statistics"""
     id: int
@@ -76,3 +85,39 @@ class EventManagementDTO:
     total_bookings: int
     occupancy_percentage: float
     potential_revenue: Decimal
+
+
+@dataclass(slots=True)
+class EventStatsDriftDTO:
+    """DTO for one event whose stored counters differ from its bookings"""
+    event_id: int
+    stored_tickets_sold: int
+    actual_tickets_sold: int
+    stored_revenue: Decimal
+    actual_revenue: Decimal
+    stored_bookings: int
+    actual_bookings: int
+
+
+@dataclass(slots=True)
+class EventStatsReconciliationDTO:
+    """DTO for the outcome and drift metrics of one reconciliation run"""
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    incremental: bool = False
+    dry_run: bool = False
+    events_checked: int = 0
+    events_drifted: int = 0
+    events_repaired: int = 0
+    # Sums of absolute differences between stored and recomputed counters
+    tickets_drift: int = 0
+    revenue_drift: Decimal = Decimal("0")
+    bookings_drift: int = 0
+    drifts: List[EventStatsDriftDTO] = field(default_factory=list)
+    
+    @property
+    def drift_ratio(self) -> float:
+        """Share of checked events that had drifted"""
+        if self.events_checked == 0:
+            return 0.0
+        return round(self.events_drifted / self.events_checked, 4)
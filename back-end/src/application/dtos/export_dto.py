@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Optional
+from datetime import datetime
+
+
+class ExportJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class ExportJobDTO:
+    """DTO for a background export and its progress"""
+    id: str
+    event_id: int
+    format: str
+    status: ExportJobStatus
+    total_rows: int
+    rows_written: int = 0
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    file_name: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def progress_percentage(self) -> float:
+        """Share of rows written, 100 once the job completed"""
+        if self.status == ExportJobStatus.COMPLETED:
+            return 100.0
+        if not self.total_rows:
+            return 0.0
+        return round(min(self.rows_written / self.total_rows, 1.0) * 100, 2)
+
+
+@dataclass(slots=True)
+class ExportStreamDTO:
+    """DTO for an export encoded while it is sent"""
+    file_name: str
+    media_type: str
+    chunks: AsyncIterator[bytes]
+
+
+@dataclass(slots=True)
+class ExportFileDTO:
+    """DTO pointing at a finished export file"""
+    path: str
+    file_name: str
+    media_type: str
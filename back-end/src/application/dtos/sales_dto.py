@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+from ...domain.entities.sales_rollup import SalesInterval
+
+
+@dataclass(slots=True)
+class SalesPointDTO:
+    """DTO for the sales of one event within one hour or day"""
+    bucket_start: datetime
+    bookings: int
+    tickets_sold: int
+    revenue: Decimal
+    cancellations: int
+    cancelled_tickets: int
+    cancelled_revenue: Decimal
+    net_tickets: int
+    net_revenue: Decimal
+    cumulative_net_tickets: int
+
+
+@dataclass(slots=True)
+class SalesSeriesDTO:
+    """DTO for an event's sales curve; buckets without sales are omitted"""
+    event_id: int
+    interval: SalesInterval
+    start: Optional[datetime]
+    end: Optional[datetime]
+    points: List[SalesPointDTO] = field(default_factory=list)
+    
+    @property
+    def total_net_tickets(self) -> int:
+        """Net tickets sold over the whole series"""
+        return sum(point.net_tickets for point in self.points)
+    
+    @property
+    def total_net_revenue(self) -> Decimal:
+        """Net revenue over the whole series"""
+        return sum((point.net_revenue for point in self.points), Decimal("0"))
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from ...domain.entities.ticket import TicketStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketResponseDTO:
     """DTO for ticket response"""
     id: int
@@ -13,13 +13,13 @@ class TicketResponseDTO:
     status: TicketStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketValidationRequestDTO:
     """DTO for ticket validation request"""
     ticket_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketValidationResponseDTO:
     """DTO for ticket validation response"""
     ticket_code: str
@@ -30,3 +30,11 @@ class TicketValidationResponseDTO:
     event_name: Optional[str] = None
     event_date: Optional[datetime] = None
     user_name: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TicketBatchResponseDTO:
+    """DTO for a batch of ticket validation results, in request order"""
+    results: List[TicketValidationResponseDTO]
+    processed: int
+    succeeded: int
@@ -3,7 +3,7 @@ from typing import Optional
 from ...domain.entities.user import UserRole
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCreateDTO:
     """DTO for creating a new user"""
     name: str
@@ -11,7 +11,7 @@ class UserCreateDTO:
     role: UserRole = UserRole.CUSTOMER
 
 
-@dataclass  
+@dataclass(slots=True)
 class UserResponseDTO:
     """DTO for user response"""
     id: int
@@ -0,0 +1,17 @@
+from .cache import Cache, CacheStats
+from .availability_hub import AvailabilityHub, AvailabilitySubscription
+from .ticket_code_index import TicketCodeIndex, TicketCodeIndexStats
+from .export_writer import ExportWriter
+from .database_pool import DatabasePoolMonitor, DatabasePoolStats
+
+__all__ = [
+    "Cache",
+    "CacheStats",
+    "AvailabilityHub",
+    "AvailabilitySubscription",
+    "TicketCodeIndex",
+    "TicketCodeIndexStats",
+    "ExportWriter",
+    "DatabasePoolMonitor",
+    "DatabasePoolStats"
+]
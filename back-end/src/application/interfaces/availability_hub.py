@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+from ..dtos.event_dto import EventAvailabilityDTO
+
+
+class AvailabilitySubscription(ABC):
+    """A client's subscription to availability changes of a set of events"""
+    
+    @abstractmethod
+    async def wait(self, timeout: float) -> List[EventAvailabilityDTO]:
+        """Wait for changes; returns the latest availability per changed event,
+        or an empty list when ``timeout`` seconds pass without changes"""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Stop receiving changes; closing a closed subscription does nothing"""
+        pass
+
+
+class AvailabilityHub(ABC):
+    """Publish/subscribe hub for live availability changes"""
+    
+    @abstractmethod
+    def subscribe(self, event_ids: Iterable[int]) -> AvailabilitySubscription:
+        """Subscribe to availability changes of the given events"""
+        pass
+    
+    @abstractmethod
+    def has_subscribers(self, event_id: int) -> bool:
+        """Check whether anyone listens to changes of an event"""
+        pass
+    
+    @abstractmethod
+    def publish(self, availability: EventAvailabilityDTO) -> None:
+        """Deliver new availability to the event's subscribers"""
+        pass
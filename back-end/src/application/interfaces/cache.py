@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness"""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else 0.0
+
+
+class Cache(ABC):
+    """Abstract key/value cache used by the application layer"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None when missing or expired"""
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value if present"""
+        pass
+    
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all values"""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters"""
+        pass
+    
+    async def close(self) -> None:
+        """Release the connections or memory mappings the cache holds"""
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class DatabasePoolStats:
+    """Gauges and counters of a database connection pool"""
+    size: int
+    min_size: int
+    max_size: int
+    in_use: int
+    idle: int
+    # Callers currently waiting for a free connection
+    waiting: int
+    acquisitions: int
+    total_wait_ms: float
+    max_wait_ms: float
+    
+    @property
+    def avg_wait_ms(self) -> float:
+        """Mean time spent waiting for a connection"""
+        return round(self.total_wait_ms / self.acquisitions, 3) if self.acquisitions else 0.0
+    
+    @property
+    def utilization(self) -> float:
+        """Share of the maximum pool size currently handed out"""
+        return round(self.in_use / self.max_size, 4) if self.max_size else 0.0
+
+
+class DatabasePoolMonitor(ABC):
+    """Abstract read-only view of the database connection pool"""
+    
+    @abstractmethod
+    def stats(self) -> Optional[DatabasePoolStats]:
+        """Get pool gauges, or None when the database is not pooled (e.g. SQLite)"""
+        pass
+    
+    @abstractmethod
+    async def ping(self) -> float:
+        """Run a trivial query and return its round trip time in milliseconds"""
+        pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List
+from ...domain.entities.attendee import AttendeeRecord
+
+
+class ExportWriter(ABC):
+    """Encodes attendee records into an export file format one chunk at a time
+    
+    Each call returns the bytes produced so far, so exports can be streamed or
+    appended to a file without holding the whole result in memory.
+    """
+    
+    @property
+    @abstractmethod
+    def media_type(self) -> str:
+        """HTTP content type of the output"""
+        pass
+    
+    @property
+    @abstractmethod
+    def file_extension(self) -> str:
+        """File name extension of the output, without the dot"""
+        pass
+    
+    @abstractmethod
+    def begin(self) -> bytes:
+        """Bytes that start the output (e.g. a header row)"""
+        pass
+    
+    @abstractmethod
+    def write(self, records: List[AttendeeRecord]) -> bytes:
+        """Encode one chunk of records"""
+        pass
+    
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Bytes that complete the output (e.g. a file footer)"""
+        pass
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+@dataclass
+class TicketCodeIndexStats:
+    """Size of a ticket code index"""
+    indexed_codes: int
+    bytes_used: int
+    
+    @property
+    def bytes_per_ticket(self) -> float:
+        """Average memory cost of one indexed ticket"""
+        return round(self.bytes_used / self.indexed_codes, 2) if self.indexed_codes else 0.0
+
+
+class TicketCodeIndex(ABC):
+    """Memory-resident set of issued ticket codes
+    
+    The index covers every ticket up to its ``watermark`` (the highest ticket ID
+    it was filled with), whatever the ticket's status; tickets issued later are
+    caught up from the database. Lookups may return false positives (the
+    database decides those) but never false negatives, so a miss after catching
+    up means the code was never issued.
+    """
+    
+    @property
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        """Whether the index holds every ticket code up to its watermark"""
+        pass
+    
+    @property
+    @abstractmethod
+    def watermark(self) -> int:
+        """Highest ticket ID the index is complete up to"""
+        pass
+    
+    @property
+    @abstractmethod
+    def event_id(self) -> Optional[int]:
+        """Event whose tickets the index holds, or None for all events"""
+        pass
+    
+    @abstractmethod
+    def load(self, ticket_codes: Iterable[str], watermark: int) -> None:
+        """Replace the index contents with every ticket code up to ``watermark``"""
+        pass
+    
+    @abstractmethod
+    def might_exist(self, ticket_code: str) -> bool:
+        """False when no ticket with this code was issued up to the watermark"""
+        pass
+    
+    @abstractmethod
+    def add(self, ticket_codes: Iterable[str], watermark: Optional[int] = None) -> None:
+        """Record newly issued tickets; ``watermark`` when they are every ticket up to it"""
+        pass
+    
+    @abstractmethod
+    def save_snapshot(self, path: str) -> None:
+        """Write the index to a file that can be memory-mapped by a gate process"""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> TicketCodeIndexStats:
+        """Get the number of indexed codes and their memory footprint"""
+        pass
@@ -1,13 +1,19 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 from ...domain.entities.booking import Booking, BookingStatus
+from ...domain.entities.booking_details import BookingDetails
+from ...domain.entities.sales_rollup import SalesRollup
 from ...domain.repositories.booking_repository import BookingRepository
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.repositories.event_repository import EventRepository
 from ...domain.repositories.ticket_repository import TicketRepository
+from ...domain.repositories.transaction_manager import TransactionManager
+from ...domain.repositories.sales_rollup_repository import SalesRollupRepository
 from ...domain.services.booking_service import BookingService
 from ...domain.services.ticket_service import TicketService
-from ..dtos.booking_dto import BookingCreateDTO, BookingResponseDTO, BookingWithDetailsDTO
+from .event_availability_use_cases import EventAvailabilityUseCases
+from ..interfaces.ticket_code_index import TicketCodeIndex
+from ..dtos.booking_dto import BookingCreateDTO, BookingResponseDTO, BookingWithDetailsDTO, BookingPageDTO
 from ..dtos.user_dto import UserResponseDTO
 from ..dtos.event_dto import EventResponseDTO
 from ..dtos.ticket_dto import TicketResponseDTO
@@ -23,7 +29,11 @@ class BookingUseCases:
         event_repository: EventRepository,
         ticket_repository: TicketRepository,
         booking_service: BookingService,
-        ticket_service: TicketService
+        ticket_service: TicketService,
+        transaction_manager: TransactionManager,
+        event_availability_use_cases: Optional[EventAvailabilityUseCases] = None,
+        ticket_code_index: Optional[TicketCodeIndex] = None,
+        sales_rollup_repository: Optional[SalesRollupRepository] = None
     ):
         self._booking_repository = booking_repository
         self._user_repository = user_repository
@@ -31,6 +41,10 @@ class BookingUseCases:
         self._ticket_repository = ticket_repository
         self._booking_service = booking_service
         self._ticket_service = ticket_service
+        self._transaction_manager = transaction_manager
+        self._event_availability_use_cases = event_availability_use_cases
+        self._ticket_code_index = ticket_code_index
+        self._sales_rollup_repository = sales_rollup_repository
     
     async def create_booking(self, booking_dto: BookingCreateDTO) -> BookingResponseDTO:
         """Create a new booking with tickets"""
@@ -39,37 +53,40 @@ class BookingUseCases:
         if not user:
             raise ValueError("User not found")
         
-        # Validate event exists and get event details
-        event = await self._event_repository.get_by_id(booking_dto.event_id)
-        if not event:
-            raise ValueError("Event not found")
-        
-        # Validate booking availability
-        await self._booking_service.validate_booking_availability(
-            booking_dto.event_id, booking_dto.quantity
-        )
-        
-        # Calculate total amount
-        total_amount = event.calculate_total_price(booking_dto.quantity)
-        
-        # Create booking domain entity
-        booking = Booking(
-            id=None,
-            user_id=booking_dto.user_id,
-            event_id=booking_dto.event_id,
-            quantity=booking_dto.quantity,
-            total_amount=total_amount,
-            booking_date=datetime.now(),
-            status=BookingStatus.CONFIRMED
-        )
-        
-        # Save booking
-        created_booking = await self._booking_repository.create(booking)
+        # Reserve seats, create the booking and generate its tickets in one transaction
+        async with self._transaction_manager.atomic():
+            # Locks the event row so concurrent bookings are checked one at a time
+            event = await self._booking_service.reserve_tickets(
+                booking_dto.event_id, booking_dto.quantity
+            )
+            
+            # Calculate total amount
+            total_amount = event.calculate_total_price(booking_dto.quantity)
+            
+            # Create booking domain entity
+            booking = Booking(
+                id=None,
+                user_id=booking_dto.user_id,
+                event_id=booking_dto.event_id,
+                quantity=booking_dto.quantity,
+                total_amount=total_amount,
+                booking_date=datetime.now(),
+                status=BookingStatus.CONFIRMED
+            )
+            
+            # Save booking
+            created_booking = await self._booking_repository.create(booking)
+            
+            # Generate tickets for the booking
+            tickets = await self._ticket_service.generate_tickets_for_booking(
+                created_booking.id, booking_dto.quantity
+            )
+            
+            await self._record_sales(SalesRollup.for_booking(created_booking))
         
-        # Generate tickets for the booking
-        await self._ticket_service.generate_tickets_for_booking(
-            created_booking.id, booking_dto.quantity
-        )
+        if self._ticket_code_index and self._ticket_code_index.event_id in (None, created_booking.event_id):
+            self._ticket_code_index.add(ticket.ticket_code for ticket in tickets)
+        await self._notify_availability_changed(created_booking.event_id)
         
         # Return DTO
         return BookingResponseDTO(
@@ -89,61 +106,10 @@ class BookingUseCases:
         if not user:
             raise ValueError("User not found")
         
-        bookings = await self._booking_repository.get_by_user_id(user_id)
-        
-        result = []
-        for booking in bookings:
-            # Get related data
-            booking_user = await self._user_repository.get_by_id(booking.user_id)
-            booking_event = await self._event_repository.get_by_id(booking.event_id)
-            booking_tickets = await self._ticket_repository.get_by_booking_id(booking.id)
-            
-            # Create DTOs
-            user_dto = UserResponseDTO(
-                id=booking_user.id,
-                name=booking_user.name,
-                phone=booking_user.phone,
-                role=booking_user.role
-            )
-            
-            event_dto = EventResponseDTO(
-                id=booking_event.id,
-                title=booking_event.title,
-                description=booking_event.description,
-                venue=booking_event.venue,
-                date_time=booking_event.date_time,
-                capacity=booking_event.capacity,
-                price=booking_event.price,
-                status=booking_event.status,
-                created_at=booking_event.created_at
-            )
-            
-            ticket_dtos = [
-                TicketResponseDTO(
-                    id=ticket.id,
-                    booking_id=ticket.booking_id,
-                    ticket_code=ticket.ticket_code,
-                    status=ticket.status
-                )
-                for ticket in booking_tickets
-            ]
-            
-            booking_dto = BookingWithDetailsDTO(
-                id=booking.id,
-                user_id=booking.user_id,
-                event_id=booking.event_id,
-                quantity=booking.quantity,
-                total_amount=booking.total_amount,
-                booking_date=booking.booking_date,
-                status=booking.status,
-                user=user_dto,
-                event=event_dto,
-                tickets=ticket_dtos
-            )
-            
-            result.append(booking_dto)
+        # Users, events and tickets are loaded in a fixed number of queries
+        bookings = await self._booking_repository.get_details_by_user_id(user_id)
         
-        return result
+        return [self._to_details_dto(details) for details in bookings]
     
     async def get_event_bookings(self, event_id: int) -> List[BookingWithDetailsDTO]:
         """Get bookings for a specific event with details (admin only)"""
@@ -152,72 +118,90 @@ class BookingUseCases:
         if not event:
             raise ValueError("Event not found")
         
-        bookings = await self._booking_repository.get_by_event_id(event_id)
+        # Users, events and tickets are loaded in a fixed number of queries
+        bookings = await self._booking_repository.get_details_by_event_id(event_id)
         
-        result = []
-        for booking in bookings:
-            # Get related data
-            booking_user = await self._user_repository.get_by_id(booking.user_id)
-            booking_event = await self._event_repository.get_by_id(booking.event_id)
-            booking_tickets = await self._ticket_repository.get_by_booking_id(booking.id)
-            
-            # Create DTOs
-            user_dto = UserResponseDTO(
-                id=booking_user.id,
-                name=booking_user.name,
-                phone=booking_user.phone,
-                role=booking_user.role
-            )
-            
-            event_dto = EventResponseDTO(
-                id=booking_event.id,
-                title=booking_event.title,
-                description=booking_event.description,
-                venue=booking_event.venue,
-                date_time=booking_event.date_time,
-                capacity=booking_event.capacity,
-                price=booking_event.price,
-                status=booking_event.status,
-                created_at=booking_event.created_at
-            )
-            
-            ticket_dtos = [
-                TicketResponseDTO(
-                    id=ticket.id,
-                    booking_id=ticket.booking_id,
-                    ticket_code=ticket.ticket_code,
-                    status=ticket.status
+        return [self._to_details_dto(details) for details in bookings]
+    
+    async def get_event_bookings_page(
+        self,
+        event_id: int,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> BookingPageDTO:
+        """Get one page of an event's bookings with details, in booking ID order"""
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+        await self._ensure_event_exists(event_id)
+        
+        # One extra row tells whether another page exists without counting
+        bookings = await self._booking_repository.get_details_page_by_event_id(
+            event_id, limit + 1, self._decode_cursor(cursor)
+        )
+        has_more = len(bookings) > limit
+        bookings = bookings[:limit]
+        
+        return BookingPageDTO(
+            bookings=[self._to_details_dto(details) for details in bookings],
+            has_more=has_more,
+            next_cursor=str(bookings[-1].booking.id) if has_more else None
+        )
+    
+    async def stream_event_bookings(
+        self,
+        event_id: int,
+        cursor: Optional[str] = None,
+        chunk_size: int = 500
+    ) -> AsyncIterator[BookingWithDetailsDTO]:
+        """Validate the event, then iterate over its bookings chunk by chunk
+        
+        Only one chunk is held in memory at a time, however many bookings the
+        event has.
+        """
+        await self._ensure_event_exists(event_id)
+        after_id = self._decode_cursor(cursor)
+        
+        async def iterate() -> AsyncIterator[BookingWithDetailsDTO]:
+            last_id = after_id
+            while True:
+                chunk = await self._booking_repository.get_details_page_by_event_id(
+                    event_id, chunk_size, last_id
                 )
-                for ticket in booking_tickets
-            ]
-            
-            booking_dto = BookingWithDetailsDTO(
-                id=booking.id,
-                user_id=booking.user_id,
-                event_id=booking.event_id,
-                quantity=booking.quantity,
-                total_amount=booking.total_amount,
-                booking_date=booking.booking_date,
-                status=booking.status,
-                user=user_dto,
-                event=event_dto,
-                tickets=ticket_dtos
-            )
-            
-            result.append(booking_dto)
+                for details in chunk:
+                    yield self._to_details_dto(details)
+                if len(chunk) < chunk_size:
+                    return
+                last_id = chunk[-1].booking.id
         
-        return result
+        return iterate()
     
     async def get_booking_by_id(self, booking_id: int) -> BookingWithDetailsDTO:
         """Get booking by ID with full details"""
-        booking = await self._booking_repository.get_by_id(booking_id)
-        if not booking:
+        details = await self._booking_repository.get_details_by_id(booking_id)
+        if not details:
             raise ValueError("Booking not found")
         
-        # Get related data
-        booking_user = await self._user_repository.get_by_id(booking.user_id)
-        booking_event = await self._event_repository.get_by_id(booking.event_id)
-        booking_tickets = await self._ticket_repository.get_by_booking_id(booking.id)
+        return self._to_details_dto(details)
+    
+    async def _ensure_event_exists(self, event_id: int) -> None:
+        if not await self._event_repository.get_by_id(event_id):
+            raise ValueError("Event not found")
+    
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        """Booking ID stored in a page cursor"""
+        if cursor is None:
+            return None
+        if not cursor.isdigit():
+            raise ValueError("Invalid cursor")
+        return int(cursor)
+    
+    @staticmethod
+    def _to_details_dto(details: BookingDetails) -> BookingWithDetailsDTO:
+        """Convert a loaded booking aggregate to its response DTO"""
+        booking = details.booking
+        booking_user = details.user
+        booking_event = details.event
         
         # Create DTOs
         user_dto = UserResponseDTO(
@@ -246,7 +230,7 @@ class BookingUseCases:
                 ticket_code=ticket.ticket_code,
                 status=ticket.status
             )
-            for ticket in booking_tickets
+            for ticket in details.tickets
         ]
         
         return BookingWithDetailsDTO(
@@ -269,14 +253,15 @@ class BookingUseCases:
         if not event:
             raise ValueError("Event not found")
         
-        # Get confirmed bookings for the event
-        bookings = await self._booking_repository.get_by_event_id(event_id)
-        confirmed_bookings = [b for b in bookings if b.status == BookingStatus.CONFIRMED]
+        # Aggregate confirmed bookings in the database
+        aggregates = await self._booking_repository.aggregate(
+            event_id=event_id, status=BookingStatus.CONFIRMED
+        )
+        totals = aggregates[0]
         
-        # Calculate statistics
-        total_bookings = len(confirmed_bookings)
-        total_revenue = sum(booking.total_amount for booking in confirmed_bookings)
-        total_tickets = sum(booking.quantity for booking in confirmed_bookings)
+        total_bookings = totals.booking_count
+        total_revenue = totals.total_amount
+        total_tickets = totals.total_quantity
         
         return {
             "totalBookings": total_bookings,
@@ -292,12 +277,23 @@ class BookingUseCases:
         
         # Update booking status
         if status == BookingStatus.CANCELLED:
-            updated_booking = await self._booking_service.cancel_booking(booking_id)
-            # Cancel associated tickets
-            await self._ticket_service.cancel_tickets_for_booking(booking_id)
+            async with self._transaction_manager.atomic():
+                updated_booking = await self._booking_service.cancel_booking(booking_id)
+                # Cancel associated tickets
+                await self._ticket_service.cancel_tickets_for_booking(booking_id)
+                await self._record_sales(SalesRollup.for_cancellation(updated_booking))
         else:
+            previous_status = booking.status
             booking.status = status
-            updated_booking = await self._booking_repository.update(booking)
+            async with self._transaction_manager.atomic():
+                updated_booking = await self._booking_repository.update(booking)
+                if previous_status == BookingStatus.CANCELLED and updated_booking.is_confirmed():
+                    # Re-confirming takes the booking back out of the cancellation figures
+                    await self._record_sales(
+                        SalesRollup.for_cancellation(updated_booking, reverted=True)
+                    )
+        
+        await self._notify_availability_changed(updated_booking.event_id)
         
         return BookingResponseDTO(
             id=updated_booking.id,
@@ -308,3 +304,13 @@ class BookingUseCases:
             booking_date=updated_booking.booking_date,
             status=updated_booking.status
         )
+    
+    async def _record_sales(self, delta: SalesRollup) -> None:
+        """Add a booking's change to the sales rollups, in the caller's transaction"""
+        if self._sales_rollup_repository:
+            await self._sales_rollup_repository.increment(delta)
+    
+    async def _notify_availability_changed(self, event_id: int) -> None:
+        """Let availability consumers (cache) know the event's counters changed"""
+        if self._event_availability_use_cases:
+            await self._event_availability_use_cases.notify_availability_changed(event_id)
@@ -2,34 +2,114 @@
 Event availability use cases for real-time ticket availability
 """
 
-from typing import Dict, List
+from dataclasses import replace
+from typing import Dict, List, Optional
+from ...domain.entities.event import Event
 from ...domain.repositories.event_repository import EventRepository
-from ...domain.repositories.booking_repository import BookingRepository
 from ..dtos.event_dto import EventAvailabilityDTO
+from ..interfaces.cache import Cache, CacheStats
+from ..interfaces.availability_hub import AvailabilityHub, AvailabilitySubscription
+
+
+def availability_cache_key(event_id: int) -> str:
+    """Cache key holding the availability of one event"""
+    return f"availability:{event_id}"
 
 
 class EventAvailabilityUseCases:
     """Use cases for event availability operations"""
     
-    def __init__(self, event_repository: EventRepository, booking_repository: BookingRepository):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        cache: Optional[Cache] = None,
+        hub: Optional[AvailabilityHub] = None
+    ):
         self._event_repository = event_repository
-        self._booking_repository = booking_repository
+        self._cache = cache
+        self._hub = hub
     
     async def get_event_availability(self, event_id: int) -> EventAvailabilityDTO:
         """Get real-time availability for a specific event"""
-        event = await self._event_repository.get_by_id(event_id)
-        if not event:
+        availability_map = await self.get_multiple_events_availability([event_id])
+        if event_id not in availability_map:
             raise ValueError("Event not found")
         
-        # Get total confirmed bookings for the event
-        total_booked = await self._booking_repository.get_total_booked_quantity_for_event(event_id)
+        return availability_map[event_id]
+    
+    async def get_multiple_events_availability(self, event_ids: List[int]) -> Dict[int, EventAvailabilityDTO]:
+        """Get availability for multiple events in one call"""
+        availability_map = {}
+        missing_ids = []
+        
+        for event_id in dict.fromkeys(event_ids):
+            cached = await self._cache.get(availability_cache_key(event_id)) if self._cache else None
+            if cached is not None:
+                # Callers set last_updated, so never hand out the cached instance
+                availability_map[event_id] = replace(cached)
+            else:
+                missing_ids.append(event_id)
+        
+        if missing_ids:
+            # Events that don't exist are simply absent from the result
+            events = await self._event_repository.get_availability_by_ids(missing_ids)
+            availability_map.update(await self._store(events))
+        
+        return {
+            event_id: availability_map[event_id]
+            for event_id in event_ids
+            if event_id in availability_map
+        }
+    
+    async def get_all_active_events_availability(self) -> Dict[int, EventAvailabilityDTO]:
+        """Get availability for all active events"""
+        events = await self._event_repository.get_active_availability()
+        return await self._store(events)
+    
+    async def notify_availability_changed(self, event_id: int) -> None:
+        """Called after bookings for an event were created or cancelled"""
+        await self._event_repository.mark_bookings_changed(event_id)
+        if self._cache:
+            await self._cache.delete(availability_cache_key(event_id))
+        
+        # Recompute only when someone is listening; the fresh value also refills the cache
+        if self._hub and self._hub.has_subscribers(event_id):
+            events = await self._event_repository.get_availability_by_ids([event_id])
+            availability_map = await self._store(events)
+            if event_id in availability_map:
+                self._hub.publish(availability_map[event_id])
+    
+    def subscribe_availability(self, event_ids: List[int]) -> AvailabilitySubscription:
+        """Subscribe to live availability changes of the given events"""
+        if not self._hub:
+            raise ValueError("Live availability updates are not enabled")
+        return self._hub.subscribe(event_ids)
+    
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """Get availability cache counters, or None when caching is disabled"""
+        return self._cache.stats() if self._cache else None
+    
+    async def _store(self, events: Dict[int, Event]) -> Dict[int, EventAvailabilityDTO]:
+        """Convert freshly loaded events to DTOs and populate the cache"""
+        availability_map = {}
+        for event_id, event in events.items():
+            availability = self._to_availability_dto(event)
+            if self._cache:
+                await self._cache.set(availability_cache_key(event_id), replace(availability))
+            availability_map[event_id] = availability
+        return availability_map
+    
+    @staticmethod
+    def _to_availability_dto(event: Event) -> EventAvailabilityDTO:
+        """Build availability from an event whose total_tickets_sold is the booked quantity"""
+        total_booked = event.total_tickets_sold or 0
         available_tickets = event.capacity - total_booked
         
         # Calculate occupancy percentage
         occupancy_percentage = (total_booked / event.capacity * 100) if event.capacity > 0 else 0
         
         return EventAvailabilityDTO(
-            event_id=event_id,
+            event_id=event.id,
             total_capacity=event.capacity,
             booked_tickets=total_booked,
             available_tickets=available_tickets,
@@ -39,23 +119,3 @@ class EventAvailabilityUseCases:
             event_status=event.status,
             last_updated=None  # Will be set by the controller
         )
-    
-    async def get_multiple_events_availability(self, event_ids: List[int]) -> Dict[int, EventAvailabilityDTO]:
-        """Get availability for multiple events in one call"""
-        availability_map = {}
-        
-        for event_id in event_ids:
-            try:
-                availability = await self.get_event_availability(event_id)
-                availability_map[event_id] = availability
-            except ValueError:
-                # Skip events that don't exist
-                continue
-        
-        return availability_map
-    
-    async def get_all_active_events_availability(self) -> Dict[int, EventAvailabilityDTO]:
-        """Get availability for all active events"""
-        events = await self._event_repository.get_all_active()
-        event_ids = [event.id for event in events]
-        return await self.get_multiple_events_availability(event_ids)
@@ -0,0 +1,114 @@
+"""
+Event statistics reconciliation use cases
+Detects and repairs drift between the stored event counters
+(total_tickets_sold, total_revenue, total_bookings) and the bookings table
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, Optional
+from ...domain.entities.booking import BookingStatus, BookingGroupBy
+from ...domain.entities.event import EventStatistics
+from ...domain.repositories.event_repository import EventRepository
+from ...domain.repositories.booking_repository import BookingRepository
+from ...domain.repositories.transaction_manager import TransactionManager
+from ..dtos.event_dto import EventStatsDriftDTO, EventStatsReconciliationDTO
+
+
+class EventStatsReconciliationUseCases:
+    """Use cases for reconciling event counters with bookings"""
+    
+    # Drifted events listed individually in a report; the totals cover all of them
+    MAX_REPORTED_DRIFTS = 100
+    
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        booking_repository: BookingRepository,
+        transaction_manager: TransactionManager,
+        batch_size: int = 500
+    ):
+        self._event_repository = event_repository
+        self._booking_repository = booking_repository
+        self._transaction_manager = transaction_manager
+        self._batch_size = batch_size
+    
+    async def reconcile(
+        self,
+        since: Optional[datetime] = None,
+        dry_run: bool = False
+    ) -> EventStatsReconciliationDTO:
+        """Compare every event's counters with its confirmed bookings and repair drift
+        
+        With ``since`` only events whose bookings were created or updated at or
+        after that time are checked; pass the previous run's ``started_at``.
+        Deleted bookings leave no trace, so run a full pass now and then.
+        With ``dry_run`` drift is reported but not repaired.
+        """
+        report = EventStatsReconciliationDTO(
+            started_at=datetime.now(timezone.utc),
+            incremental=since is not None,
+            dry_run=dry_run
+        )
+        
+        if since is None:
+            event_ids = await self._event_repository.get_ids()
+        else:
+            event_ids = await self._booking_repository.get_event_ids_changed_since(since)
+        
+        for start in range(0, len(event_ids), self._batch_size):
+            await self._reconcile_batch(event_ids[start:start + self._batch_size], report)
+        
+        report.finished_at = datetime.now(timezone.utc)
+        return report
+    
+    async def _reconcile_batch(self, event_ids: List[int], report: EventStatsReconciliationDTO) -> None:
+        """Recompute one batch with a single grouped query and repair it in one statement"""
+        async with self._transaction_manager.atomic():
+            # Locking the events first means bookings committed meanwhile are either
+            # fully counted by the grouped query or wait until the repair is written
+            stored = await self._event_repository.get_statistics_for_update(event_ids)
+            aggregates = await self._booking_repository.aggregate(
+                status=BookingStatus.CONFIRMED,
+                group_by=[BookingGroupBy.EVENT],
+                event_ids=list(stored)
+            )
+            actual = {
+                aggregate.event_id: EventStatistics(
+                    event_id=aggregate.event_id,
+                    total_tickets_sold=aggregate.total_quantity,
+                    total_revenue=aggregate.total_amount,
+                    total_bookings=aggregate.booking_count
+                )
+                for aggregate in aggregates
+            }
+            
+            repairs: List[EventStatistics] = []
+            for event_id, stored_stats in stored.items():
+                # Events without confirmed bookings are absent from the grouped result
+                actual_stats = actual.get(event_id) or EventStatistics(
+                    event_id=event_id, total_tickets_sold=0, total_revenue=Decimal("0.00"), total_bookings=0
+                )
+                report.events_checked += 1
+                if actual_stats == stored_stats:
+                    continue
+                
+                report.events_drifted += 1
+                report.tickets_drift += abs(actual_stats.total_tickets_sold - stored_stats.total_tickets_sold)
+                report.revenue_drift += abs(actual_stats.total_revenue - stored_stats.total_revenue)
+                report.bookings_drift += abs(actual_stats.total_bookings - stored_stats.total_bookings)
+                if len(report.drifts) < self.MAX_REPORTED_DRIFTS:
+                    report.drifts.append(EventStatsDriftDTO(
+                        event_id=event_id,
+                        stored_tickets_sold=stored_stats.total_tickets_sold,
+                        actual_tickets_sold=actual_stats.total_tickets_sold,
+                        stored_revenue=stored_stats.total_revenue,
+                        actual_revenue=actual_stats.total_revenue,
+                        stored_bookings=stored_stats.total_bookings,
+                        actual_bookings=actual_stats.total_bookings
+                    ))
+                repairs.append(actual_stats)
+            
+            if repairs and not report.dry_run:
+                await self._event_repository.update_statistics(repairs)
+                report.events_repaired += len(repairs)
@@ -1,8 +1,11 @@
-from typing import List
+import base64
+import binascii
+import json
+from typing import List, Optional, Tuple
 from datetime import datetime
-from ...domain.entities.event import Event, EventStatus
+from ...domain.entities.event import Event, EventStatus, EventFilter
 from ...domain.repositories.event_repository import EventRepository
-from ..dtos.event_dto import EventCreateDTO, EventResponseDTO, EventManagementDTO, EventPatchDTO
+from ..dtos.event_dto import EventCreateDTO, EventResponseDTO, EventManagementDTO, EventPatchDTO, EventPageDTO
 
 
 class EventUseCases:
@@ -60,9 +63,12 @@ class EventUseCases:
             created_at=event.created_at
         )
     
-    async def get_all_events(self) -> List[EventResponseDTO]:
-        """Get all events"""
-        events = await self._event_repository.get_all()
+    async def get_all_events(self, filters: Optional[EventFilter] = None) -> List[EventResponseDTO]:
+        """Get all events, optionally filtered"""
+        if filters is None:
+            events = await self._event_repository.get_all()
+        else:
+            events = await self._event_repository.get_filtered(filters)
         
         return [
             EventResponseDTO(
@@ -79,6 +85,77 @@ class EventUseCases:
             for event in events
         ]
     
+    async def search_events(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[EventStatus] = None
+    ) -> List[EventResponseDTO]:
+        """Search events by title, venue and description, best matches first"""
+        if not query.strip():
+            raise ValueError("Search query cannot be empty")
+        
+        events = await self._event_repository.search(query.strip(), limit, status)
+        
+        return [
+            EventResponseDTO(
+                id=event.id,
+                title=event.title,
+                description=event.description,
+                venue=event.venue,
+                date_time=event.date_time,
+                capacity=event.capacity,
+                price=event.price,
+                status=event.status,
+                created_at=event.created_at
+            )
+            for event in events
+        ]
+    
+    async def get_events_page(
+        self,
+        filters: EventFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> EventPageDTO:
+        """Get one page of events using keyset pagination on (date_time, id)
+        
+        ``cursor`` is the opaque ``next_cursor`` of the previous page. Counting
+        all matches costs a second query, so ``total`` is only computed on request.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+        
+        after = self._decode_cursor(cursor) if cursor else None
+        
+        # One extra row tells whether another page exists without counting
+        events = await self._event_repository.get_filtered(filters, limit=limit + 1, after=after)
+        has_more = len(events) > limit
+        events = events[:limit]
+        
+        total = await self._event_repository.count_filtered(filters) if include_total else None
+        
+        return EventPageDTO(
+            events=[
+                EventResponseDTO(
+                    id=event.id,
+                    title=event.title,
+                    description=event.description,
+                    venue=event.venue,
+                    date_time=event.date_time,
+                    capacity=event.capacity,
+                    price=event.price,
+                    status=event.status,
+                    created_at=event.created_at
+                )
+                for event in events
+            ],
+            has_more=has_more,
+            next_cursor=self._encode_cursor(events[-1]) if has_more else None,
+            total=total
+        )
+    
     async def update_event(self, event_id: int, event_dto: EventCreateDTO) -> EventResponseDTO:
         """Update an existing event"""
         existing_event = await self._event_repository.get_by_id(event_id)
@@ -184,3 +261,18 @@ class EventUseCases:
             )
             for event in events
         ]
+    
+    @staticmethod
+    def _encode_cursor(event: Event) -> str:
+        """Opaque cursor pointing just after ``event``"""
+        payload = json.dumps([event.date_time.isoformat(), event.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Read the (date_time, id) position stored in a cursor"""
+        try:
+            date_time, event_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(date_time), int(event_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise ValueError("Invalid cursor")
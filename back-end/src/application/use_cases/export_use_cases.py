@@ -0,0 +1,171 @@
+"""
+Export Use Cases
+Attendee exports streamed over HTTP or written to files by background jobs
+"""
+
+import asyncio
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from ...domain.repositories.event_repository import EventRepository
+from ...domain.repositories.ticket_repository import TicketRepository
+from ..dtos.export_dto import ExportJobDTO, ExportJobStatus, ExportFileDTO, ExportStreamDTO
+from ..interfaces.export_writer import ExportWriter
+
+
+class ExportUseCases:
+    """Use cases for exporting event attendees (one row per ticket)
+    
+    Tickets are read in chunks of ``chunk_size`` with one joined query per chunk
+    and encoded as they arrive, so memory use does not depend on event size.
+    """
+    
+    # Finished jobs kept for status polling and download
+    MAX_TRACKED_JOBS = 100
+    
+    def __init__(
+        self,
+        ticket_repository: TicketRepository,
+        event_repository: EventRepository,
+        writer_factories: Dict[str, Callable[[], ExportWriter]],
+        export_dir: str,
+        chunk_size: int = 5000
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Export chunk size must be positive")
+        
+        self._ticket_repository = ticket_repository
+        self._event_repository = event_repository
+        self._writer_factories = writer_factories
+        self._export_dir = export_dir
+        self._chunk_size = chunk_size
+        self._jobs: "OrderedDict[str, ExportJobDTO]" = OrderedDict()
+        self._media_types: Dict[str, str] = {}
+        # Strong references so running jobs are not garbage collected
+        self._tasks: Dict[str, asyncio.Task] = {}
+    
+    def get_formats(self) -> List[str]:
+        """Export formats available in this deployment"""
+        return list(self._writer_factories)
+    
+    async def stream_attendees(self, event_id: int, export_format: str) -> ExportStreamDTO:
+        """Validate the request, then return the file name, media type and the encoded export"""
+        writer = await self._prepare(event_id, export_format)
+        return ExportStreamDTO(
+            file_name=f"event-{event_id}-attendees.{writer.file_extension}",
+            media_type=writer.media_type,
+            chunks=self._encode(event_id, writer)
+        )
+    
+    async def start_attendee_export(self, event_id: int, export_format: str) -> ExportJobDTO:
+        """Start writing an attendee export to a file in the background"""
+        writer = await self._prepare(event_id, export_format)
+        
+        job = ExportJobDTO(
+            id=uuid.uuid4().hex,
+            event_id=event_id,
+            format=export_format,
+            status=ExportJobStatus.PENDING,
+            total_rows=await self._ticket_repository.count_by_event_id(event_id),
+            created_at=datetime.now()
+        )
+        job.file_name = f"event-{event_id}-attendees-{job.id}.{writer.file_extension}"
+        self._track(job)
+        self._media_types[job.id] = writer.media_type
+        
+        task = asyncio.create_task(self._run(job, writer))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        
+        return replace(job)
+    
+    def get_job(self, job_id: str) -> ExportJobDTO:
+        """Get the current state of an export job"""
+        job = self._jobs.get(job_id)
+        if not job:
+            raise ValueError("Export job not found")
+        return replace(job)
+    
+    def get_job_file(self, job_id: str) -> ExportFileDTO:
+        """Get the file of a completed export job"""
+        job = self.get_job(job_id)
+        if job.status != ExportJobStatus.COMPLETED:
+            raise ValueError(f"Export job is {job.status.value}")
+        
+        return ExportFileDTO(
+            path=os.path.join(self._export_dir, job.file_name),
+            file_name=job.file_name,
+            media_type=self._media_types[job_id]
+        )
+    
+    async def _prepare(self, event_id: int, export_format: str) -> ExportWriter:
+        factory = self._writer_factories.get(export_format)
+        if factory is None:
+            raise ValueError(
+                f"Unsupported export format '{export_format}', expected one of: {', '.join(self._writer_factories)}"
+            )
+        if not await self._event_repository.get_by_id(event_id):
+            raise ValueError("Event not found")
+        return factory()
+    
+    async def _encode(
+        self,
+        event_id: int,
+        writer: ExportWriter,
+        on_chunk: Optional[Callable[[int], None]] = None
+    ) -> AsyncIterator[bytes]:
+        """Read tickets chunk by chunk and yield the encoded bytes"""
+        yield writer.begin()
+        
+        after_ticket_id = None
+        while True:
+            records = await self._ticket_repository.get_attendees_page(
+                event_id, self._chunk_size, after_ticket_id
+            )
+            if records:
+                yield writer.write(records)
+                after_ticket_id = records[-1].ticket_id
+                if on_chunk:
+                    on_chunk(len(records))
+            if len(records) < self._chunk_size:
+                break
+        
+        yield writer.finish()
+    
+    async def _run(self, job: ExportJobDTO, writer: ExportWriter) -> None:
+        """Write an export to ``<export_dir>/<file_name>``, publishing it only once complete"""
+        path = os.path.join(self._export_dir, job.file_name)
+        partial_path = f"{path}.part"
+        job.status = ExportJobStatus.RUNNING
+        
+        def on_chunk(rows: int) -> None:
+            job.rows_written += rows
+        
+        try:
+            os.makedirs(self._export_dir, exist_ok=True)
+            with open(partial_path, "wb") as export_file:
+                async for data in self._encode(job.event_id, writer, on_chunk):
+                    export_file.write(data)
+            os.replace(partial_path, path)
+            job.status = ExportJobStatus.COMPLETED
+        except Exception as e:
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        finally:
+            job.finished_at = datetime.now()
+    
+    def _track(self, job: ExportJobDTO) -> None:
+        """Remember a job, forgetting the oldest finished ones beyond the limit"""
+        self._jobs[job.id] = job
+        finished = [
+            job_id for job_id, tracked in self._jobs.items()
+            if tracked.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
+        ]
+        for job_id in finished[:max(0, len(self._jobs) - self.MAX_TRACKED_JOBS)]:
+            del self._jobs[job_id]
+            self._media_types.pop(job_id, None)
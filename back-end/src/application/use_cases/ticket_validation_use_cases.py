@@ -3,53 +3,161 @@ Ticket Validation Use Cases
 Business logic for validating tickets and managing ticket status
 """
 
-from typing import Optional
+import asyncio
+from typing import Dict, List, Optional
 from datetime import datetime
 from ...domain.repositories.ticket_repository import TicketRepository
 from ...domain.repositories.booking_repository import BookingRepository
 from ...domain.repositories.event_repository import EventRepository
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.entities.ticket import TicketStatus
-from ..dtos.ticket_dto import TicketValidationRequestDTO, TicketValidationResponseDTO
+from ...domain.entities.ticket_details import TicketDetails
+from ..interfaces.ticket_code_index import TicketCodeIndex
+from ..dtos.ticket_dto import (
+    TicketValidationRequestDTO,
+    TicketValidationResponseDTO,
+    TicketBatchResponseDTO
+)
 
 
 class TicketValidationUseCases:
     """Use cases for ticket validation operations"""
     
+    # Tickets below the index watermark that are read again on every catch-up,
+    # for transactions that committed after a ticket with a higher ID was read
+    INDEX_CATCH_UP_LOOKBACK = 500
+    
     def __init__(
         self, 
         ticket_repository: TicketRepository,
         booking_repository: BookingRepository,
         event_repository: EventRepository,
-        user_repository: UserRepository
+        user_repository: UserRepository,
+        ticket_code_index: Optional[TicketCodeIndex] = None
     ):
         self.ticket_repository = ticket_repository
         self.booking_repository = booking_repository
         self.event_repository = event_repository
         self.user_repository = user_repository
+        self.ticket_code_index = ticket_code_index
+        self._index_catch_up = asyncio.Lock()
+    
+    async def load_ticket_code_index(self) -> None:
+        """Fill the ticket code index from the database unless it is already loaded"""
+        index = self.ticket_code_index
+        if index and not index.is_loaded:
+            tickets = await self.ticket_repository.get_ticket_codes_after(0, index.event_id)
+            index.load((code for _, code in tickets), watermark=tickets[-1][0] if tickets else 0)
+    
+    async def _catch_up_ticket_code_index(self) -> None:
+        """Add the tickets issued since the index was filled, by any process"""
+        index = self.ticket_code_index
+        watermark = index.watermark
+        async with self._index_catch_up:
+            if index.watermark != watermark:
+                # Concurrent misses share the catch-up that ran while they waited
+                return
+            tickets = await self.ticket_repository.get_ticket_codes_after(
+                max(0, watermark - self.INDEX_CATCH_UP_LOOKBACK), index.event_id
+            )
+            index.add((code for _, code in tickets), watermark=tickets[-1][0] if tickets else watermark)
     
     async def validate_ticket(self, request: TicketValidationRequestDTO) -> TicketValidationResponseDTO:
         """Validate a ticket by its code and return detailed information"""
+        validations = await self._resolve([request.ticket_code])
+        return validations[request.ticket_code]
+    
+    async def validate_tickets(self, ticket_codes: List[str]) -> TicketBatchResponseDTO:
+        """Validate a batch of ticket codes with a single joined query"""
+        validations = await self._resolve(ticket_codes)
+        results = [validations[code] for code in ticket_codes]
+        
+        return TicketBatchResponseDTO(
+            results=results,
+            processed=len(results),
+            succeeded=sum(1 for result in results if result.is_valid)
+        )
+    
+    async def use_tickets(self, ticket_codes: List[str]) -> TicketBatchResponseDTO:
+        """Mark a batch of tickets as used
+        
+        Tickets are resolved in one joined query, and every eligible ticket is
+        transitioned by one conditional UPDATE, so a ticket scanned at two gates
+        at the same time is admitted only once.
+        """
+        validations = await self._resolve(ticket_codes)
         
-        # Check if ticket exists
-        ticket = await self.ticket_repository.get_by_ticket_code(request.ticket_code)
+        eligible_codes = [code for code, validation in validations.items() if validation.is_valid]
+        used_codes = set(await self.ticket_repository.use_active_tickets(eligible_codes))
         
-        if not ticket:
+        results = []
+        admitted = set()
+        for code in ticket_codes:
+            validation = validations[code]
+            
+            if code in used_codes and code not in admitted:
+                # The same code may appear twice in a batch; only the first one gets in
+                admitted.add(code)
+                validation = self._with_status(validation, TicketStatus.USED, "Ticket has been successfully used")
+            elif validation.is_valid:
+                validation = self._with_status(validation, TicketStatus.USED, "Ticket has already been used")
+            
+            results.append(validation)
+        
+        return TicketBatchResponseDTO(
+            results=results,
+            processed=len(results),
+            succeeded=len(admitted)
+        )
+    
+    async def use_ticket(self, ticket_code: str) -> TicketValidationResponseDTO:
+        """Mark a ticket as used if it's currently active
+        
+        The transition is a single conditional update, so when two scanners
+        present the same ticket only one of them succeeds.
+        """
+        validations = await self._resolve([ticket_code])
+        validation_result = validations[ticket_code]
+        
+        if not validation_result.is_valid:
+            return validation_result
+        
+        used = await self.ticket_repository.use_if_active(ticket_code)
+        
+        if not used:
+            # Another scanner used the ticket after it was read
+            return self._with_status(validation_result, TicketStatus.USED, "Ticket has already been used")
+        
+        return self._with_status(validation_result, TicketStatus.USED, "Ticket has been successfully used")
+    
+    async def _resolve(self, ticket_codes: List[str]) -> Dict[str, TicketValidationResponseDTO]:
+        """Validate distinct codes; codes the index knows were never issued do not reach the database"""
+        codes = set(ticket_codes)
+        if any(not self._might_exist(code) for code in codes):
+            # The code may belong to a ticket sold since the index was filled
+            await self._catch_up_ticket_code_index()
+        candidates = [code for code in codes if self._might_exist(code)]
+        details = await self.ticket_repository.get_details_by_codes(candidates)
+        
+        return {code: self._evaluate(code, details.get(code)) for code in codes}
+    
+    def _might_exist(self, ticket_code: str) -> bool:
+        return self.ticket_code_index is None or self.ticket_code_index.might_exist(ticket_code)
+    
+    @staticmethod
+    def _evaluate(ticket_code: str, details: Optional[TicketDetails]) -> TicketValidationResponseDTO:
+        """Determine whether a ticket can be used from its joined details"""
+        if not details:
             return TicketValidationResponseDTO(
-                ticket_code=request.ticket_code,
+                ticket_code=ticket_code,
                 status=TicketStatus.CANCELLED,  # Default for non-existent tickets
                 is_valid=False,
                 message="Ticket not found"
             )
         
-        # Get additional information about the ticket
-        booking = await self.booking_repository.get_by_id(ticket.booking_id)
-        event = None
-        user = None
-        
-        if booking:
-            event = await self.event_repository.get_by_id(booking.event_id)
-            user = await self.user_repository.get_by_id(booking.user_id)
+        ticket = details.ticket
+        event = details.event
+        user = details.user
         
         # Determine validation status and message
         is_valid = False
@@ -82,53 +190,20 @@ class TicketValidationUseCases:
             user_name=user.name if user else None
         )
     
-    async def use_ticket(self, ticket_code: str) -> TicketValidationResponseDTO:
-        """Mark a ticket as used if it's currently active"""
-        
-        # First validate the ticket
-        validation_request = TicketValidationRequestDTO(ticket_code=ticket_code)
-        validation_result = await self.validate_ticket(validation_request)
-        
-        if not validation_result.is_valid:
-            return validation_result
-        
-        # Get the ticket entity
-        ticket = await self.ticket_repository.get_by_ticket_code(ticket_code)
-        
-        if not ticket:
-            return TicketValidationResponseDTO(
-                ticket_code=ticket_code,
-                status=TicketStatus.CANCELLED,
-                is_valid=False,
-                message="Ticket not found"
-            )
-        
-        try:
-            # Use the domain method to mark as used
-            ticket.use()
-            
-            # Update in repository
-            await self.ticket_repository.update(ticket)
-            
-            return TicketValidationResponseDTO(
-                ticket_code=ticket.ticket_code,
-                status=ticket.status,
-                is_valid=False,  # No longer valid for future use
-                message="Ticket has been successfully used",
-                booking_id=validation_result.booking_id,
-                event_name=validation_result.event_name,
-                event_date=validation_result.event_date,
-                user_name=validation_result.user_name
-            )
-            
-        except ValueError as e:
-            return TicketValidationResponseDTO(
-                ticket_code=ticket_code,
-                status=ticket.status,
-                is_valid=False,
-                message=str(e),
-                booking_id=validation_result.booking_id,
-                event_name=validation_result.event_name,
-                event_date=validation_result.event_date,
-                user_name=validation_result.user_name
-            )
+    @staticmethod
+    def _with_status(
+        validation: TicketValidationResponseDTO,
+        status: TicketStatus,
+        message: str
+    ) -> TicketValidationResponseDTO:
+        """Copy of a validation result after the ticket left the active state"""
+        return TicketValidationResponseDTO(
+            ticket_code=validation.ticket_code,
+            status=status,
+            is_valid=False,  # No longer valid for future use
+            message=message,
+            booking_id=validation.booking_id,
+            event_name=validation.event_name,
+            event_date=validation.event_date,
+            user_name=validation.user_name
+        )
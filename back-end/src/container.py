@@ -3,13 +3,25 @@ Dependency injection container for clean architecture
 This module wires up all the dependencies following clean architecture principles
 """
 
+import os
+
 from src.infrastructure.database.connection import init_db, close_db
+from src.infrastructure.database.transaction_manager import TortoiseTransactionManager
+from src.infrastructure.database.pool import TortoisePoolMonitor
+from src.infrastructure.cache.memory_cache import InMemoryLRUCache
+from src.infrastructure.cache.shared_memory_cache import SharedMemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.ticket_code_index import SortedHashTicketCodeIndex
+from src.infrastructure.realtime.availability_hub import InProcessAvailabilityHub
+from src.infrastructure.export import CsvExportWriter, ParquetExportWriter, ArrowExportWriter, PYARROW_AVAILABLE
 
 # Infrastructure - Repositories
 from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from src.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
-from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+from src.infrastructure.repositories.cached_event_repository import CachedEventRepository
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl, EventStatsMode
 from src.infrastructure.repositories.ticket_repository_impl import TicketRepositoryImpl
+from src.infrastructure.repositories.sales_rollup_repository_impl import SalesRollupRepositoryImpl
 
 # Domain - Services
 from src.domain.services.booking_service import BookingService
@@ -21,12 +33,16 @@ from src.application.use_cases.event_use_cases import EventUseCases
 from src.application.use_cases.booking_use_cases import BookingUseCases
 from src.application.use_cases.event_availability_use_cases import EventAvailabilityUseCases
 from src.application.use_cases.ticket_validation_use_cases import TicketValidationUseCases
+from src.application.use_cases.export_use_cases import ExportUseCases
+from src.application.use_cases.sales_rollup_use_cases import SalesRollupUseCases
 
 # Presentation - Controllers
 from src.presentation.controllers.user_controller import UserController
 from src.presentation.controllers.event_controller import EventController
 from src.presentation.controllers.booking_controller import BookingController
 from src.presentation.controllers.event_availability_controller import EventAvailabilityController
+from src.presentation.controllers.export_controller import ExportController
+from src.presentation.controllers.sales_controller import SalesController
 
 
 class DependencyContainer:
@@ -34,10 +50,88 @@ class DependencyContainer:
     
     def __init__(self):
         # Initialize repositories
-        self.user_repository = UserRepositoryImpl()
-        self.event_repository = EventRepositoryImpl()
-        self.booking_repository = BookingRepositoryImpl()
-        self.ticket_repository = TicketRepositoryImpl()
+        # Repositories whose hottest lookups use the raw SQL fast path,
+        # e.g. DB_FAST_PATH_REPOSITORIES=tickets,events,users,bookings
+        fast_path = {
+            name.strip() for name in os.getenv("DB_FAST_PATH_REPOSITORIES", "").split(",") if name.strip()
+        }
+        # Repositories whose concurrent get_by_id calls are batched into one query,
+        # e.g. DB_BATCH_LOADING_REPOSITORIES=events,users
+        batch_loading = {
+            name.strip() for name in os.getenv("DB_BATCH_LOADING_REPOSITORIES", "").split(",") if name.strip()
+        }
+        self.user_repository = UserRepositoryImpl(
+            fast_path="users" in fast_path,
+            batch_loading="users" in batch_loading
+        )
+        self.event_repository = EventRepositoryImpl(
+            fast_path="events" in fast_path,
+            batch_loading="events" in batch_loading
+        )
+        self.booking_repository = BookingRepositoryImpl(
+            event_stats_mode=EventStatsMode(os.getenv("EVENT_STATS_MODE", EventStatsMode.AUTO.value)),
+            fast_path="bookings" in fast_path,
+            batch_loading="bookings" in batch_loading
+        )
+        self.ticket_repository = TicketRepositoryImpl(
+            fast_path="tickets" in fast_path,
+            batch_loading="tickets" in batch_loading
+        )
+        self.sales_rollup_repository = SalesRollupRepositoryImpl()
+        self.transaction_manager = TortoiseTransactionManager()
+        self.database_pool_monitor = TortoisePoolMonitor()
+        
+        # Initialize the cache tier in front of the event catalog and availability (opt-in):
+        # memory (per worker), shared_memory (all workers of one host) or redis (all hosts)
+        event_cache_backend = os.getenv("EVENT_CACHE_BACKEND", "none").lower()
+        event_cache_ttl = float(os.getenv("EVENT_CACHE_TTL_SECONDS", "30"))
+        event_cache_size = int(os.getenv("EVENT_CACHE_MAX_SIZE", "2048"))
+        if event_cache_backend == "memory":
+            self.event_cache = InMemoryLRUCache(ttl_seconds=event_cache_ttl, max_size=event_cache_size)
+        elif event_cache_backend == "shared_memory":
+            self.event_cache = SharedMemoryCache(
+                os.getenv("EVENT_CACHE_SHM_PATH", "/dev/shm/event-ticketing-cache"),
+                ttl_seconds=event_cache_ttl,
+                slots=event_cache_size,
+                slot_size=int(os.getenv("EVENT_CACHE_SLOT_SIZE", "16384"))
+            )
+        elif event_cache_backend == "redis":
+            self.event_cache = RedisCache.from_url(
+                os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                ttl_seconds=event_cache_ttl,
+                prefix="event-ticketing:"
+            )
+        elif event_cache_backend == "none":
+            self.event_cache = None
+        else:
+            raise ValueError(f"Unknown EVENT_CACHE_BACKEND: {event_cache_backend}")
+        if self.event_cache:
+            self.event_repository = CachedEventRepository(self.event_repository, self.event_cache)
+        
+        # Availability cache per worker, only without the cache tier: a booking
+        # clears it in the booking's worker alone, while the tier's version
+        # stamps are replaced for every worker
+        if self.event_cache:
+            self.availability_cache = None
+        else:
+            self.availability_cache = InMemoryLRUCache(
+                ttl_seconds=float(os.getenv("AVAILABILITY_CACHE_TTL_SECONDS", "5")),
+                max_size=int(os.getenv("AVAILABILITY_CACHE_MAX_SIZE", "10000"))
+            )
+        
+        # Initialize the gate-side ticket code index (opt-in)
+        ticket_index_snapshot = os.getenv("TICKET_CODE_INDEX_SNAPSHOT")
+        if ticket_index_snapshot:
+            self.ticket_code_index = SortedHashTicketCodeIndex.from_snapshot(ticket_index_snapshot)
+        elif os.getenv("TICKET_CODE_INDEX_ENABLED", "false").lower() == "true":
+            self.ticket_code_index = SortedHashTicketCodeIndex()
+        else:
+            self.ticket_code_index = None
+        
+        # Initialize live update hubs
+        self.availability_hub = InProcessAvailabilityHub(
+            max_subscribers=int(os.getenv("AVAILABILITY_STREAM_MAX_SUBSCRIBERS", "20000"))
+        )
         
         # Initialize domain services
         self.booking_service = BookingService(
@@ -49,30 +143,60 @@ class DependencyContainer:
         # Initialize use cases
         self.user_use_cases = UserUseCases(self.user_repository)
         self.event_use_cases = EventUseCases(self.event_repository)
+        self.event_availability_use_cases = EventAvailabilityUseCases(
+            self.event_repository,
+            self.availability_cache,
+            self.availability_hub
+        )
         self.booking_use_cases = BookingUseCases(
             self.booking_repository,
             self.user_repository,
             self.event_repository,
             self.ticket_repository,
             self.booking_service,
-            self.ticket_service
-        )
-        self.event_availability_use_cases = EventAvailabilityUseCases(
-            self.event_repository,
-            self.booking_repository
+            self.ticket_service,
+            self.transaction_manager,
+            self.event_availability_use_cases,
+            self.ticket_code_index,
+            self.sales_rollup_repository
         )
         self.ticket_validation_use_cases = TicketValidationUseCases(
             self.ticket_repository,
             self.booking_repository,
             self.event_repository,
-            self.user_repository
+            self.user_repository,
+            self.ticket_code_index
+        )
+        self.sales_rollup_use_cases = SalesRollupUseCases(
+            self.sales_rollup_repository,
+            self.event_repository,
+            self.transaction_manager
+        )
+        
+        export_writers = {"csv": CsvExportWriter}
+        if PYARROW_AVAILABLE:
+            export_writers.update(parquet=ParquetExportWriter, arrow=ArrowExportWriter)
+        self.export_use_cases = ExportUseCases(
+            self.ticket_repository,
+            self.event_repository,
+            export_writers,
+            export_dir=os.getenv("EXPORT_DIR", "./exports"),
+            chunk_size=int(os.getenv("EXPORT_CHUNK_SIZE", "5000"))
         )
         
         # Initialize controllers
         self.user_controller = UserController(self.user_use_cases)
         self.event_controller = EventController(self.event_use_cases, self.user_use_cases)
         self.booking_controller = BookingController(self.booking_use_cases, self.user_use_cases)
-        self.event_availability_controller = EventAvailabilityController(self.event_availability_use_cases)
+        self.event_availability_controller = EventAvailabilityController(
+            self.event_availability_use_cases,
+            stream_keepalive_seconds=float(os.getenv("AVAILABILITY_STREAM_KEEPALIVE_SECONDS", "15"))
+        )
+        self.sales_controller = SalesController(self.sales_rollup_use_cases)
+        self.export_controller = ExportController(
+            self.export_use_cases,
+            download_url_prefix="/api/v1/exports/jobs"
+        )
 
 
 # Global container instance
@@ -1,11 +1,19 @@
 from .user import User, UserRole
-from .event import Event, EventStatus
-from .booking import Booking, BookingStatus
+from .event import Event, EventStatus, EventFilter, EventStatistics
+from .booking import Booking, BookingStatus, BookingGroupBy, BookingAggregate
 from .ticket import Ticket, TicketStatus
+from .booking_details import BookingDetails
+from .ticket_details import TicketDetails
+from .attendee import AttendeeRecord
+from .sales_rollup import SalesRollup, SalesInterval
 
 __all__ = [
     "User", "UserRole",
-    "Event", "EventStatus", 
-    "Booking", "BookingStatus",
-    "Ticket", "TicketStatus"
+    "Event", "EventStatus", "EventFilter", "EventStatistics",
+    "Booking", "BookingStatus", "BookingGroupBy", "BookingAggregate",
+    "Ticket", "TicketStatus",
+    "BookingDetails",
+    "TicketDetails",
+    "AttendeeRecord",
+    "SalesRollup", "SalesInterval"
 ]
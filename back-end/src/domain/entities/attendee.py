@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from .ticket import TicketStatus
+from .booking import BookingStatus
+
+
+@dataclass(slots=True)
+class AttendeeRecord:
+    """Flat ticket + booking + ticket holder row used for attendee exports"""
+    ticket_id: int
+    ticket_code: str
+    ticket_status: TicketStatus
+    booking_id: int
+    booking_status: BookingStatus
+    booking_date: datetime
+    quantity: int
+    total_amount: Decimal
+    user_id: int
+    user_name: str
+    user_phone: str
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
 
@@ -10,7 +10,13 @@ class BookingStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+class BookingGroupBy(str, Enum):
+    EVENT = "event"
+    STATUS = "status"
+    DAY = "day"
+
+
+@dataclass(slots=True)
 class Booking:
     """Booking domain entity representing user bookings for events"""
     id: Optional[int]
@@ -21,6 +27,28 @@ class Booking:
     booking_date: Optional[datetime]
     status: BookingStatus
     
+    @classmethod
+    def from_row(
+        cls,
+        id: int,
+        user_id: int,
+        event_id: int,
+        quantity: int,
+        total_amount: Decimal,
+        booking_date: Optional[datetime],
+        status: BookingStatus
+    ) -> "Booking":
+        """Build a booking from a persisted row without re-running input validation"""
+        booking = object.__new__(cls)
+        booking.id = id
+        booking.user_id = user_id
+        booking.event_id = event_id
+        booking.quantity = quantity
+        booking.total_amount = total_amount
+        booking.booking_date = booking_date
+        booking.status = status
+        return booking
+    
     def __post_init__(self):
         if self.user_id <= 0:
             raise ValueError("User ID must be positive")
@@ -53,3 +81,14 @@ class Booking:
         if self.is_confirmed():
             raise ValueError("Booking is already confirmed")
         self.status = BookingStatus.CONFIRMED
+
+
+@dataclass(slots=True)
+class BookingAggregate:
+    """Aggregated booking figures; grouping keys are set only when grouped by them"""
+    total_quantity: int
+    total_amount: Decimal
+    booking_count: int
+    event_id: Optional[int] = None
+    status: Optional[BookingStatus] = None
+    day: Optional[date] = None
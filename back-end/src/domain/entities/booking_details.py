@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from typing import List
+from .booking import Booking
+from .user import User
+from .event import Event
+from .ticket import Ticket
+
+
+@dataclass(slots=True)
+class BookingDetails:
+    """Booking aggregate loaded together with its user, event and tickets"""
+    booking: Booking
+    user: User
+    event: Event
+    tickets: List[Ticket] = field(default_factory=list)
@@ -11,7 +11,25 @@ class EventStatus(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
+class EventFilter:
+    """Criteria for listing events; unset fields do not filter"""
+    status: Optional[EventStatus] = None
+    venue: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class EventStatistics:
+    """Confirmed booking counters of one event, as stored on the event or recomputed from bookings"""
+    event_id: int
+    total_tickets_sold: int
+    total_revenue: Decimal
+    total_bookings: int
+
+
+@dataclass(slots=True)
 class Event:
     """Event domain entity representing ticketed events"""
     id: Optional[int]
@@ -28,6 +46,38 @@ class Event:
     total_revenue: Optional[Decimal] = None
     total_bookings: Optional[int] = None
     
+    @classmethod
+    def from_row(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        venue: str,
+        date_time: datetime,
+        capacity: int,
+        price: Decimal,
+        status: EventStatus,
+        created_at: Optional[datetime] = None,
+        total_tickets_sold: Optional[int] = None,
+        total_revenue: Optional[Decimal] = None,
+        total_bookings: Optional[int] = None
+    ) -> "Event":
+        """Build an event from a persisted row without re-running input validation"""
+        event = object.__new__(cls)
+        event.id = id
+        event.title = title
+        event.description = description
+        event.venue = venue
+        event.date_time = date_time
+        event.capacity = capacity
+        event.price = price
+        event.status = status
+        event.created_at = created_at
+        event.total_tickets_sold = total_tickets_sold
+        event.total_revenue = total_revenue
+        event.total_bookings = total_bookings
+        return event
+    
     def _get_current_datetime(self) -> datetime:
         """Get current datetime in the same timezone as event datetime"""
         now = datetime.now()
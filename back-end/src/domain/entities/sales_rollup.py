@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from enum import Enum
+from datetime import datetime, timezone
+from decimal import Decimal
+from .booking import Booking
+
+
+class SalesInterval(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+
+def sales_bucket_start(moment: datetime, interval: SalesInterval = SalesInterval.HOUR) -> datetime:
+    """Start of the UTC hour or day containing ``moment`` (naive values are taken as UTC)"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    bucket = moment.replace(minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+    if interval == SalesInterval.DAY:
+        bucket = bucket.replace(hour=0)
+    return bucket
+
+
+@dataclass(slots=True)
+class SalesRollup:
+    """Sales of one event within one time bucket
+    
+    Bookings are counted in the hour they were made. A cancellation is counted
+    in the bucket of the booking it cancels, so the rollups can always be
+    rebuilt exactly from the bookings table.
+    """
+    event_id: int
+    bucket_start: datetime
+    bookings: int = 0
+    tickets_sold: int = 0
+    revenue: Decimal = Decimal("0")
+    cancellations: int = 0
+    cancelled_tickets: int = 0
+    cancelled_revenue: Decimal = Decimal("0")
+    
+    @classmethod
+    def for_booking(cls, booking: Booking) -> "SalesRollup":
+        """Increment recorded when ``booking`` is made"""
+        return cls(
+            event_id=booking.event_id,
+            bucket_start=sales_bucket_start(booking.booking_date),
+            bookings=1,
+            tickets_sold=booking.quantity,
+            revenue=booking.total_amount
+        )
+    
+    @classmethod
+    def for_cancellation(cls, booking: Booking, reverted: bool = False) -> "SalesRollup":
+        """Increment recorded when ``booking`` is cancelled, or re-confirmed if ``reverted``"""
+        sign = -1 if reverted else 1
+        return cls(
+            event_id=booking.event_id,
+            bucket_start=sales_bucket_start(booking.booking_date),
+            cancellations=sign,
+            cancelled_tickets=sign * booking.quantity,
+            cancelled_revenue=sign * booking.total_amount
+        )
+    
+    @property
+    def net_tickets(self) -> int:
+        """Tickets sold minus tickets cancelled"""
+        return self.tickets_sold - self.cancelled_tickets
+    
+    @property
+    def net_revenue(self) -> Decimal:
+        """Revenue minus cancelled revenue"""
+        return self.revenue - self.cancelled_revenue
+    
+    def merge(self, other: "SalesRollup") -> None:
+        """Add another rollup's figures to this one"""
+        self.bookings += other.bookings
+        self.tickets_sold += other.tickets_sold
+        self.revenue += other.revenue
+        self.cancellations += other.cancellations
+        self.cancelled_tickets += other.cancelled_tickets
+        self.cancelled_revenue += other.cancelled_revenue
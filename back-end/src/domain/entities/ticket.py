@@ -9,7 +9,7 @@ class TicketStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     """Ticket domain entity representing individual tickets from bookings"""
     id: Optional[int]
@@ -17,6 +17,16 @@ class Ticket:
     ticket_code: str
     status: TicketStatus
     
+    @classmethod
+    def from_row(cls, id: int, booking_id: int, ticket_code: str, status: TicketStatus) -> "Ticket":
+        """Build a ticket from a persisted row without re-running input validation"""
+        ticket = object.__new__(cls)
+        ticket.id = id
+        ticket.booking_id = booking_id
+        ticket.ticket_code = ticket_code
+        ticket.status = status
+        return ticket
+    
     def __post_init__(self):
         if self.booking_id <= 0:
             raise ValueError("Booking ID must be positive")
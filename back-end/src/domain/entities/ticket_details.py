@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+from .ticket import Ticket
+from .booking import Booking
+from .event import Event
+from .user import User
+
+
+@dataclass(slots=True)
+class TicketDetails:
+    """Ticket loaded together with its booking, event and ticket holder"""
+    ticket: Ticket
+    booking: Optional[Booking] = None
+    event: Optional[Event] = None
+    user: Optional[User] = None
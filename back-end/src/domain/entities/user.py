@@ -8,7 +8,7 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User domain entity representing customers and admins"""
     id: Optional[int]
@@ -16,6 +16,16 @@ class User:
     phone: str
     role: UserRole
     
+    @classmethod
+    def from_row(cls, id: int, name: str, phone: str, role: UserRole) -> "User":
+        """Build a user from a persisted row without re-running input validation"""
+        user = object.__new__(cls)
+        user.id = id
+        user.name = name
+        user.phone = phone
+        user.role = role
+        return user
+    
     def __post_init__(self):
         if not self.name or len(self.name.strip()) == 0:
             raise ValueError("User name cannot be empty")
@@ -2,10 +2,14 @@ from .user_repository import UserRepository
 from .event_repository import EventRepository
 from .booking_repository import BookingRepository
 from .ticket_repository import TicketRepository
+from .sales_rollup_repository import SalesRollupRepository
+from .transaction_manager import TransactionManager
 
 __all__ = [
     "UserRepository",
     "EventRepository", 
     "BookingRepository",
-    "TicketRepository"
+    "TicketRepository",
+    "SalesRollupRepository",
+    "TransactionManager"
 ]
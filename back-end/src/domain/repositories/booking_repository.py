@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities.booking import Booking, BookingStatus
+from datetime import datetime
+from typing import List, Optional, Sequence
+from ..entities.booking import Booking, BookingStatus, BookingGroupBy, BookingAggregate
+from ..entities.booking_details import BookingDetails
 
 
 class BookingRepository(ABC):
@@ -36,6 +38,32 @@ class BookingRepository(ABC):
         """Get confirmed bookings for an event"""
         pass
     
+    @abstractmethod
+    async def get_details_by_id(self, booking_id: int) -> Optional[BookingDetails]:
+        """Get booking by ID together with its user, event and tickets"""
+        pass
+    
+    @abstractmethod
+    async def get_details_by_user_id(self, user_id: int) -> List[BookingDetails]:
+        """Get bookings by user ID together with their users, events and tickets"""
+        pass
+    
+    @abstractmethod
+    async def get_details_by_event_id(self, event_id: int) -> List[BookingDetails]:
+        """Get bookings by event ID together with their users, events and tickets"""
+        pass
+    
+    @abstractmethod
+    async def get_details_page_by_event_id(
+        self,
+        event_id: int,
+        limit: int,
+        after_id: Optional[int] = None
+    ) -> List[BookingDetails]:
+        """Get up to ``limit`` bookings of an event with users, events and tickets,
+        ordered by ID and starting after booking ``after_id`` (keyset pagination)"""
+        pass
+    
     @abstractmethod
     async def update(self, booking: Booking) -> Booking:
         """Update existing booking"""
@@ -50,3 +78,24 @@ class BookingRepository(ABC):
     async def get_total_booked_quantity_for_event(self, event_id: int) -> int:
         """Get total booked quantity for an event"""
         pass
+    
+    @abstractmethod
+    async def get_event_ids_changed_since(self, since: datetime) -> List[int]:
+        """Get the IDs of events with bookings created or updated at or after ``since``"""
+        pass
+    
+    @abstractmethod
+    async def aggregate(
+        self,
+        event_id: Optional[int] = None,
+        status: Optional[BookingStatus] = None,
+        group_by: Sequence[BookingGroupBy] = (),
+        event_ids: Optional[Sequence[int]] = None
+    ) -> List[BookingAggregate]:
+        """Sum quantities and amounts and count bookings in the database
+        
+        Without ``group_by`` exactly one aggregate is returned (zeros when nothing
+        matches); otherwise one aggregate per group. ``event_ids`` restricts the
+        bookings to several events at once.
+        """
+        pass
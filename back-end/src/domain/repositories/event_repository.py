@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities.event import Event, EventStatus
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..entities.event import Event, EventStatus, EventFilter, EventStatistics
 
 
 class EventRepository(ABC):
@@ -16,11 +17,65 @@ class EventRepository(ABC):
         """Get event by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_id_for_update(self, event_id: int) -> Optional[Event]:
+        """Get event by ID and lock its row until the current transaction ends"""
+        pass
+    
     @abstractmethod
     async def get_all(self) -> List[Event]:
         """Get all events"""
         pass
     
+    @abstractmethod
+    async def get_filtered(
+        self,
+        filters: EventFilter,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Event]:
+        """Get events matching ``filters`` ordered by (date_time, id)
+        
+        ``after`` is the (date_time, id) of the last event of the previous page;
+        only events strictly after it are returned (keyset pagination).
+        """
+        pass
+    
+    @abstractmethod
+    async def count_filtered(self, filters: EventFilter) -> int:
+        """Count events matching ``filters``"""
+        pass
+    
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[EventStatus] = None
+    ) -> List[Event]:
+        """Search title, venue and description, best matches first
+        
+        Matching tolerates typos; title matches rank above venue matches,
+        which rank above description matches.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_ids(self) -> List[int]:
+        """Get the IDs of all events in ascending order"""
+        pass
+    
+    @abstractmethod
+    async def get_statistics_for_update(self, event_ids: Sequence[int]) -> Dict[int, EventStatistics]:
+        """Get the stored booking counters of the given events, keyed by event ID,
+        and lock their rows until the current transaction ends"""
+        pass
+    
+    @abstractmethod
+    async def update_statistics(self, statistics: Sequence[EventStatistics]) -> None:
+        """Overwrite the stored booking counters of the given events"""
+        pass
+    
     @abstractmethod
     async def get_by_status(self, status: EventStatus) -> List[Event]:
         """Get events by status"""
@@ -45,3 +100,23 @@ class EventRepository(ABC):
     async def get_all_active(self) -> List[Event]:
         """Get all active events (alias for compatibility)"""
         pass
+    
+    @abstractmethod
+    async def get_availability_by_ids(self, event_ids: List[int]) -> Dict[int, Event]:
+        """Get events by IDs in one query, keyed by event ID
+        
+        ``total_tickets_sold`` holds the confirmed booked quantity computed by the
+        same query, so availability can be derived without further round trips.
+        Unknown IDs are absent from the result.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_active_availability(self) -> Dict[int, Event]:
+        """Get all active events with confirmed booked quantities, keyed by event ID"""
+        pass
+    
+    async def mark_bookings_changed(self, event_id: int) -> None:
+        """Called after bookings of an event were created or cancelled, so
+        repositories that cache events can drop its booking counters"""
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from ..entities.sales_rollup import SalesRollup
+
+
+class SalesRollupRepository(ABC):
+    """Abstract repository interface for hourly event sales rollups"""
+    
+    @abstractmethod
+    async def increment(self, delta: SalesRollup) -> None:
+        """Add ``delta`` to its event's hourly bucket, creating the bucket if needed
+        
+        Call inside the transaction that writes the booking so the rollup and
+        the booking commit together.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_event_id(
+        self,
+        event_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[SalesRollup]:
+        """Get an event's hourly rollups in time order, from ``start`` (inclusive)
+        to ``end`` (exclusive)"""
+        pass
+    
+    @abstractmethod
+    async def get_net_tickets_before(self, event_id: int, end: datetime) -> int:
+        """Get an event's tickets sold minus tickets cancelled in buckets before ``end``"""
+        pass
+    
+    @abstractmethod
+    async def rebuild(self, event_id: Optional[int] = None) -> int:
+        """Recompute the rollups of one event (or all events) from the bookings
+        table; returns the number of buckets written
+        
+        Call inside a transaction so readers never see a half-rebuilt event.
+        """
+        pass
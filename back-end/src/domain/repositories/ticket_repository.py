@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from ..entities.ticket import Ticket, TicketStatus
+from ..entities.ticket_details import TicketDetails
+from ..entities.attendee import AttendeeRecord
 
 
 class TicketRepository(ABC):
@@ -11,6 +13,15 @@ class TicketRepository(ABC):
         """Create a new ticket"""
         pass
     
+    @abstractmethod
+    async def create_many(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Create several tickets in bulk
+        
+        Tickets whose code collides with an existing ticket are skipped; only the
+        tickets that were actually inserted are returned.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """Get ticket by ID"""
@@ -50,3 +61,49 @@ class TicketRepository(ABC):
     async def update_status_by_booking_id(self, booking_id: int, status: TicketStatus) -> int:
         """Update ticket status for all tickets in a booking"""
         pass
+    
+    @abstractmethod
+    async def get_ticket_codes_after(self, ticket_id: int, event_id: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Get the IDs and codes of tickets with an ID above ``ticket_id``, optionally for one event only"""
+        pass
+    
+    @abstractmethod
+    async def use_if_active(self, ticket_code: str) -> bool:
+        """Atomically mark a ticket as used if it is still active
+        
+        Returns True only for the caller whose update made the transition.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_details_by_codes(self, ticket_codes: List[str]) -> Dict[str, TicketDetails]:
+        """Get tickets with booking, event and user in one joined query, keyed by code
+        
+        Unknown codes are absent from the result.
+        """
+        pass
+    
+    @abstractmethod
+    async def use_active_tickets(self, ticket_codes: List[str]) -> List[str]:
+        """Atomically mark the given tickets as used where they are still active
+        
+        Returns the codes that this call transitioned; codes that were already
+        used, cancelled or unknown are not returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def count_by_event_id(self, event_id: int) -> int:
+        """Count all tickets issued for an event"""
+        pass
+    
+    @abstractmethod
+    async def get_attendees_page(
+        self,
+        event_id: int,
+        limit: int,
+        after_ticket_id: Optional[int] = None
+    ) -> List[AttendeeRecord]:
+        """Get up to ``limit`` tickets of an event joined with their booking and
+        ticket holder, ordered by ticket ID and starting after ``after_ticket_id``"""
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager
+
+
+class TransactionManager(ABC):
+    """Abstract interface for running repository calls in one database transaction"""
+    
+    @abstractmethod
+    def atomic(self) -> AsyncContextManager[None]:
+        """Return a context manager; repository calls made inside it commit or roll back together"""
+        pass
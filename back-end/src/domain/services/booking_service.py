@@ -12,16 +12,19 @@ class BookingService:
         self._booking_repository = booking_repository
         self._event_repository = event_repository
     
-    async def validate_booking_availability(self, event_id: int, requested_quantity: int) -> None:
-        """Validate if tickets are available for booking"""
-        event = await self._event_repository.get_by_id(event_id)
+    async def reserve_tickets(self, event_id: int, requested_quantity: int) -> Event:
+        """Lock the event and check capacity; must run inside a transaction
+        
+        The event row stays locked until the surrounding transaction commits, so the
+        booking and ticket inserts made in the same transaction cannot oversell.
+        """
+        event = await self._event_repository.get_by_id_for_update(event_id)
         if not event:
             raise ValueError("Event not found")
         
         if not event.is_bookable():
             raise ValueError("Event is not available for booking")
         
-        # Get total confirmed bookings for the event
         total_booked = await self._booking_repository.get_total_booked_quantity_for_event(event_id)
         
         available_capacity = event.capacity - total_booked
@@ -30,6 +33,8 @@ class BookingService:
             raise ValueError(
                 f"Insufficient tickets. Available: {available_capacity}, Requested: {requested_quantity}"
             )
+        
+        return event
     
     async def get_available_capacity(self, event_id: int) -> int:
         """Get available capacity for an event"""
@@ -1,7 +1,7 @@
 import secrets
 import string
 from datetime import datetime
-from typing import List
+from typing import List, Set
 from ..repositories.ticket_repository import TicketRepository
 from ..entities.ticket import Ticket, TicketStatus
 
@@ -9,6 +9,9 @@ from ..entities.ticket import Ticket, TicketStatus
 class TicketService:
     """Domain service for ticket-related business logic"""
     
+    # Bulk insert rounds before giving up on colliding ticket codes
+    MAX_GENERATION_ATTEMPTS = 5
+    
     def __init__(self, ticket_repository: TicketRepository):
         self._ticket_repository = ticket_repository
     
@@ -25,28 +28,44 @@ class TicketService:
         return f"TKT-{date_str}-{random_suffix}"
     
     async def generate_tickets_for_booking(self, booking_id: int, quantity: int) -> List[Ticket]:
-        """Generate multiple tickets for a booking"""
+        """Generate multiple tickets for a booking
+        
+        Codes are generated in memory and inserted in bulk. The unique index on
+        ticket codes is the uniqueness check: only codes that collided with an
+        existing ticket are regenerated and retried.
+        """
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
         
-        tickets = []
-        for _ in range(quantity):
-            # Generate unique ticket code
-            ticket_code = self.generate_unique_ticket_code()
+        tickets: List[Ticket] = []
+        attempted_codes: Set[str] = set()
+        
+        for _ in range(self.MAX_GENERATION_ATTEMPTS):
+            missing = quantity - len(tickets)
+            if missing == 0:
+                break
             
-            # Ensure uniqueness
-            while await self._ticket_repository.exists_by_ticket_code(ticket_code):
+            # Generate codes that are unique within this batch and earlier attempts
+            codes: Set[str] = set()
+            while len(codes) < missing:
                 ticket_code = self.generate_unique_ticket_code()
+                if ticket_code not in attempted_codes:
+                    codes.add(ticket_code)
+            attempted_codes.update(codes)
             
-            ticket = Ticket(
-                id=None,
-                booking_id=booking_id,
-                ticket_code=ticket_code,
-                status=TicketStatus.ACTIVE
-            )
-            
-            created_ticket = await self._ticket_repository.create(ticket)
-            tickets.append(created_ticket)
+            created_tickets = await self._ticket_repository.create_many([
+                Ticket(
+                    id=None,
+                    booking_id=booking_id,
+                    ticket_code=ticket_code,
+                    status=TicketStatus.ACTIVE
+                )
+                for ticket_code in codes
+            ])
+            tickets.extend(created_tickets)
+        
+        if len(tickets) < quantity:
+            raise ValueError("Could not generate unique ticket codes")
         
         return tickets
     
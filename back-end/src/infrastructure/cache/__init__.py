@@ -0,0 +1,14 @@
+from .memory_cache import InMemoryLRUCache
+from .shared_memory_cache import SharedMemoryCache
+from .redis_cache import RedisCache, REDIS_AVAILABLE
+from .version_stamps import VersionStamps
+from .ticket_code_index import SortedHashTicketCodeIndex
+
+__all__ = [
+    "InMemoryLRUCache",
+    "SharedMemoryCache",
+    "RedisCache",
+    "REDIS_AVAILABLE",
+    "VersionStamps",
+    "SortedHashTicketCodeIndex"
+]
@@ -0,0 +1,71 @@
+"""
+In-process cache with TTL expiry and bounded LRU eviction
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from ...application.interfaces.cache import Cache, CacheStats
+
+
+class InMemoryLRUCache(Cache):
+    """Per-process cache; entries expire after ``ttl_seconds`` and the least
+    recently used entry is evicted once ``max_size`` is reached"""
+    
+    def __init__(self, ttl_seconds: float = 5.0, max_size: int = 10_000):
+        if ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        # key -> (expires_at, value), ordered from least to most recently used
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None when missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value if present"""
+        self._entries.pop(key, None)
+    
+    async def clear(self) -> None:
+        """Remove all values"""
+        self._entries.clear()
+    
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters"""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self._max_size
+        )
@@ -0,0 +1,113 @@
+"""
+Cache on a Redis server (or anything speaking its protocol), shared by every
+worker on every host
+
+redis is an optional dependency; ``RedisCache.from_url`` needs it installed.
+The cache itself only calls the ``redis.asyncio.Redis`` methods get, set,
+delete, scan_iter and aclose, so local runs can hand it a fake client.
+Values are pickled: only trusted processes may share the keyspace. A failing
+server reads as a miss and drops writes, so an outage slows requests down
+instead of failing them.
+"""
+
+import pickle
+from typing import Any, Optional
+from ...application.interfaces.cache import Cache, CacheStats
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    REDIS_AVAILABLE = False
+
+# Keys removed per DEL command by clear()
+_CLEAR_BATCH_SIZE = 500
+
+
+class RedisCache(Cache):
+    """Cache whose entries live on a Redis server under ``prefix`` and expire
+    after ``ttl_seconds``
+    
+    Hit and miss counters are per process; size and evictions are the
+    server's business and are reported as 0.
+    """
+    
+    def __init__(self, client: Any, ttl_seconds: float = 5.0, prefix: str = "cache:"):
+        if ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+        
+        self._client = client
+        self._ttl_milliseconds = max(1, int(ttl_seconds * 1000))
+        self._prefix = prefix
+        self._hits = 0
+        self._misses = 0
+        # Commands that failed and were treated as misses or skipped writes
+        self.errors = 0
+    
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float = 5.0, prefix: str = "cache:") -> "RedisCache":
+        """Cache on the server at ``url`` (e.g. redis://localhost:6379/0)"""
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("The Redis cache backend needs the redis package (pip install redis)")
+        return cls(redis_asyncio.from_url(url), ttl_seconds, prefix)
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None when missing or expired"""
+        try:
+            payload = await self._client.get(self._prefix + key)
+        except Exception:
+            self.errors += 1
+            payload = None
+        
+        if payload is None:
+            self._misses += 1
+            return None
+        
+        self._hits += 1
+        return pickle.loads(payload)
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value; the server expires it"""
+        try:
+            await self._client.set(
+                self._prefix + key,
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                px=self._ttl_milliseconds
+            )
+        except Exception:
+            self.errors += 1
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value if present"""
+        try:
+            await self._client.delete(self._prefix + key)
+        except Exception:
+            self.errors += 1
+    
+    async def clear(self) -> None:
+        """Remove all values under this cache's prefix"""
+        try:
+            keys = []
+            async for key in self._client.scan_iter(match=self._prefix + "*", count=_CLEAR_BATCH_SIZE):
+                keys.append(key)
+                if len(keys) == _CLEAR_BATCH_SIZE:
+                    await self._client.delete(*keys)
+                    keys = []
+            if keys:
+                await self._client.delete(*keys)
+        except Exception:
+            self.errors += 1
+    
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters"""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=0,
+            size=0,
+            max_size=0
+        )
+    
+    async def close(self) -> None:
+        """Close the client's connections"""
+        await self._client.aclose()
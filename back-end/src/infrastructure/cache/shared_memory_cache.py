@@ -0,0 +1,245 @@
+"""
+Cache shared by the worker processes of one host through a memory-mapped file
+
+Entries live in a fixed table of equally sized slots in a file (by default on
+/dev/shm, i.e. in memory) that every worker maps. A key hashes to a set of
+``SET_WAYS`` slots; within its set it takes its own slot, a free or expired one,
+or evicts the entry closest to expiry. Writers serialize on an flock of the
+file. Readers take no lock: writers make a slot's sequence number odd while
+they rewrite it (a seqlock), and readers retry when they see it odd or changed.
+Values are pickled, so only trusted processes may share the file; values that
+do not fit in a slot are not cached.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from ...application.interfaces.cache import Cache, CacheStats
+
+# Slots per hash set
+SET_WAYS = 4
+# Attempts at a consistent read of a slot being rewritten before reporting a miss
+READ_RETRIES = 8
+
+_MAGIC = b"ETCACHE1"
+# magic, slot count, slot size, generation; clear() bumps the generation
+_HEADER = struct.Struct("<8sIIQ")
+_HEADER_SIZE = 64
+_GENERATION = struct.Struct("<Q")
+_GENERATION_OFFSET = 16
+# Slot: sequence, then generation, expires_at (epoch seconds), key hash,
+# key length, value length; key and pickled value bytes follow
+_SEQUENCE = struct.Struct("<Q")
+_SLOT_FIELDS = struct.Struct("<QdQHI")
+_SLOT_HEADER = struct.Struct("<QQdQHI")
+
+
+def _key_hash(key: bytes) -> int:
+    """Hash that every process computes alike (unlike the salted built-in hash)"""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class SharedMemoryCache(Cache):
+    """Cache in a file mapped by every worker on the host; entries expire after
+    ``ttl_seconds`` and there is room for ``slots`` of them
+    
+    Hit, miss and eviction counters are per process; the size is the number
+    of live entries in the whole file.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: float = 5.0, slots: int = 2048, slot_size: int = 16384):
+        if ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if slots <= 0:
+            raise ValueError("Cache size must be positive")
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"Cache slot size must be larger than {_SLOT_HEADER.size} bytes")
+        
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        # Whole sets only
+        self._slots = -(-slots // SET_WAYS) * SET_WAYS
+        self._slot_size = slot_size
+        self._payload_size = slot_size - _SLOT_HEADER.size
+        self._sets = self._slots // SET_WAYS
+        size = _HEADER_SIZE + self._slots * slot_size
+        
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+        try:
+            with self._locked():
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, size)
+                    # Generation 1: the zeroed slots (generation 0) read as free
+                    os.pwrite(self._fd, _HEADER.pack(_MAGIC, self._slots, slot_size, 1), 0)
+                else:
+                    magic, slot_count, existing_slot_size, _ = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+                    if (magic, slot_count, existing_slot_size) != (_MAGIC, self._slots, slot_size):
+                        raise ValueError(
+                            f"{path} holds a cache with a different layout; remove it or use the same slots and slot size"
+                        )
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None when missing or expired"""
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        generation = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+        now = time.time()
+        
+        for offset in self._set_offsets(key_hash):
+            payload = self._read_slot(offset, key_bytes, key_hash, generation, now)
+            if payload is not None:
+                self._hits += 1
+                return pickle.loads(payload)
+        
+        self._misses += 1
+        return None
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the entry of its set closest to expiry when the set is full"""
+        key_bytes = key.encode()
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(key_bytes) + len(payload) > self._payload_size or len(key_bytes) > 0xFFFF:
+            return
+        key_hash = _key_hash(key_bytes)
+        
+        with self._locked():
+            generation = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+            now = time.time()
+            offset = self._slot_for(key_bytes, key_hash, generation, now)
+            sequence = _SEQUENCE.unpack_from(self._map, offset)[0] + 1
+            # Odd while the slot is rewritten; readers retry until it is even again
+            _SEQUENCE.pack_into(self._map, offset, sequence)
+            start = offset + _SLOT_HEADER.size
+            self._map[start:start + len(key_bytes)] = key_bytes
+            self._map[start + len(key_bytes):start + len(key_bytes) + len(payload)] = payload
+            _SLOT_FIELDS.pack_into(
+                self._map, offset + _SEQUENCE.size,
+                generation, now + self._ttl_seconds, key_hash, len(key_bytes), len(payload)
+            )
+            _SEQUENCE.pack_into(self._map, offset, sequence + 1)
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value if present"""
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        
+        with self._locked():
+            generation = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+            for offset in self._set_offsets(key_hash):
+                if self._holds(offset, key_bytes, key_hash, generation):
+                    sequence = _SEQUENCE.unpack_from(self._map, offset)[0] + 1
+                    _SEQUENCE.pack_into(self._map, offset, sequence)
+                    # Generation 0 never matches the file's generation: the slot is free
+                    _GENERATION.pack_into(self._map, offset + _SEQUENCE.size, 0)
+                    _SEQUENCE.pack_into(self._map, offset, sequence + 1)
+    
+    async def clear(self) -> None:
+        """Remove all values"""
+        with self._locked():
+            generation = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+            _GENERATION.pack_into(self._map, _GENERATION_OFFSET, generation + 1)
+    
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters"""
+        generation = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+        now = time.time()
+        size = 0
+        for offset in range(_HEADER_SIZE, _HEADER_SIZE + self._slots * self._slot_size, self._slot_size):
+            _, slot_generation, expires_at, _, _, _ = _SLOT_HEADER.unpack_from(self._map, offset)
+            if slot_generation == generation and expires_at > now:
+                size += 1
+        
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=size,
+            max_size=self._slots
+        )
+    
+    async def close(self) -> None:
+        """Unmap the file; the entries stay for the other workers"""
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
+    
+    def _set_offsets(self, key_hash: int) -> range:
+        """File offsets of the slots a key may occupy"""
+        start = _HEADER_SIZE + (key_hash % self._sets) * SET_WAYS * self._slot_size
+        return range(start, start + SET_WAYS * self._slot_size, self._slot_size)
+    
+    def _read_slot(self, offset: int, key_bytes: bytes, key_hash: int, generation: int, now: float) -> Optional[bytes]:
+        """Pickled value of ``key`` if the slot holds it, read without locking"""
+        for _ in range(READ_RETRIES):
+            sequence, slot_generation, expires_at, slot_hash, key_length, value_length = (
+                _SLOT_HEADER.unpack_from(self._map, offset)
+            )
+            if sequence & 1:
+                continue
+            if slot_hash != key_hash or slot_generation != generation or expires_at <= now:
+                return None
+            if key_length + value_length > self._payload_size:
+                continue
+            start = offset + _SLOT_HEADER.size
+            stored = self._map[start:start + key_length + value_length]
+            if _SEQUENCE.unpack_from(self._map, offset)[0] != sequence:
+                continue
+            return stored[key_length:] if stored[:key_length] == key_bytes else None
+        return None
+    
+    def _holds(self, offset: int, key_bytes: bytes, key_hash: int, generation: int) -> bool:
+        """Whether the slot holds ``key``; only called under the write lock"""
+        _, slot_generation, _, slot_hash, key_length, _ = _SLOT_HEADER.unpack_from(self._map, offset)
+        if slot_hash != key_hash or slot_generation != generation:
+            return False
+        start = offset + _SLOT_HEADER.size
+        return self._map[start:start + key_length] == key_bytes
+    
+    def _slot_for(self, key_bytes: bytes, key_hash: int, generation: int, now: float) -> int:
+        """Slot to write ``key`` to: its own, a free one, or the one closest to expiry"""
+        free = None
+        victim, victim_expires_at = None, float("inf")
+        for offset in self._set_offsets(key_hash):
+            if self._holds(offset, key_bytes, key_hash, generation):
+                return offset
+            _, slot_generation, expires_at, _, _, _ = _SLOT_HEADER.unpack_from(self._map, offset)
+            if slot_generation != generation or expires_at <= now:
+                if free is None:
+                    free = offset
+            elif expires_at < victim_expires_at:
+                victim, victim_expires_at = offset, expires_at
+        
+        if free is not None:
+            return free
+        self._evictions += 1
+        return victim
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the file's write lock"""
+        if os.getpid() != self._pid:
+            # A forked worker shares the parent's open file, and with it the
+            # parent's lock; it needs its own for the lock to exclude the parent
+            os.close(self._fd)
+            self._fd = os.open(self._path, os.O_RDWR)
+            self._pid = os.getpid()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
@@ -0,0 +1,157 @@
+"""
+Issued ticket code index backed by a sorted array of 64-bit code hashes
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import Iterable, Optional, Sequence, Set
+from ...application.interfaces.ticket_code_index import TicketCodeIndex, TicketCodeIndexStats
+
+# Snapshot layout: magic, format version, code count, watermark, event ID
+# (0 for all events), then the sorted hashes
+SNAPSHOT_MAGIC = b"TKIX"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<4sIQQQ")
+
+
+def hash_ticket_code(ticket_code: str) -> int:
+    """Stable 64-bit hash of a ticket code"""
+    return int.from_bytes(blake2b(ticket_code.encode(), digest_size=8).digest(), "little")
+
+
+class SortedHashTicketCodeIndex(TicketCodeIndex):
+    """Per-process index of issued ticket codes
+
+    Codes are stored as sorted 64-bit hashes (8 bytes per ticket) and looked up
+    by binary search. Tickets issued after the last load are tracked in a small
+    delta set that is merged back once it grows, so the base array can also be
+    a read-only memory-mapped snapshot. Used and cancelled tickets stay in the
+    index: the database tells them apart from active ones.
+    """
+
+    def __init__(self, event_id: Optional[int] = None, compact_threshold: int = 1024):
+        self._hashes: Sequence[int] = array("Q")
+        self._added: Set[int] = set()
+        self._compact_threshold = compact_threshold
+        self._snapshot: Optional[mmap.mmap] = None
+        self._is_loaded = False
+        self._watermark = 0
+        self._event_id = event_id
+
+    @classmethod
+    def from_snapshot(cls, path: str, compact_threshold: int = 1024) -> "SortedHashTicketCodeIndex":
+        """Memory-map a snapshot written by ``save_snapshot`` without copying it"""
+        if sys.byteorder != "little":
+            raise ValueError("Ticket code index snapshots require a little-endian platform")
+
+        with open(path, "rb") as snapshot_file:
+            snapshot = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(snapshot) < SNAPSHOT_HEADER.size:
+            snapshot.close()
+            raise ValueError(f"Not a ticket code index snapshot: {path}")
+        magic, version, count, watermark, event_id = SNAPSHOT_HEADER.unpack_from(snapshot)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            snapshot.close()
+            raise ValueError(f"Not a ticket code index snapshot: {path}")
+        if len(snapshot) != SNAPSHOT_HEADER.size + count * 8:
+            snapshot.close()
+            raise ValueError(f"Truncated ticket code index snapshot: {path}")
+
+        index = cls(event_id=event_id or None, compact_threshold=compact_threshold)
+        index._snapshot = snapshot
+        index._hashes = memoryview(snapshot)[SNAPSHOT_HEADER.size:].cast("Q")
+        index._is_loaded = True
+        index._watermark = watermark
+        return index
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index holds every ticket code up to its watermark"""
+        return self._is_loaded
+
+    @property
+    def watermark(self) -> int:
+        """Highest ticket ID the index is complete up to"""
+        return self._watermark
+
+    @property
+    def event_id(self) -> Optional[int]:
+        """Event whose tickets the index holds, or None for all events"""
+        return self._event_id
+
+    def load(self, ticket_codes: Iterable[str], watermark: int) -> None:
+        """Replace the index contents with every ticket code up to ``watermark``"""
+        self._set_hashes(sorted({hash_ticket_code(code) for code in ticket_codes}))
+        self._watermark = watermark
+        self._is_loaded = True
+
+    def might_exist(self, ticket_code: str) -> bool:
+        """False when no ticket with this code was issued up to the watermark"""
+        if not self._is_loaded:
+            return True
+
+        code_hash = hash_ticket_code(ticket_code)
+        return code_hash in self._added or self._contains(code_hash)
+
+    def add(self, ticket_codes: Iterable[str], watermark: Optional[int] = None) -> None:
+        """Record newly issued tickets; ``watermark`` when they are every ticket up to it"""
+        for ticket_code in ticket_codes:
+            code_hash = hash_ticket_code(ticket_code)
+            if not self._contains(code_hash):
+                self._added.add(code_hash)
+        if watermark is not None:
+            self._watermark = max(self._watermark, watermark)
+        self._compact_if_needed()
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the index to a file that can be memory-mapped by a gate process"""
+        self.compact()
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self._hashes), self._watermark, self._event_id or 0
+            ))
+            snapshot_file.write(self._hashes_as_array().tobytes())
+
+    def stats(self) -> TicketCodeIndexStats:
+        """Get the number of indexed codes and their memory footprint"""
+        # Delta set entries cost far more than 8 bytes; count a set slot plus the int
+        return TicketCodeIndexStats(
+            indexed_codes=len(self._hashes) + len(self._added),
+            bytes_used=len(self._hashes) * 8 + len(self._added) * (8 + 32)
+        )
+
+    def compact(self) -> None:
+        """Merge pending additions into the sorted array"""
+        if not self._added:
+            return
+
+        merged = set(self._hashes)
+        merged.update(self._added)
+        self._set_hashes(sorted(merged))
+
+    def _contains(self, code_hash: int) -> bool:
+        position = bisect_left(self._hashes, code_hash)
+        return position < len(self._hashes) and self._hashes[position] == code_hash
+
+    def _compact_if_needed(self) -> None:
+        pending = len(self._added)
+        if pending > max(self._compact_threshold, len(self._hashes) // 8):
+            self.compact()
+
+    def _hashes_as_array(self) -> array:
+        if isinstance(self._hashes, array):
+            return self._hashes
+        return array("Q", self._hashes)
+
+    def _set_hashes(self, sorted_hashes: Iterable[int]) -> None:
+        # A merged index no longer needs the memory-mapped snapshot
+        self._hashes = array("Q", sorted_hashes)
+        self._added.clear()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
@@ -0,0 +1,39 @@
+"""
+Version stamps for invalidating cached data without finding its keys
+Cached values are stored under keys that include the current stamp of the
+data they derive from, e.g. ``event:7@<stamp>``. A write replaces the stamp,
+which makes every value stored under the old one unreachable at once: lists
+cached for any filter, and values a slow reader stores after the write with
+the stamp it read before. The stamps live in the cache they version, so with a
+shared backend a write in one worker invalidates the entries of all of them.
+"""
+
+import uuid
+from ...application.interfaces.cache import Cache
+
+
+class VersionStamps:
+    """Current stamps of named data sets, kept in ``cache`` under ``prefix``"""
+    
+    def __init__(self, cache: Cache, prefix: str = "version:"):
+        self._cache = cache
+        self._prefix = prefix
+    
+    async def current(self, name: str) -> str:
+        """Stamp of ``name``; a stamp that expired or was evicted is replaced
+        by a new one, so values stored under it are never read again"""
+        stamp = await self._cache.get(self._prefix + name)
+        if stamp is None:
+            stamp = self._new_stamp()
+            await self._cache.set(self._prefix + name, stamp)
+        return stamp
+    
+    async def bump(self, *names: str) -> None:
+        """Give each data set a new stamp after it changed"""
+        for name in names:
+            await self._cache.set(self._prefix + name, self._new_stamp())
+    
+    @staticmethod
+    def _new_stamp() -> str:
+        """Unique across processes and restarts, so an old stamp never comes back"""
+        return uuid.uuid4().hex
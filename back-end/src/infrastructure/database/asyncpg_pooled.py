@@ -0,0 +1,17 @@
+"""
+Tortoise engine: the stock asyncpg backend with an instrumented connection pool
+Selected by connection.py for postgres:// URLs
+"""
+
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from .pool import InstrumentedPool
+
+
+class InstrumentedAsyncpgDBClient(AsyncpgDBClient):
+    """asyncpg client whose pool reports in-use/idle connections and wait times"""
+    
+    async def create_pool(self, **kwargs) -> InstrumentedPool:
+        return InstrumentedPool(await super().create_pool(**kwargs))
+
+
+client_class = InstrumentedAsyncpgDBClient
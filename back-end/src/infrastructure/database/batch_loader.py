@@ -0,0 +1,132 @@
+"""
+DataLoader-style batching of primary-key reads across concurrent coroutines
+During an on-sale hundreds of requests ask for the same hot event at once.
+``BatchLoader.load()`` queues the key and returns a future: every key queued
+within one event-loop tick is fetched by a single query, and callers asking
+for a key that is already queued or being fetched share its result
+(single-flight). Loaders hand out immutable row tuples, so every caller maps
+its own entity and no mutable state is shared between requests.
+"""
+
+import asyncio
+from typing import (
+    Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Set, Tuple, Type, TypeVar
+)
+from tortoise.models import Model
+from .routing import inside_transaction, reads_pinned_to_primary
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces ``load(key)`` calls into calls of ``batch_load(keys)``
+    
+    ``batch_load`` returns the found values keyed by key; missing keys load
+    as None. Calls made inside a transaction, or by a request that must read
+    from the primary, are not batched with other requests and go straight to
+    ``batch_load`` in the caller's own context.
+    """
+    
+    def __init__(self, batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]], max_batch_size: int = 500):
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        # Keys waiting for the next dispatch, and every key not yet resolved
+        self._queue: List[K] = []
+        self._in_flight: Dict[K, asyncio.Future] = {}
+        # The event loop only keeps weak references to running fetches
+        self._fetches: Set[asyncio.Future] = set()
+        self._dispatch_scheduled = False
+        self.loads = 0
+        self.coalesced = 0
+        self.batches = 0
+    
+    async def load(self, key: K) -> Optional[V]:
+        """Value for ``key``, fetched together with the other keys of this tick"""
+        self.loads += 1
+        if self._must_load_alone():
+            self.batches += 1
+            return (await self._batch_load([key])).get(key)
+        
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._in_flight[key] = future
+            self._queue.append(key)
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        # One caller giving up must not cancel the load for everyone else
+        return await asyncio.shield(future)
+    
+    def _dispatch(self) -> None:
+        """Start one fetch per chunk of the keys queued during the last tick"""
+        self._dispatch_scheduled = False
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self._max_batch_size):
+            fetch = asyncio.ensure_future(self._fetch(keys[start:start + self._max_batch_size]))
+            self._fetches.add(fetch)
+            fetch.add_done_callback(self._fetches.discard)
+    
+    async def _fetch(self, keys: List[K]) -> None:
+        """Run one batch and resolve, fail or cancel the futures of its keys"""
+        self.batches += 1
+        try:
+            values = await self._batch_load(keys)
+        except BaseException as error:
+            for key in keys:
+                future = self._in_flight.pop(key)
+                if future.done():
+                    continue
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+                    # Retrieved here so callers that gave up do not leave a warning
+                    future.exception()
+            if not isinstance(error, Exception):
+                raise
+            return
+        
+        for key in keys:
+            future = self._in_flight.pop(key)
+            if not future.done():
+                future.set_result(values.get(key))
+    
+    @staticmethod
+    def _must_load_alone() -> bool:
+        """Reads that must stay on the caller's connection or on the primary"""
+        return inside_transaction() or reads_pinned_to_primary()
+
+
+class RowsById:
+    """``batch_load`` function returning rows of ``model`` as tuples in ``columns`` order
+    
+    PostgreSQL gets one constant statement, ``WHERE "id" = ANY($1)``, which
+    asyncpg prepares once per connection whatever the batch size; other
+    databases use ``IN``.
+    """
+    
+    def __init__(self, model: Type[Model], columns: Sequence[str]):
+        self._model = model
+        self._columns = tuple(columns)
+        self._id_index = self._columns.index("id")
+        self._any_sql = 'SELECT {columns} FROM "{table}" WHERE "id" = ANY($1)'.format(
+            columns=",".join(f'"{column}"' for column in self._columns),
+            table=model._meta.db_table
+        )
+    
+    async def __call__(self, ids: List[Any]) -> Dict[Any, Tuple]:
+        client = self._model._choose_db()
+        if client.capabilities.dialect == "postgres":
+            async with client.acquire_connection() as connection:
+                records = await connection.fetch(self._any_sql, list(ids))
+            rows = [tuple(record) for record in records]
+        else:
+            values = await self._model.filter(id__in=ids).values(*self._columns)
+            rows = [tuple(value[column] for column in self._columns) for value in values]
+        
+        return {row[self._id_index]: row for row in rows}
@@ -1,6 +1,9 @@
 import os
+from typing import Any, Dict
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
 from dotenv import load_dotenv
+from .routing import PRIMARY_CONNECTION, configure_replicas
 
 load_dotenv()
 
@@ -9,20 +12,75 @@ DATABASE_URL = os.getenv(
     "sqlite://./event_ticketing.db"
 )
 
+# Optional comma separated read replicas; read-only queries are spread over them
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+REPLICA_CONNECTIONS = [f"replica_{index}" for index in range(len(DATABASE_REPLICA_URLS))]
+
+# asyncpg pool settings read from the environment; options given as query
+# parameters of DATABASE_URL (e.g. ?maxsize=20) take precedence
+POOL_SETTINGS = {
+    "minsize": ("DB_POOL_MIN_SIZE", int, "2"),
+    "maxsize": ("DB_POOL_MAX_SIZE", int, "10"),
+    # Close connections idle for this long so quiet periods do not hold server slots
+    "max_inactive_connection_lifetime": ("DB_POOL_MAX_INACTIVE_LIFETIME_SECONDS", float, "300"),
+    # Recycle a connection after this many queries (0 = never)
+    "max_queries": ("DB_POOL_MAX_QUERIES", int, "50000"),
+    # Prepared statements cached per connection; 0 disables the cache (needed
+    # behind PgBouncer in transaction mode)
+    "statement_cache_size": ("DB_STATEMENT_CACHE_SIZE", int, "100"),
+    "max_cached_statement_lifetime": ("DB_STATEMENT_CACHE_LIFETIME_SECONDS", int, "300"),
+    "command_timeout": ("DB_COMMAND_TIMEOUT_SECONDS", float, "30"),
+}
+
+
+def build_connection_config(database_url: str) -> Dict[str, Any]:
+    """Expand a database URL into a Tortoise connection config
+
+    PostgreSQL connections use the instrumented asyncpg engine with pool
+    sizing, connection lifetime and statement cache settings from the
+    environment; other databases are used as the URL describes them.
+    """
+    config = expand_db_url(database_url)
+    if config["engine"] != "tortoise.backends.asyncpg":
+        return config
+
+    config["engine"] = "src.infrastructure.database.asyncpg_pooled"
+    credentials = config["credentials"]
+    for option, (env_var, cast, default) in POOL_SETTINGS.items():
+        credentials[option] = cast(credentials.get(option, os.getenv(env_var, default)))
+
+    if credentials["minsize"] > credentials["maxsize"]:
+        raise ValueError("DB_POOL_MIN_SIZE must not exceed DB_POOL_MAX_SIZE")
+    return config
+
+
 TORTOISE_ORM = {
-    "connections": {"default": DATABASE_URL},
+    "connections": {
+        PRIMARY_CONNECTION: build_connection_config(DATABASE_URL),
+        **{
+            name: build_connection_config(url)
+            for name, url in zip(REPLICA_CONNECTIONS, DATABASE_REPLICA_URLS)
+        },
+    },
     "apps": {
         "models": {
             "models": ["src.infrastructure.database.models", "aerich.models"],
-            "default_connection": "default",
+            "default_connection": PRIMARY_CONNECTION,
         },
     },
+    "routers": ["src.infrastructure.database.routing.ReplicaRouter"],
 }
 
 
 async def init_db():
     """Initialize database connection"""
-    await Tortoise.init(config=TORTOISE_ORM)
+    configure_replicas(REPLICA_CONNECTIONS)
+    # Tortoise keeps the connections mapping of its first init and updates it in
+    # place on later ones (tests, benchmarks); a copy keeps TORTOISE_ORM as configured
+    await Tortoise.init(config={**TORTOISE_ORM, "connections": dict(TORTOISE_ORM["connections"])})
+    # Models live on the primary only, so replicas receive no DDL
     await Tortoise.generate_schemas()
 
 
@@ -0,0 +1,61 @@
+"""
+Raw SQL fast path for the hottest point lookups
+A ``FastQuery`` is one fixed SELECT. It skips Tortoise's query builder and
+model instantiation and returns plain tuples in column order, which
+repositories map straight to domain dataclasses. The statement text never
+changes, so asyncpg prepares it once per pooled connection (its statement
+cache, DB_STATEMENT_CACHE_SIZE) and later calls only bind and execute.
+"""
+
+import re
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type
+from tortoise.models import Model
+
+# $n placeholders, rewritten to ? for databases with the qmark paramstyle
+_POSITIONAL_PARAMETER = re.compile(r"\$\d+")
+
+
+class FastQuery:
+    """A fixed ``SELECT <columns> FROM <model table> WHERE <where>``
+    
+    ``where`` uses $1, $2, ... placeholders, each once and in order. Reads go
+    through the model's router, so replicas and open transactions are honoured
+    just like ORM queries.
+    """
+    
+    def __init__(self, model: Type[Model], columns: Sequence[str], where: str, order_by: Optional[str] = None):
+        self._model = model
+        self.columns = tuple(columns)
+        self.sql = 'SELECT {columns} FROM "{table}" WHERE {where}{order_by}'.format(
+            columns=",".join(f'"{column}"' for column in self.columns),
+            table=model._meta.db_table,
+            where=where,
+            order_by=f" ORDER BY {order_by}" if order_by else ""
+        )
+        self._qmark_sql = _POSITIONAL_PARAMETER.sub("?", self.sql)
+        self._converters: Optional[List[Callable[[Any], Any]]] = None
+    
+    async def fetch(self, *parameters: Any) -> List[Tuple]:
+        """Run the query and return its rows as tuples"""
+        client = self._model._choose_db()
+        if client.capabilities.dialect == "postgres":
+            async with client.acquire_connection() as connection:
+                return [tuple(record) for record in await connection.fetch(self.sql, *parameters)]
+        
+        # asyncpg already decodes to Python types; other drivers return what is
+        # stored, converted here the way the model fields would. Foreign key
+        # columns only exist in fields_map once Tortoise is initialised.
+        if self._converters is None:
+            self._converters = [
+                self._model._meta.fields_map[column].to_python_value for column in self.columns
+            ]
+        _, rows = await client.execute_query(self._qmark_sql, list(parameters))
+        return [
+            tuple(convert(value) for convert, value in zip(self._converters, row))
+            for row in rows
+        ]
+    
+    async def fetch_one(self, *parameters: Any) -> Optional[Tuple]:
+        """Run the query and return its first row, or None"""
+        rows = await self.fetch(*parameters)
+        return rows[0] if rows else None
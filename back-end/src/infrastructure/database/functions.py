@@ -0,0 +1,11 @@
+"""
+Custom SQL functions for Tortoise ORM queries
+"""
+
+from pypika import functions
+from tortoise.functions import Function
+
+
+class Date(Function):
+    """DATE(<field>) - calendar day of a timestamp (supported by PostgreSQL and SQLite)"""
+    database_func = functions.Date
@@ -0,0 +1,113 @@
+"""
+Request-scoped identity map for repository primary-key reads
+Inside ``identity_map_scope()`` (one per HTTP request) each entity loaded by
+primary key is fetched once and then served from memory, so the user, event
+or booking a request touches several times costs one query. Repositories keep
+the map coherent: writes store the persisted entity, and writes that change
+another entity's stored figures (booking writes move event counters) evict it.
+Outside a scope every call is a no-op and reads go to the database.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+E = TypeVar("E")
+
+
+class IdentityMap:
+    """Entities of one request keyed by type and primary key"""
+    
+    def __init__(self):
+        self._entities: Dict[Tuple[type, Any], Any] = {}
+        self.hits = 0
+        self.misses = 0
+        # Set when the request ends: tasks it spawned (e.g. export jobs) keep
+        # the context but must not read or grow a map nobody clears any more
+        self.closed = False
+    
+    def get(self, entity_type: Type[E], key: Any) -> Optional[E]:
+        """The entity loaded earlier in this request, or None"""
+        if self.closed:
+            return None
+        entity = self._entities.get((entity_type, key))
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entity
+    
+    def add(self, entity: E) -> E:
+        """Remember a persisted entity (keyed by its ``id``) and return it"""
+        if not self.closed and entity is not None:
+            self._entities[(type(entity), entity.id)] = entity
+        return entity
+    
+    def discard(self, entity_type: type, key: Any) -> None:
+        """Forget one entity whose stored row changed behind the map"""
+        self._entities.pop((entity_type, key), None)
+    
+    def discard_type(self, entity_type: type) -> None:
+        """Forget every entity of a type, after a bulk write to its table"""
+        for cached_type, key in [item for item in self._entities if item[0] is entity_type]:
+            del self._entities[(cached_type, key)]
+    
+    def clear(self) -> None:
+        """Forget everything, e.g. after a rolled back transaction"""
+        self._entities.clear()
+
+
+_current_map: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
+
+
+@contextmanager
+def identity_map_scope() -> Iterator[IdentityMap]:
+    """Share one identity map between all repository calls made inside the block"""
+    identity_map = IdentityMap()
+    token = _current_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_map.reset(token)
+        identity_map.closed = True
+        identity_map.clear()
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """The identity map of the current request, if any"""
+    return _current_map.get()
+
+
+def lookup(entity_type: Type[E], key: Any) -> Optional[E]:
+    """The entity already loaded in this request, or None"""
+    identity_map = _current_map.get()
+    return identity_map.get(entity_type, key) if identity_map is not None else None
+
+
+def remember(entity: E) -> E:
+    """Record a persisted entity in the current request's map and return it"""
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.add(entity)
+    return entity
+
+
+def forget(entity_type: type, key: Any) -> None:
+    """Evict one entity from the current request's map"""
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.discard(entity_type, key)
+
+
+def forget_all(entity_type: type) -> None:
+    """Evict every entity of a type from the current request's map"""
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.discard_type(entity_type)
+
+
+def forget_everything() -> None:
+    """Empty the current request's map"""
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.clear()
@@ -2,10 +2,12 @@ from .user_model import UserModel
 from .event_model import EventModel
 from .booking_model import BookingModel
 from .ticket_model import TicketModel
+from .sales_rollup_model import SalesRollupModel
 
 __all__ = [
     "UserModel",
     "EventModel", 
     "BookingModel",
-    "TicketModel"
+    "TicketModel",
+    "SalesRollupModel"
 ]
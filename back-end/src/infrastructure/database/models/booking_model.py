@@ -12,6 +12,8 @@ class BookingModel(Model):
     total_amount = fields.DecimalField(max_digits=10, decimal_places=2)
     booking_date = fields.DatetimeField(auto_now_add=True)
     status = fields.CharEnumField(BookingStatus, default=BookingStatus.CONFIRMED)
+    # Lets event statistics be reconciled for recently changed bookings only
+    updated_at = fields.DatetimeField(auto_now=True, index=True)
     
     class Meta:
         table = "bookings"
@@ -22,6 +22,8 @@ class EventModel(Model):
     
     class Meta:
         table = "events"
+        # Keyset pagination seeks on (date_time, id), optionally within one status
+        indexes = (("date_time", "id"), ("status", "date_time", "id"))
     
     def __str__(self):
         return f"{self.title} - {self.venue}"
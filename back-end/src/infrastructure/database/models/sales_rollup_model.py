@@ -0,0 +1,23 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class SalesRollupModel(Model):
+    """Tortoise ORM model for hourly event sales rollups"""
+    id = fields.IntField(pk=True)
+    event = fields.ForeignKeyField("models.EventModel", related_name="sales_rollups")
+    bucket_start = fields.DatetimeField()
+    bookings = fields.IntField(default=0)
+    tickets_sold = fields.IntField(default=0)
+    revenue = fields.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cancellations = fields.IntField(default=0)
+    cancelled_tickets = fields.IntField(default=0)
+    cancelled_revenue = fields.DecimalField(max_digits=12, decimal_places=2, default=0)
+    
+    class Meta:
+        table = "event_sales_rollups"
+        # One row per event and hour; also serves time-range reads of one event
+        unique_together = (("event", "bucket_start"),)
+    
+    def __str__(self):
+        return f"Sales of Event {self.event_id} at {self.bucket_start}"
@@ -0,0 +1,75 @@
+"""
+Connection pool instrumentation for the asyncpg backend
+"""
+
+import time
+from typing import Any, Optional
+from tortoise import connections
+from ...application.interfaces.database_pool import DatabasePoolMonitor, DatabasePoolStats
+
+
+class InstrumentedPool:
+    """asyncpg pool wrapper that measures how long callers wait for a connection
+    
+    Tortoise only calls ``await pool.acquire()`` and ``pool.release()``; every
+    other attribute is passed through to the wrapped pool.
+    """
+    
+    def __init__(self, pool: Any):
+        self._pool = pool
+        self.waiting = 0
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    async def acquire(self, *, timeout: Optional[float] = None) -> Any:
+        """Acquire a connection, recording the wait"""
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return await self._pool.acquire(timeout=timeout)
+        finally:
+            self.waiting -= 1
+            waited = time.perf_counter() - started
+            self.acquisitions += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+    
+    def stats(self) -> DatabasePoolStats:
+        """Current gauges and cumulative wait counters"""
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return DatabasePoolStats(
+            size=size,
+            min_size=self._pool.get_min_size(),
+            max_size=self._pool.get_max_size(),
+            in_use=size - idle,
+            idle=idle,
+            waiting=self.waiting,
+            acquisitions=self.acquisitions,
+            total_wait_ms=round(self.total_wait * 1000, 3),
+            max_wait_ms=round(self.max_wait * 1000, 3)
+        )
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+
+class TortoisePoolMonitor(DatabasePoolMonitor):
+    """Reads the instrumented pool of a Tortoise connection"""
+    
+    def __init__(self, connection_name: str = "default"):
+        self._connection_name = connection_name
+    
+    def stats(self) -> Optional[DatabasePoolStats]:
+        """Get pool gauges, or None when the database is not pooled (e.g. SQLite)"""
+        pool = getattr(connections.get(self._connection_name), "_pool", None)
+        if not isinstance(pool, InstrumentedPool):
+            return None
+        return pool.stats()
+    
+    async def ping(self) -> float:
+        """Run a trivial query and return its round trip time in milliseconds"""
+        started = time.perf_counter()
+        await connections.get(self._connection_name).execute_query("SELECT 1")
+        return round((time.perf_counter() - started) * 1000, 3)
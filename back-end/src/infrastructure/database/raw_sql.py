@@ -0,0 +1,20 @@
+"""
+Helpers for the few statements the ORM cannot express (e.g. UPDATE ... RETURNING)
+"""
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+
+def get_connection(connection_name: str = "default") -> BaseDBAsyncClient:
+    """Current connection for ``connection_name``; inside ``in_transaction()`` this is
+    the transaction's connection"""
+    return connections.get(connection_name)
+
+
+def placeholders(connection: BaseDBAsyncClient, count: int, start: int = 1) -> str:
+    """Comma separated bind parameters in the connection's paramstyle
+    ($n for PostgreSQL, ? otherwise)"""
+    if connection.capabilities.dialect == "postgres":
+        return ",".join(f"${index}" for index in range(start, start + count))
+    return ",".join("?" for _ in range(count))
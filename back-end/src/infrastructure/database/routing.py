@@ -0,0 +1,81 @@
+"""
+Read-replica routing for Tortoise ORM
+Reads go to replica connections and writes to the primary. Reads stay on the
+primary inside transactions and for callers that recently wrote
+(read-your-writes), so a user always sees their own new booking.
+"""
+
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from tortoise import connections
+from tortoise.backends.base.client import BaseTransactionWrapper
+
+PRIMARY_CONNECTION = "default"
+
+_replica_names: List[str] = []
+_replica_cycle: Optional[Iterator[str]] = None
+
+
+@dataclass
+class ReadRoutingScope:
+    """Routing state of one request or job; mutable so tasks spawned inside it can report writes"""
+    pin_to_primary: bool = False
+    wrote: bool = False
+
+
+_current_scope: ContextVar[Optional[ReadRoutingScope]] = ContextVar("read_routing_scope", default=None)
+
+
+def configure_replicas(replica_names: List[str]) -> None:
+    """Set the replica connection names reads are spread over (round robin)"""
+    global _replica_names, _replica_cycle
+    _replica_names = list(replica_names)
+    _replica_cycle = itertools.cycle(_replica_names) if _replica_names else None
+
+
+@contextmanager
+def read_routing_scope(pin_to_primary: bool = False) -> Iterator[ReadRoutingScope]:
+    """Track writes made inside the block; with ``pin_to_primary`` every read goes to the primary"""
+    scope = ReadRoutingScope(pin_to_primary=pin_to_primary)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def inside_transaction() -> bool:
+    """Whether the caller runs inside ``in_transaction()`` on the primary"""
+    # The primary name then resolves to the transaction's connection
+    return isinstance(connections.get(PRIMARY_CONNECTION), BaseTransactionWrapper)
+
+
+def reads_pinned_to_primary() -> bool:
+    """Whether reads of the current scope must go to the primary instead of a replica"""
+    if _replica_cycle is None:
+        return False
+    scope = _current_scope.get()
+    return scope is not None and (scope.pin_to_primary or scope.wrote)
+
+
+class ReplicaRouter:
+    """Tortoise router (``TORTOISE_ORM["routers"]``) choosing the connection of each query"""
+    
+    def db_for_read(self, model) -> Optional[str]:
+        if _replica_cycle is None or reads_pinned_to_primary():
+            return None
+        # Reads inside a transaction must see the transaction's own writes
+        if inside_transaction():
+            return None
+        return next(_replica_cycle)
+    
+    def db_for_write(self, model) -> Optional[str]:
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.wrote = True
+        # None keeps Tortoise's default: the model's connection, i.e. the primary
+        # or the current transaction on it
+        return None
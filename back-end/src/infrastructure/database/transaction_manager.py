@@ -0,0 +1,28 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from tortoise.transactions import in_transaction
+from ...domain.repositories.transaction_manager import TransactionManager
+from .identity_map import forget_everything
+
+
+class TortoiseTransactionManager(TransactionManager):
+    """Tortoise ORM implementation of TransactionManager
+    
+    Tortoise binds the transaction connection to the current task, so every
+    repository call awaited inside ``atomic()`` joins the same transaction.
+    """
+    
+    def __init__(self, connection_name: str = "default"):
+        self._connection_name = connection_name
+    
+    @asynccontextmanager
+    async def atomic(self) -> AsyncIterator[None]:
+        """Run the enclosed repository calls in one transaction"""
+        try:
+            async with in_transaction(self._connection_name):
+                yield
+        except BaseException:
+            # Entities the request map picked up inside the rolled back
+            # transaction were never committed
+            forget_everything()
+            raise
@@ -0,0 +1,9 @@
+from .csv_writer import CsvExportWriter
+from .arrow_writer import ArrowExportWriter, ParquetExportWriter, PYARROW_AVAILABLE
+
+__all__ = [
+    "CsvExportWriter",
+    "ArrowExportWriter",
+    "ParquetExportWriter",
+    "PYARROW_AVAILABLE"
+]
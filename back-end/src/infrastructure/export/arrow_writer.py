@@ -0,0 +1,140 @@
+"""
+Columnar (Apache Arrow / Parquet) encoding for attendee exports
+
+pyarrow is an optional dependency; the writers are only offered when it is installed.
+"""
+
+from abc import abstractmethod
+from decimal import Decimal
+from typing import List
+from ...application.interfaces.export_writer import ExportWriter
+from ...domain.entities.attendee import AttendeeRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    PYARROW_AVAILABLE = False
+
+_CENTS = Decimal("0.01")
+
+
+def _attendee_schema() -> "pa.Schema":
+    return pa.schema([
+        ("ticket_id", pa.int64()),
+        ("ticket_code", pa.string()),
+        ("ticket_status", pa.string()),
+        ("booking_id", pa.int64()),
+        ("booking_status", pa.string()),
+        ("booking_date", pa.timestamp("us", tz="UTC")),
+        ("quantity", pa.int32()),
+        ("total_amount", pa.decimal128(10, 2)),
+        ("user_id", pa.int64()),
+        ("user_name", pa.string()),
+        ("user_phone", pa.string())
+    ])
+
+
+class _ChunkSink:
+    """Write-only file object whose contents are handed out and dropped as they are produced"""
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+        self.closed = False
+    
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        self.closed = True
+    
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class _ArrowExportWriter(ExportWriter):
+    """Base for writers that encode each chunk as one Arrow record batch"""
+    
+    def __init__(self):
+        if not PYARROW_AVAILABLE:
+            raise ValueError("Columnar exports require the optional 'pyarrow' package")
+        self._schema = _attendee_schema()
+        self._sink = _ChunkSink()
+        self._writer = None
+    
+    @abstractmethod
+    def _open_writer(self):
+        """Arrow writer encoding into ``self._sink``"""
+        pass
+    
+    def begin(self) -> bytes:
+        self._writer = self._open_writer()
+        return self._sink.drain()
+    
+    def write(self, records: List[AttendeeRecord]) -> bytes:
+        if records:
+            self._writer.write_table(self._to_table(records))
+        return self._sink.drain()
+    
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+    
+    def _to_table(self, records: List[AttendeeRecord]) -> "pa.Table":
+        columns = {
+            "ticket_id": [record.ticket_id for record in records],
+            "ticket_code": [record.ticket_code for record in records],
+            "ticket_status": [record.ticket_status.value for record in records],
+            "booking_id": [record.booking_id for record in records],
+            "booking_status": [record.booking_status.value for record in records],
+            "booking_date": [record.booking_date for record in records],
+            "quantity": [record.quantity for record in records],
+            "total_amount": [record.total_amount.quantize(_CENTS) for record in records],
+            "user_id": [record.user_id for record in records],
+            "user_name": [record.user_name for record in records],
+            "user_phone": [record.user_phone for record in records]
+        }
+        return pa.Table.from_pydict(columns, schema=self._schema)
+
+
+class ParquetExportWriter(_ArrowExportWriter):
+    """Parquet file with one row group per exported chunk"""
+    
+    @property
+    def media_type(self) -> str:
+        return "application/vnd.apache.parquet"
+    
+    @property
+    def file_extension(self) -> str:
+        return "parquet"
+    
+    def _open_writer(self):
+        return pq.ParquetWriter(self._sink, self._schema, compression="snappy")
+
+
+class ArrowExportWriter(_ArrowExportWriter):
+    """Arrow IPC stream with one record batch per exported chunk"""
+    
+    @property
+    def media_type(self) -> str:
+        return "application/vnd.apache.arrow.stream"
+    
+    @property
+    def file_extension(self) -> str:
+        return "arrows"
+    
+    def _open_writer(self):
+        return pa_ipc.new_stream(self._sink, self._schema)
@@ -0,0 +1,62 @@
+"""
+CSV encoding for attendee exports
+"""
+
+import csv
+import io
+from typing import List
+from ...application.interfaces.export_writer import ExportWriter
+from ...domain.entities.attendee import AttendeeRecord
+
+ATTENDEE_COLUMNS = [
+    "ticket_id", "ticket_code", "ticket_status", "booking_id", "booking_status",
+    "booking_date", "quantity", "total_amount", "user_id", "user_name", "user_phone"
+]
+
+
+class CsvExportWriter(ExportWriter):
+    """One CSV row per ticket, UTF-8 encoded"""
+    
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+    
+    @property
+    def media_type(self) -> str:
+        return "text/csv"
+    
+    @property
+    def file_extension(self) -> str:
+        return "csv"
+    
+    def begin(self) -> bytes:
+        self._writer.writerow(ATTENDEE_COLUMNS)
+        return self._drain()
+    
+    def write(self, records: List[AttendeeRecord]) -> bytes:
+        self._writer.writerows(
+            [
+                record.ticket_id,
+                record.ticket_code,
+                record.ticket_status.value,
+                record.booking_id,
+                record.booking_status.value,
+                record.booking_date.isoformat(),
+                record.quantity,
+                f"{record.total_amount:.2f}",
+                record.user_id,
+                record.user_name,
+                record.user_phone
+            ]
+            for record in records
+        )
+        return self._drain()
+    
+    def finish(self) -> bytes:
+        return b""
+    
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
@@ -0,0 +1,5 @@
+from .availability_hub import InProcessAvailabilityHub
+
+__all__ = [
+    "InProcessAvailabilityHub"
+]
@@ -0,0 +1,98 @@
+"""
+In-process pub/sub hub for live availability updates
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Set
+from ...application.dtos.event_dto import EventAvailabilityDTO
+from ...application.interfaces.availability_hub import AvailabilityHub, AvailabilitySubscription
+
+
+class InProcessAvailabilitySubscription(AvailabilitySubscription):
+    """Subscription that keeps only the latest pending availability per event,
+    so a slow client never holds more than one update per subscribed event"""
+    
+    def __init__(self, hub: "InProcessAvailabilityHub", event_ids: Set[int]):
+        self._hub = hub
+        self.event_ids = event_ids
+        self._pending: Dict[int, EventAvailabilityDTO] = {}
+        self._signal = asyncio.Event()
+        self._closed = False
+    
+    def deliver(self, availability: EventAvailabilityDTO) -> None:
+        """Queue an update, replacing any undelivered one for the same event"""
+        self._pending[availability.event_id] = availability
+        self._signal.set()
+    
+    async def wait(self, timeout: float) -> List[EventAvailabilityDTO]:
+        """Wait for changes; returns the latest availability per changed event,
+        or an empty list when ``timeout`` seconds pass without changes"""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._signal.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        
+        updates = list(self._pending.values())
+        self._pending.clear()
+        self._signal.clear()
+        return updates
+    
+    def close(self) -> None:
+        """Stop receiving changes"""
+        if not self._closed:
+            self._closed = True
+            self._hub.unsubscribe(self)
+
+
+class InProcessAvailabilityHub(AvailabilityHub):
+    """Fan-out of availability changes to subscribers in this process"""
+    
+    def __init__(self, max_subscribers: int = 20_000, max_events_per_subscription: int = 500):
+        self._max_subscribers = max_subscribers
+        self._max_events_per_subscription = max_events_per_subscription
+        self._subscribers: Dict[int, Set[InProcessAvailabilitySubscription]] = {}
+        self._subscription_count = 0
+    
+    @property
+    def subscription_count(self) -> int:
+        """Number of open subscriptions"""
+        return self._subscription_count
+    
+    def subscribe(self, event_ids: Iterable[int]) -> AvailabilitySubscription:
+        """Subscribe to availability changes of the given events"""
+        unique_ids = set(event_ids)
+        if not unique_ids:
+            raise ValueError("At least one event ID is required")
+        if len(unique_ids) > self._max_events_per_subscription:
+            raise ValueError(
+                f"Too many events in one subscription (max {self._max_events_per_subscription})"
+            )
+        if self._subscription_count >= self._max_subscribers:
+            raise ValueError("Too many live availability subscribers")
+        
+        subscription = InProcessAvailabilitySubscription(self, unique_ids)
+        for event_id in unique_ids:
+            self._subscribers.setdefault(event_id, set()).add(subscription)
+        self._subscription_count += 1
+        return subscription
+    
+    def unsubscribe(self, subscription: InProcessAvailabilitySubscription) -> None:
+        """Remove a subscription from all of its events"""
+        for event_id in subscription.event_ids:
+            subscribers = self._subscribers.get(event_id)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[event_id]
+        self._subscription_count -= 1
+    
+    def has_subscribers(self, event_id: int) -> bool:
+        """Check whether anyone listens to changes of an event"""
+        return event_id in self._subscribers
+    
+    def publish(self, availability: EventAvailabilityDTO) -> None:
+        """Deliver new availability to the event's subscribers"""
+        for subscription in self._subscribers.get(availability.event_id, ()):
+            subscription.deliver(availability)
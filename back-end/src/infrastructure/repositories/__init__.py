@@ -1,11 +1,15 @@
 from .user_repository_impl import UserRepositoryImpl
 from .event_repository_impl import EventRepositoryImpl
+from .cached_event_repository import CachedEventRepository
 from .booking_repository_impl import BookingRepositoryImpl
 from .ticket_repository_impl import TicketRepositoryImpl
+from .sales_rollup_repository_impl import SalesRollupRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
     "EventRepositoryImpl",
+    "CachedEventRepository",
     "BookingRepositoryImpl", 
-    "TicketRepositoryImpl"
+    "TicketRepositoryImpl",
+    "SalesRollupRepositoryImpl"
 ]
@@ -1,23 +1,71 @@
-from typing import List, Optional
-from ...domain.entities.booking import Booking, BookingStatus
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional, Sequence
+from tortoise.expressions import F
+from tortoise.functions import Coalesce, Count, Sum
+from tortoise.transactions import in_transaction
+from ...domain.entities.booking import Booking, BookingStatus, BookingGroupBy, BookingAggregate
+from ...domain.entities.booking_details import BookingDetails
+from ...domain.entities.user import User
+from ...domain.entities.event import Event
+from ...domain.entities.ticket import Ticket
 from ...domain.repositories.booking_repository import BookingRepository
 from ..database.models.booking_model import BookingModel
+from ..database.models.event_model import EventModel
+from ..database.batch_loader import BatchLoader, RowsById
+from ..database.fast_path import FastQuery
+from ..database.functions import Date
+from ..database.identity_map import forget, lookup, remember
+from ..database.raw_sql import get_connection
+
+
+class EventStatsMode(str, Enum):
+    """Who keeps events.total_tickets_sold/total_revenue/total_bookings up to date"""
+    # The update_event_stats trigger of migrations 003 and 009
+    TRIGGER = "trigger"
+    # This repository, in the transaction of each booking write
+    APP = "app"
+    # TRIGGER on PostgreSQL, APP on databases that cannot have the trigger (SQLite)
+    AUTO = "auto"
 
 
 class BookingRepositoryImpl(BookingRepository):
     """Tortoise ORM implementation of BookingRepository"""
     
+    # Columns of the rows _row_to_booking maps, in order
+    _ROW_COLUMNS = ("id", "user_id", "event_id", "quantity", "total_amount", "booking_date", "status")
+    
+    # Raw fast path for the confirmed bookings of an event
+    _CONFIRMED_BY_EVENT_QUERY = FastQuery(BookingModel, _ROW_COLUMNS, '"event_id"=$1 AND "status"=$2')
+    
+    def __init__(
+        self,
+        event_stats_mode: EventStatsMode = EventStatsMode.AUTO,
+        fast_path: bool = False,
+        batch_loading: bool = False
+    ):
+        self._event_stats_mode = EventStatsMode(event_stats_mode)
+        self._fast_path = fast_path
+        # Concurrent get_by_id calls share one query per event-loop tick
+        self._loader = BatchLoader(RowsById(BookingModel, self._ROW_COLUMNS)) if batch_loading else None
+    
     async def create(self, booking: Booking) -> Booking:
         """Create a new booking"""
-        booking_model = await BookingModel.create(
-            user_id=booking.user_id,
-            event_id=booking.event_id,
-            quantity=booking.quantity,
-            total_amount=booking.total_amount,
-            status=booking.status
-        )
+        async with in_transaction("default"):
+            booking_model = await BookingModel.create(
+                user_id=booking.user_id,
+                event_id=booking.event_id,
+                quantity=booking.quantity,
+                total_amount=booking.total_amount,
+                status=booking.status
+            )
+            if booking_model.status == BookingStatus.CONFIRMED:
+                await self._add_to_event_stats(
+                    booking_model.event_id, booking_model.quantity, booking_model.total_amount, 1
+                )
         
-        return Booking(
+        return remember(Booking.from_row(
             id=booking_model.id,
             user_id=booking_model.user_id,
             event_id=booking_model.event_id,
@@ -25,15 +73,36 @@ class BookingRepositoryImpl(BookingRepository):
             total_amount=booking_model.total_amount,
             booking_date=booking_model.booking_date,
             status=booking_model.status
+        ))
+    
+    @staticmethod
+    def _row_to_booking(row: Sequence) -> Booking:
+        """Booking from a row in ``_ROW_COLUMNS`` order"""
+        return Booking.from_row(
+            id=row[0],
+            user_id=row[1],
+            event_id=row[2],
+            quantity=row[3],
+            total_amount=row[4],
+            booking_date=row[5],
+            status=BookingStatus(row[6])
         )
     
     async def get_by_id(self, booking_id: int) -> Optional[Booking]:
         """Get booking by ID"""
+        cached = lookup(Booking, booking_id)
+        if cached is not None:
+            return cached
+        
+        if self._loader is not None:
+            row = await self._loader.load(booking_id)
+            return remember(self._row_to_booking(row)) if row else None
+        
         booking_model = await BookingModel.get_or_none(id=booking_id)
         if not booking_model:
             return None
         
-        return Booking(
+        return remember(Booking.from_row(
             id=booking_model.id,
             user_id=booking_model.user_id,
             event_id=booking_model.event_id,
@@ -41,14 +110,14 @@ class BookingRepositoryImpl(BookingRepository):
             total_amount=booking_model.total_amount,
             booking_date=booking_model.booking_date,
             status=booking_model.status
-        )
+        ))
     
     async def get_all(self) -> List[Booking]:
         """Get all bookings"""
         booking_models = await BookingModel.all()
         
         return [
-            Booking(
+            Booking.from_row(
                 id=booking_model.id,
                 user_id=booking_model.user_id,
                 event_id=booking_model.event_id,
@@ -65,7 +134,7 @@ class BookingRepositoryImpl(BookingRepository):
         booking_models = await BookingModel.filter(user_id=user_id).all()
         
         return [
-            Booking(
+            Booking.from_row(
                 id=booking_model.id,
                 user_id=booking_model.user_id,
                 event_id=booking_model.event_id,
@@ -82,7 +151,7 @@ class BookingRepositoryImpl(BookingRepository):
         booking_models = await BookingModel.filter(event_id=event_id).all()
         
         return [
-            Booking(
+            Booking.from_row(
                 id=booking_model.id,
                 user_id=booking_model.user_id,
                 event_id=booking_model.event_id,
@@ -96,13 +165,17 @@ class BookingRepositoryImpl(BookingRepository):
     
     async def get_confirmed_bookings_for_event(self, event_id: int) -> List[Booking]:
         """Get confirmed bookings for an event"""
+        if self._fast_path:
+            rows = await self._CONFIRMED_BY_EVENT_QUERY.fetch(event_id, BookingStatus.CONFIRMED.value)
+            return [self._row_to_booking(row) for row in rows]
+        
         booking_models = await BookingModel.filter(
             event_id=event_id, 
             status=BookingStatus.CONFIRMED
         ).all()
         
         return [
-            Booking(
+            Booking.from_row(
                 id=booking_model.id,
                 user_id=booking_model.user_id,
                 event_id=booking_model.event_id,
@@ -114,15 +187,135 @@ class BookingRepositoryImpl(BookingRepository):
             for booking_model in booking_models
         ]
     
+    async def get_details_by_id(self, booking_id: int) -> Optional[BookingDetails]:
+        """Get booking by ID together with its user, event and tickets"""
+        booking_models = await (
+            BookingModel.filter(id=booking_id)
+            .select_related("user", "event")
+            .prefetch_related("tickets")
+        )
+        if not booking_models:
+            return None
+        
+        return self._to_details(booking_models[0])
+    
+    async def get_details_by_user_id(self, user_id: int) -> List[BookingDetails]:
+        """Get bookings by user ID together with their users, events and tickets"""
+        booking_models = await (
+            BookingModel.filter(user_id=user_id)
+            .select_related("user", "event")
+            .prefetch_related("tickets")
+        )
+        
+        return [self._to_details(booking_model) for booking_model in booking_models]
+    
+    async def get_details_by_event_id(self, event_id: int) -> List[BookingDetails]:
+        """Get bookings by event ID together with their users, events and tickets"""
+        booking_models = await (
+            BookingModel.filter(event_id=event_id)
+            .select_related("user", "event")
+            .prefetch_related("tickets")
+        )
+        
+        return [self._to_details(booking_model) for booking_model in booking_models]
+    
+    async def get_details_page_by_event_id(
+        self,
+        event_id: int,
+        limit: int,
+        after_id: Optional[int] = None
+    ) -> List[BookingDetails]:
+        """Get up to ``limit`` bookings of an event with users, events and tickets,
+        ordered by ID and starting after booking ``after_id`` (keyset pagination)"""
+        queryset = BookingModel.filter(event_id=event_id)
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        
+        booking_models = await (
+            queryset.order_by("id")
+            .limit(limit)
+            .select_related("user", "event")
+            .prefetch_related("tickets")
+        )
+        
+        return [self._to_details(booking_model) for booking_model in booking_models]
+    
+    @staticmethod
+    def _to_details(booking_model: BookingModel) -> BookingDetails:
+        """Map a booking model with joined user/event and prefetched tickets to the aggregate
+        
+        Bookings of the same user or event share one entity per request.
+        """
+        user_model = booking_model.user
+        event_model = booking_model.event
+        user = lookup(User, user_model.id) or remember(User.from_row(
+            id=user_model.id,
+            name=user_model.name,
+            phone=user_model.phone,
+            role=user_model.role
+        ))
+        event = lookup(Event, event_model.id) or remember(Event.from_row(
+            id=event_model.id,
+            title=event_model.title,
+            description=event_model.description,
+            venue=event_model.venue,
+            date_time=event_model.date_time,
+            capacity=event_model.capacity,
+            price=event_model.price,
+            status=event_model.status,
+            created_at=event_model.created_at,
+            total_tickets_sold=event_model.total_tickets_sold,
+            total_revenue=event_model.total_revenue,
+            total_bookings=event_model.total_bookings
+        ))
+        
+        return BookingDetails(
+            booking=Booking.from_row(
+                id=booking_model.id,
+                user_id=booking_model.user_id,
+                event_id=booking_model.event_id,
+                quantity=booking_model.quantity,
+                total_amount=booking_model.total_amount,
+                booking_date=booking_model.booking_date,
+                status=booking_model.status
+            ),
+            user=user,
+            event=event,
+            tickets=[
+                Ticket.from_row(
+                    id=ticket_model.id,
+                    booking_id=ticket_model.booking_id,
+                    ticket_code=ticket_model.ticket_code,
+                    status=ticket_model.status
+                )
+                for ticket_model in sorted(booking_model.tickets, key=lambda t: t.id)
+            ]
+        )
+    
     async def update(self, booking: Booking) -> Booking:
         """Update existing booking"""
-        booking_model = await BookingModel.get(id=booking.id)
-        booking_model.quantity = booking.quantity
-        booking_model.total_amount = booking.total_amount
-        booking_model.status = booking.status
-        await booking_model.save()
+        async with in_transaction("default"):
+            # Row lock: two concurrent cancellations cannot both subtract the same booking
+            booking_model = await BookingModel.select_for_update().get(id=booking.id)
+            was_confirmed = booking_model.status == BookingStatus.CONFIRMED
+            old_quantity = booking_model.quantity
+            old_amount = booking_model.total_amount
+            
+            booking_model.quantity = booking.quantity
+            booking_model.total_amount = booking.total_amount
+            booking_model.status = booking.status
+            await booking_model.save()
+            
+            # Counters cover confirmed bookings: take the old version out, put the new one in
+            is_confirmed = booking_model.status == BookingStatus.CONFIRMED
+            await self._add_to_event_stats(
+                booking_model.event_id,
+                (booking_model.quantity if is_confirmed else 0) - (old_quantity if was_confirmed else 0),
+                (booking_model.total_amount if is_confirmed else 0) - (old_amount if was_confirmed else 0),
+                int(is_confirmed) - int(was_confirmed)
+            )
         
-        return Booking(
+        return remember(Booking.from_row(
             id=booking_model.id,
             user_id=booking_model.user_id,
             event_id=booking_model.event_id,
@@ -130,18 +323,117 @@ class BookingRepositoryImpl(BookingRepository):
             total_amount=booking_model.total_amount,
             booking_date=booking_model.booking_date,
             status=booking_model.status
-        )
+        ))
     
     async def delete(self, booking_id: int) -> bool:
         """Delete booking by ID"""
-        booking_model = await BookingModel.get_or_none(id=booking_id)
-        if not booking_model:
-            return False
-        
-        await booking_model.delete()
+        async with in_transaction("default"):
+            booking_model = await BookingModel.select_for_update().get_or_none(id=booking_id)
+            if not booking_model:
+                return False
+            
+            await booking_model.delete()
+            forget(Booking, booking_id)
+            if booking_model.status == BookingStatus.CONFIRMED:
+                await self._add_to_event_stats(
+                    booking_model.event_id, -booking_model.quantity, -booking_model.total_amount, -1
+                )
         return True
     
+    def _maintains_event_stats(self) -> bool:
+        """Whether this repository, rather than the database trigger, updates event counters"""
+        if self._event_stats_mode == EventStatsMode.AUTO:
+            return get_connection().capabilities.dialect != "postgres"
+        return self._event_stats_mode == EventStatsMode.APP
+    
+    async def _add_to_event_stats(self, event_id: int, tickets: int, revenue: Decimal, bookings: int) -> None:
+        """Apply a change to the event's counters in the current transaction (APP mode only)"""
+        # The counters change here or in the trigger; a copy loaded earlier in the request is stale
+        forget(Event, event_id)
+        if not self._maintains_event_stats() or not (tickets or revenue or bookings):
+            return
+        
+        # Relative UPDATE: concurrent bookings never overwrite each other's increments
+        await EventModel.filter(id=event_id).update(
+            total_tickets_sold=F("total_tickets_sold") + tickets,
+            total_revenue=F("total_revenue") + revenue,
+            total_bookings=F("total_bookings") + bookings
+        )
+    
     async def get_total_booked_quantity_for_event(self, event_id: int) -> int:
         """Get total booked quantity for an event"""
-        confirmed_bookings = await self.get_confirmed_bookings_for_event(event_id)
-        return sum(booking.quantity for booking in confirmed_bookings)
+        aggregates = await self.aggregate(event_id=event_id, status=BookingStatus.CONFIRMED)
+        return aggregates[0].total_quantity
+    
+    async def get_event_ids_changed_since(self, since: datetime) -> List[int]:
+        """Get the IDs of events with bookings created or updated at or after ``since``"""
+        event_ids = await (
+            BookingModel.filter(updated_at__gte=since)
+            .distinct()
+            .values_list("event_id", flat=True)
+        )
+        return sorted(event_ids)
+    
+    # Column each grouping key is selected and grouped by
+    _GROUP_BY_COLUMNS = {
+        BookingGroupBy.EVENT: "event_id",
+        BookingGroupBy.STATUS: "status",
+        BookingGroupBy.DAY: "day",
+    }
+    
+    async def aggregate(
+        self,
+        event_id: Optional[int] = None,
+        status: Optional[BookingStatus] = None,
+        group_by: Sequence[BookingGroupBy] = (),
+        event_ids: Optional[Sequence[int]] = None
+    ) -> List[BookingAggregate]:
+        """Sum quantities and amounts and count bookings in the database
+        
+        Without ``group_by`` exactly one aggregate is returned (zeros when nothing
+        matches); otherwise one aggregate per group. ``event_ids`` restricts the
+        bookings to several events at once.
+        """
+        queryset = BookingModel.all()
+        if event_id is not None:
+            queryset = queryset.filter(event_id=event_id)
+        if event_ids is not None:
+            queryset = queryset.filter(event_id__in=list(event_ids))
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        
+        queryset = queryset.annotate(
+            total_quantity=Coalesce(Sum("quantity"), 0),
+            total_amount=Coalesce(Sum("total_amount"), 0),
+            booking_count=Count("id")
+        )
+        
+        group_columns = [self._GROUP_BY_COLUMNS[BookingGroupBy(key)] for key in group_by]
+        if BookingGroupBy.DAY in group_by:
+            queryset = queryset.annotate(day=Date("booking_date"))
+        if group_columns:
+            queryset = queryset.group_by(*group_columns)
+        
+        rows = await queryset.values(
+            *group_columns, "total_quantity", "total_amount", "booking_count"
+        )
+        
+        return [
+            BookingAggregate(
+                total_quantity=int(row["total_quantity"]),
+                # SQLite returns SUM over decimals as float
+                total_amount=Decimal(str(row["total_amount"])).quantize(Decimal("0.01")),
+                booking_count=row["booking_count"],
+                event_id=row.get("event_id"),
+                status=BookingStatus(row["status"]) if row.get("status") else None,
+                day=self._to_date(row.get("day"))
+            )
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _to_date(value) -> Optional[date]:
+        """Normalise DATE() results (date on PostgreSQL, ISO string on SQLite)"""
+        if value is None or isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value))
@@ -0,0 +1,211 @@
+from copy import copy
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from ...application.interfaces.cache import Cache, CacheStats
+from ...domain.entities.event import Event, EventStatus, EventFilter, EventStatistics
+from ...domain.repositories.event_repository import EventRepository
+from ..cache.version_stamps import VersionStamps
+from ..database.identity_map import lookup, remember
+from ..database.routing import inside_transaction
+
+
+class CachedEventRepository(EventRepository):
+    """EventRepository decorator serving the event catalog and availability from a cache
+    
+    Events by ID, the event list and event availability are cached under
+    version stamps (see VersionStamps):
+    - ``event:<id>``: the event's fields and booking counters, replaced by
+      event updates and by bookings of the event
+    - ``catalog``: which events exist and their fields, replaced by event
+      creates, updates and deletes
+    - ``counters``: booking counters of any event, replaced by every booking
+    
+    get_all and the availability of all active events carry the counters of
+    every event and are stamped with both catalog and counters. Filtered
+    listings and their counts are stamped with the catalog only, so they stay
+    cached through an on-sale; the counters of their events may be up to a
+    TTL old.
+    Reads inside a transaction and row-locking reads go to the wrapped
+    repository, so uncommitted rows are never cached.
+    """
+    
+    def __init__(self, repository: EventRepository, cache: Cache):
+        self._repository = repository
+        self._cache = cache
+        self._versions = VersionStamps(cache)
+    
+    def get_cache_stats(self) -> CacheStats:
+        """Get hit/miss counters of the event cache"""
+        return self._cache.stats()
+    
+    async def create(self, event: Event) -> Event:
+        """Create a new event"""
+        created = await self._repository.create(event)
+        await self._versions.bump("catalog")
+        return created
+    
+    async def get_by_id(self, event_id: int) -> Optional[Event]:
+        """Get event by ID"""
+        loaded = lookup(Event, event_id)
+        if loaded is not None:
+            return loaded
+        if inside_transaction():
+            return await self._repository.get_by_id(event_id)
+        
+        key = f"event:{event_id}@{await self._versions.current(f'event:{event_id}')}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            # Callers modify events before updating them: never hand out the cached instance.
+            # copy(), not replace(): persisted rows (e.g. free events) skip input validation
+            return remember(copy(cached))
+        
+        event = await self._repository.get_by_id(event_id)
+        if event is not None:
+            await self._cache.set(key, copy(event))
+        return event
+    
+    async def get_by_id_for_update(self, event_id: int) -> Optional[Event]:
+        """Get event by ID and lock its row until the current transaction ends"""
+        return await self._repository.get_by_id_for_update(event_id)
+    
+    async def get_all(self) -> List[Event]:
+        """Get all events"""
+        if inside_transaction():
+            return await self._repository.get_all()
+        
+        key = f"events@{await self._versions.current('catalog')}.{await self._versions.current('counters')}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return [copy(event) for event in cached]
+        
+        events = await self._repository.get_all()
+        await self._cache.set(key, [copy(event) for event in events])
+        return events
+    
+    async def get_filtered(
+        self,
+        filters: EventFilter,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Event]:
+        """Get events matching ``filters`` ordered by (date_time, id)"""
+        if inside_transaction():
+            return await self._repository.get_filtered(filters, limit, after)
+        
+        key = f"events:{self._filter_key(filters)}:{limit}:{after!r}@{await self._versions.current('catalog')}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return [copy(event) for event in cached]
+        
+        events = await self._repository.get_filtered(filters, limit, after)
+        await self._cache.set(key, [copy(event) for event in events])
+        return events
+    
+    async def count_filtered(self, filters: EventFilter) -> int:
+        """Count events matching ``filters``"""
+        if inside_transaction():
+            return await self._repository.count_filtered(filters)
+        
+        key = f"events-count:{self._filter_key(filters)}@{await self._versions.current('catalog')}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        count = await self._repository.count_filtered(filters)
+        await self._cache.set(key, count)
+        return count
+    
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[EventStatus] = None
+    ) -> List[Event]:
+        """Search title, venue and description, best matches first"""
+        return await self._repository.search(query, limit, status)
+    
+    async def get_ids(self) -> List[int]:
+        """Get the IDs of all events in ascending order"""
+        return await self._repository.get_ids()
+    
+    async def get_statistics_for_update(self, event_ids: Sequence[int]) -> Dict[int, EventStatistics]:
+        """Get the stored booking counters of the given events and lock their rows"""
+        return await self._repository.get_statistics_for_update(event_ids)
+    
+    async def update_statistics(self, statistics: Sequence[EventStatistics]) -> None:
+        """Overwrite the stored booking counters of the given events"""
+        await self._repository.update_statistics(statistics)
+        await self._versions.bump(*(f"event:{stats.event_id}" for stats in statistics), "counters")
+    
+    async def get_by_status(self, status: EventStatus) -> List[Event]:
+        """Get events by status"""
+        return await self._repository.get_by_status(status)
+    
+    async def update(self, event: Event) -> Event:
+        """Update existing event"""
+        updated = await self._repository.update(event)
+        await self._versions.bump(f"event:{event.id}", "catalog")
+        return updated
+    
+    async def delete(self, event_id: int) -> bool:
+        """Delete event by ID"""
+        deleted = await self._repository.delete(event_id)
+        if deleted:
+            await self._versions.bump(f"event:{event_id}", "catalog")
+        return deleted
+    
+    async def get_active_events(self) -> List[Event]:
+        """Get all active events"""
+        return await self._repository.get_active_events()
+    
+    async def get_all_active(self) -> List[Event]:
+        """Get all active events (alias for compatibility)"""
+        return await self._repository.get_all_active()
+    
+    async def get_availability_by_ids(self, event_ids: List[int]) -> Dict[int, Event]:
+        """Get events with confirmed booked quantities by IDs, keyed by event ID"""
+        if inside_transaction():
+            return await self._repository.get_availability_by_ids(event_ids)
+        
+        events = {}
+        missing_keys = {}
+        for event_id in dict.fromkeys(event_ids):
+            key = f"availability:{event_id}@{await self._versions.current(f'event:{event_id}')}"
+            cached = await self._cache.get(key)
+            if cached is not None:
+                events[event_id] = copy(cached)
+            else:
+                missing_keys[event_id] = key
+        
+        if missing_keys:
+            loaded = await self._repository.get_availability_by_ids(list(missing_keys))
+            for event_id, event in loaded.items():
+                await self._cache.set(missing_keys[event_id], copy(event))
+            events.update(loaded)
+        
+        return events
+    
+    async def get_active_availability(self) -> Dict[int, Event]:
+        """Get all active events with confirmed booked quantities, keyed by event ID"""
+        if inside_transaction():
+            return await self._repository.get_active_availability()
+        
+        stamp = f"{await self._versions.current('catalog')}.{await self._versions.current('counters')}"
+        key = f"active-availability@{stamp}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return {event_id: copy(event) for event_id, event in cached.items()}
+        
+        events = await self._repository.get_active_availability()
+        await self._cache.set(key, {event_id: copy(event) for event_id, event in events.items()})
+        return events
+    
+    async def mark_bookings_changed(self, event_id: int) -> None:
+        """Replace the stamps of the event's counters after its bookings changed"""
+        await self._repository.mark_bookings_changed(event_id)
+        await self._versions.bump(f"event:{event_id}", "counters")
+    
+    @staticmethod
+    def _filter_key(filters: EventFilter) -> str:
+        """The same string in every process for equal filters"""
+        return repr((filters.status, filters.venue, filters.date_from, filters.date_to))
@@ -1,12 +1,61 @@
-from typing import List, Optional
-from ...domain.entities.event import Event, EventStatus
+import logging
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from tortoise.exceptions import DoesNotExist
+from tortoise.expressions import Q
+from tortoise.functions import Coalesce, Sum
+from tortoise.queryset import QuerySet
+from ...domain.entities.event import Event, EventStatus, EventFilter, EventStatistics
+from ...domain.entities.booking import BookingStatus
 from ...domain.repositories.event_repository import EventRepository
 from ..database.models.event_model import EventModel
+from ..database.batch_loader import BatchLoader, RowsById
+from ..database.fast_path import FastQuery
+from ..database.identity_map import forget, lookup, remember
+from ..database.raw_sql import get_connection
+from ..search.event_search_index import InMemoryEventSearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class EventRepositoryImpl(EventRepository):
     """Tortoise ORM implementation of EventRepository"""
     
+    # Raw fast path for the event lookup behind every booking and availability check
+    _BY_ID_QUERY = FastQuery(
+        EventModel,
+        (
+            "id", "title", "description", "venue", "date_time", "capacity", "price",
+            "status", "created_at", "total_tickets_sold", "total_revenue", "total_bookings"
+        ),
+        '"id"=$1'
+    )
+    
+    # Whether migration 006 added what PostgreSQL search queries
+    _POSTGRES_SEARCH_CHECK = """
+        SELECT EXISTS (
+                   SELECT 1 FROM information_schema.columns
+                   WHERE table_schema = current_schema() AND table_name = 'events'
+                     AND column_name = 'search_vector'
+               ) AS "has_search_vector",
+               EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') AS "has_pg_trgm"
+    """
+    
+    def __init__(
+        self,
+        search_index: Optional[InMemoryEventSearchIndex] = None,
+        fast_path: bool = False,
+        batch_loading: bool = False
+    ):
+        # Only used when the database has no full-text search (SQLite, or PostgreSQL without migration 006)
+        self._search_index = search_index or InMemoryEventSearchIndex()
+        # Checked on the first search against PostgreSQL
+        self._has_postgres_search: Optional[bool] = None
+        self._fast_path = fast_path
+        # Concurrent get_by_id calls share one query per event-loop tick
+        self._loader = BatchLoader(RowsById(EventModel, self._BY_ID_QUERY.columns)) if batch_loading else None
+    
     async def create(self, event: Event) -> Event:
         """Create a new event"""
         event_model = await EventModel.create(
@@ -18,8 +67,9 @@ class EventRepositoryImpl(EventRepository):
             price=event.price,
             status=event.status
         )
+        self._index_for_search(event_model)
         
-        return Event(
+        return Event.from_row(
             id=event_model.id,
             title=event_model.title,
             description=event_model.description,
@@ -31,13 +81,43 @@ class EventRepositoryImpl(EventRepository):
             created_at=event_model.created_at
         )
     
+    @staticmethod
+    def _row_to_event(row: Sequence) -> Event:
+        """Event from a row in ``_BY_ID_QUERY.columns`` order"""
+        return Event.from_row(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            venue=row[3],
+            date_time=row[4],
+            capacity=row[5],
+            price=row[6],
+            status=EventStatus(row[7]),
+            created_at=row[8],
+            total_tickets_sold=row[9],
+            total_revenue=row[10],
+            total_bookings=row[11]
+        )
+    
     async def get_by_id(self, event_id: int) -> Optional[Event]:
         """Get event by ID"""
+        cached = lookup(Event, event_id)
+        if cached is not None:
+            return cached
+        
+        if self._loader is not None:
+            row = await self._loader.load(event_id)
+            return remember(self._row_to_event(row)) if row else None
+        
+        if self._fast_path:
+            row = await self._BY_ID_QUERY.fetch_one(event_id)
+            return remember(self._row_to_event(row)) if row else None
+        
         event_model = await EventModel.get_or_none(id=event_id)
         if not event_model:
             return None
 
-        return Event(
+        return remember(Event.from_row(
             id=event_model.id,
             title=event_model.title,
             description=event_model.description,
@@ -50,14 +130,37 @@ class EventRepositoryImpl(EventRepository):
             total_tickets_sold=event_model.total_tickets_sold,
             total_revenue=event_model.total_revenue,
             total_bookings=event_model.total_bookings
-        )
+        ))
+    
+    async def get_by_id_for_update(self, event_id: int) -> Optional[Event]:
+        """Get event by ID and lock its row until the current transaction ends"""
+        # SELECT ... FOR UPDATE serialises concurrent reservations for the same event;
+        # backends without row locks (SQLite) already serialise write transactions
+        event_model = await EventModel.select_for_update().get_or_none(id=event_id)
+        if not event_model:
+            return None
+
+        return remember(Event.from_row(
+            id=event_model.id,
+            title=event_model.title,
+            description=event_model.description,
+            venue=event_model.venue,
+            date_time=event_model.date_time,
+            capacity=event_model.capacity,
+            price=event_model.price,
+            status=event_model.status,
+            created_at=event_model.created_at,
+            total_tickets_sold=event_model.total_tickets_sold,
+            total_revenue=event_model.total_revenue,
+            total_bookings=event_model.total_bookings
+        ))
     
     async def get_all(self) -> List[Event]:
         """Get all events"""
         event_models = await EventModel.all()
         
         return [
-            Event(
+            Event.from_row(
                 id=event_model.id,
                 title=event_model.title,
                 description=event_model.description,
@@ -74,12 +177,244 @@ class EventRepositoryImpl(EventRepository):
             for event_model in event_models
         ]
     
+    async def get_filtered(
+        self,
+        filters: EventFilter,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Event]:
+        """Get events matching ``filters`` ordered by (date_time, id)
+        
+        ``after`` is the (date_time, id) of the last event of the previous page;
+        only events strictly after it are returned (keyset pagination).
+        """
+        queryset = self._apply_filter(EventModel.all(), filters)
+        
+        if after is not None:
+            # Seek past the previous page on the (date_time, id) index instead of OFFSET
+            after_date_time, after_id = after
+            queryset = queryset.filter(
+                Q(date_time__gt=after_date_time)
+                | Q(date_time=after_date_time, id__gt=after_id)
+            )
+        
+        queryset = queryset.order_by("date_time", "id")
+        if limit is not None:
+            queryset = queryset.limit(limit)
+        
+        event_models = await queryset
+        
+        return [
+            Event.from_row(
+                id=event_model.id,
+                title=event_model.title,
+                description=event_model.description,
+                venue=event_model.venue,
+                date_time=event_model.date_time,
+                capacity=event_model.capacity,
+                price=event_model.price,
+                status=event_model.status,
+                created_at=event_model.created_at,
+                total_tickets_sold=event_model.total_tickets_sold,
+                total_revenue=event_model.total_revenue,
+                total_bookings=event_model.total_bookings
+            )
+            for event_model in event_models
+        ]
+    
+    async def count_filtered(self, filters: EventFilter) -> int:
+        """Count events matching ``filters``"""
+        return await self._apply_filter(EventModel.all(), filters).count()
+    
+    @staticmethod
+    def _apply_filter(queryset: QuerySet[EventModel], filters: EventFilter) -> QuerySet[EventModel]:
+        """Restrict a queryset with equality/range predicates the event indexes can serve"""
+        if filters.status is not None:
+            queryset = queryset.filter(status=filters.status)
+        if filters.venue is not None:
+            queryset = queryset.filter(venue=filters.venue)
+        if filters.date_from is not None:
+            queryset = queryset.filter(date_time__gte=filters.date_from)
+        if filters.date_to is not None:
+            queryset = queryset.filter(date_time__lte=filters.date_to)
+        return queryset
+    
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        status: Optional[EventStatus] = None
+    ) -> List[Event]:
+        """Search title, venue and description, best matches first
+        
+        Matching tolerates typos; title matches rank above venue matches,
+        which rank above description matches.
+        """
+        connection = get_connection()
+        if connection.capabilities.dialect == "postgres" and await self._postgres_search_available():
+            return await self._search_postgres(query, limit, status)
+        return await self._search_in_process(query, limit, status)
+    
+    async def _postgres_search_available(self) -> bool:
+        """Whether the database has the search_vector column and pg_trgm of migration 006
+        
+        Checked once per repository; without them every PostgreSQL search would
+        fail, so searches use the in-process index until the process restarts.
+        """
+        if self._has_postgres_search is None:
+            rows = await get_connection().execute_query_dict(self._POSTGRES_SEARCH_CHECK)
+            self._has_postgres_search = bool(rows[0]["has_search_vector"] and rows[0]["has_pg_trgm"])
+            if not self._has_postgres_search:
+                logger.warning(
+                    "events.search_vector or the pg_trgm extension is missing (apply migrations/006_event_search.sql);"
+                    " searching events with the in-process index instead"
+                )
+        return self._has_postgres_search
+    
+    async def _search_postgres(
+        self,
+        query: str,
+        limit: int,
+        status: Optional[EventStatus]
+    ) -> List[Event]:
+        """Rank with the search_vector GIN index and pg_trgm similarity (migration 006)"""
+        status_clause = 'AND e."status" = $3' if status is not None else ""
+        sql = f"""
+            SELECT e."id", e."title", e."description", e."venue", e."date_time", e."capacity",
+                   e."price", e."status", e."created_at", e."total_tickets_sold",
+                   e."total_revenue", e."total_bookings"
+            FROM "events" e, websearch_to_tsquery('english', $1) AS q(query)
+            WHERE (e."search_vector" @@ q.query OR e."title" % $1 OR e."venue" % $1)
+            {status_clause}
+            ORDER BY ts_rank_cd(e."search_vector", q.query) + similarity(e."title", $1) DESC,
+                     e."date_time", e."id"
+            LIMIT $2
+        """
+        values = [query, limit] + ([status.value] if status is not None else [])
+        rows = await get_connection().execute_query_dict(sql, values)
+        
+        return [
+            Event.from_row(
+                id=row["id"],
+                title=row["title"],
+                description=row["description"],
+                venue=row["venue"],
+                date_time=row["date_time"],
+                capacity=row["capacity"],
+                price=row["price"],
+                status=EventStatus(row["status"]),
+                created_at=row["created_at"],
+                total_tickets_sold=row["total_tickets_sold"],
+                total_revenue=row["total_revenue"],
+                total_bookings=row["total_bookings"]
+            )
+            for row in rows
+        ]
+    
+    async def _search_in_process(
+        self,
+        query: str,
+        limit: int,
+        status: Optional[EventStatus]
+    ) -> List[Event]:
+        """Rank with the in-process index, loading it from the catalog on first use"""
+        if not self._search_index.is_loaded:
+            self._search_index.load(
+                await EventModel.all().values_list("id", "title", "venue", "description")
+            )
+        
+        ranked_ids = [event_id for event_id, _ in self._search_index.search(query, limit=None)]
+        
+        # Status is not indexed, so read ranked candidates in windows until the page is full
+        events: List[Event] = []
+        window = max(limit * 2, 20)
+        for start in range(0, len(ranked_ids), window):
+            candidate_ids = ranked_ids[start:start + window]
+            queryset = EventModel.filter(id__in=candidate_ids)
+            if status is not None:
+                queryset = queryset.filter(status=status)
+            event_models = {event_model.id: event_model for event_model in await queryset}
+            
+            for event_id in candidate_ids:
+                event_model = event_models.get(event_id)
+                if event_model is None:
+                    continue
+                events.append(Event.from_row(
+                    id=event_model.id,
+                    title=event_model.title,
+                    description=event_model.description,
+                    venue=event_model.venue,
+                    date_time=event_model.date_time,
+                    capacity=event_model.capacity,
+                    price=event_model.price,
+                    status=event_model.status,
+                    created_at=event_model.created_at,
+                    total_tickets_sold=event_model.total_tickets_sold,
+                    total_revenue=event_model.total_revenue,
+                    total_bookings=event_model.total_bookings
+                ))
+                if len(events) == limit:
+                    return events
+        
+        return events
+    
+    def _index_for_search(self, event: Union[EventModel, Event]) -> None:
+        """Keep the in-process search index in step with writes once it is loaded"""
+        if self._search_index.is_loaded:
+            self._search_index.upsert(event.id, event.title, event.venue, event.description)
+    
+    async def get_ids(self) -> List[int]:
+        """Get the IDs of all events in ascending order"""
+        return await EventModel.all().order_by("id").values_list("id", flat=True)
+    
+    async def get_statistics_for_update(self, event_ids: Sequence[int]) -> Dict[int, EventStatistics]:
+        """Get the stored booking counters of the given events, keyed by event ID,
+        and lock their rows until the current transaction ends"""
+        # Locked in ID order so concurrent reconcilers and bookings cannot deadlock
+        rows = await (
+            EventModel.filter(id__in=list(event_ids))
+            .select_for_update()
+            .order_by("id")
+            .values("id", "total_tickets_sold", "total_revenue", "total_bookings")
+        )
+        
+        return {
+            row["id"]: EventStatistics(
+                event_id=row["id"],
+                total_tickets_sold=row["total_tickets_sold"] or 0,
+                total_revenue=Decimal(str(row["total_revenue"] or 0)).quantize(Decimal("0.01")),
+                total_bookings=row["total_bookings"] or 0
+            )
+            for row in rows
+        }
+    
+    async def update_statistics(self, statistics: Sequence[EventStatistics]) -> None:
+        """Overwrite the stored booking counters of the given events"""
+        if not statistics:
+            return
+        
+        # One UPDATE ... CASE statement for the whole batch
+        await EventModel.bulk_update(
+            [
+                EventModel(
+                    id=stats.event_id,
+                    total_tickets_sold=stats.total_tickets_sold,
+                    total_revenue=stats.total_revenue,
+                    total_bookings=stats.total_bookings
+                )
+                for stats in statistics
+            ],
+            fields=["total_tickets_sold", "total_revenue", "total_bookings"]
+        )
+        for stats in statistics:
+            forget(Event, stats.event_id)
+    
     async def get_by_status(self, status: EventStatus) -> List[Event]:
         """Get events by status"""
         event_models = await EventModel.filter(status=status).all()
         
         return [
-            Event(
+            Event.from_row(
                 id=event_model.id,
                 title=event_model.title,
                 description=event_model.description,
@@ -88,33 +423,42 @@ class EventRepositoryImpl(EventRepository):
                 capacity=event_model.capacity,
                 price=event_model.price,
                 status=event_model.status,
-                created_at=event_model.created_at
+                created_at=event_model.created_at,
+                total_tickets_sold=event_model.total_tickets_sold,
+                total_revenue=event_model.total_revenue,
+                total_bookings=event_model.total_bookings
             )
             for event_model in event_models
         ]
     
     async def update(self, event: Event) -> Event:
         """Update existing event"""
-        event_model = await EventModel.get(id=event.id)
-        event_model.title = event.title
-        event_model.description = event.description
-        event_model.venue = event.venue
-        event_model.date_time = event.date_time
-        event_model.capacity = event.capacity
-        event_model.price = event.price
-        event_model.status = event.status
-        await event_model.save()
-        
-        return Event(
-            id=event_model.id,
-            title=event_model.title,
-            description=event_model.description,
-            venue=event_model.venue,
-            date_time=event_model.date_time,
-            capacity=event_model.capacity,
-            price=event_model.price,
-            status=event_model.status,
-            created_at=event_model.created_at
+        # One UPDATE of the editable columns, without reading the row first; the
+        # booking counters are left to the booking writes that maintain them
+        updated_count = await EventModel.filter(id=event.id).update(
+            title=event.title,
+            description=event.description,
+            venue=event.venue,
+            date_time=event.date_time,
+            capacity=event.capacity,
+            price=event.price,
+            status=event.status
+        )
+        if not updated_count:
+            raise DoesNotExist(f"Event {event.id} does not exist")
+        forget(Event, event.id)
+        self._index_for_search(event)
+        
+        return Event.from_row(
+            id=event.id,
+            title=event.title,
+            description=event.description,
+            venue=event.venue,
+            date_time=event.date_time,
+            capacity=event.capacity,
+            price=event.price,
+            status=event.status,
+            created_at=event.created_at
         )
     
     async def delete(self, event_id: int) -> bool:
@@ -124,6 +468,9 @@ class EventRepositoryImpl(EventRepository):
             return False
         
         await event_model.delete()
+        forget(Event, event_id)
+        if self._search_index.is_loaded:
+            self._search_index.remove(event_id)
         return True
     
     async def get_active_events(self) -> List[Event]:
@@ -133,3 +480,50 @@ class EventRepositoryImpl(EventRepository):
     async def get_all_active(self) -> List[Event]:
         """Get all active events (alias for compatibility)"""
         return await self.get_active_events()
+    
+    async def get_availability_by_ids(self, event_ids: List[int]) -> Dict[int, Event]:
+        """Get events by IDs in one query, keyed by event ID
+        
+        ``total_tickets_sold`` holds the confirmed booked quantity computed by the
+        same query, so availability can be derived without further round trips.
+        Unknown IDs are absent from the result.
+        """
+        if not event_ids:
+            return {}
+        
+        return await self._get_with_booked_quantity(
+            EventModel.filter(id__in=list(set(event_ids)))
+        )
+    
+    async def get_active_availability(self) -> Dict[int, Event]:
+        """Get all active events with confirmed booked quantities, keyed by event ID"""
+        return await self._get_with_booked_quantity(
+            EventModel.filter(status=EventStatus.ACTIVE)
+        )
+    
+    async def _get_with_booked_quantity(self, queryset: QuerySet[EventModel]) -> Dict[int, Event]:
+        """Run an events query with a grouped SUM over confirmed bookings"""
+        event_models = await queryset.annotate(
+            booked_quantity=Coalesce(
+                Sum("bookings__quantity", _filter=Q(bookings__status=BookingStatus.CONFIRMED)),
+                0
+            )
+        )
+        
+        return {
+            event_model.id: Event.from_row(
+                id=event_model.id,
+                title=event_model.title,
+                description=event_model.description,
+                venue=event_model.venue,
+                date_time=event_model.date_time,
+                capacity=event_model.capacity,
+                price=event_model.price,
+                status=event_model.status,
+                created_at=event_model.created_at,
+                total_tickets_sold=event_model.booked_quantity,
+                total_revenue=event_model.total_revenue,
+                total_bookings=event_model.total_bookings
+            )
+            for event_model in event_models
+        }
@@ -0,0 +1,159 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from tortoise.expressions import F
+from tortoise.functions import Coalesce, Sum
+from ...domain.entities.booking import Booking, BookingStatus
+from ...domain.entities.sales_rollup import SalesRollup
+from ...domain.repositories.sales_rollup_repository import SalesRollupRepository
+from ..database.models.booking_model import BookingModel
+from ..database.models.event_model import EventModel
+from ..database.models.sales_rollup_model import SalesRollupModel
+
+
+class SalesRollupRepositoryImpl(SalesRollupRepository):
+    """Tortoise ORM implementation of SalesRollupRepository"""
+    
+    # Figures added to an existing bucket on increment
+    _COUNTERS = (
+        "bookings", "tickets_sold", "revenue",
+        "cancellations", "cancelled_tickets", "cancelled_revenue"
+    )
+    
+    def __init__(self, rebuild_chunk_size: int = 5000):
+        self._rebuild_chunk_size = rebuild_chunk_size
+    
+    async def increment(self, delta: SalesRollup) -> None:
+        """Add ``delta`` to its event's hourly bucket, creating the bucket if needed
+        
+        Call inside the transaction that writes the booking so the rollup and
+        the booking commit together.
+        """
+        # Relative update: concurrent writers to the same bucket never overwrite each other
+        updated = await SalesRollupModel.filter(
+            event_id=delta.event_id, bucket_start=delta.bucket_start
+        ).update(**{
+            counter: F(counter) + getattr(delta, counter) for counter in self._COUNTERS
+        })
+        if updated:
+            return
+        
+        # First write to this hour: lock the event row so two transactions cannot
+        # both create the bucket, then retry in case the other one just did
+        await EventModel.select_for_update().filter(id=delta.event_id).values_list("id", flat=True)
+        updated = await SalesRollupModel.filter(
+            event_id=delta.event_id, bucket_start=delta.bucket_start
+        ).update(**{
+            counter: F(counter) + getattr(delta, counter) for counter in self._COUNTERS
+        })
+        if updated:
+            return
+        
+        await SalesRollupModel.create(
+            event_id=delta.event_id,
+            bucket_start=delta.bucket_start,
+            **{counter: getattr(delta, counter) for counter in self._COUNTERS}
+        )
+    
+    async def get_by_event_id(
+        self,
+        event_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[SalesRollup]:
+        """Get an event's hourly rollups in time order, from ``start`` (inclusive)
+        to ``end`` (exclusive)"""
+        queryset = SalesRollupModel.filter(event_id=event_id)
+        if start is not None:
+            queryset = queryset.filter(bucket_start__gte=start)
+        if end is not None:
+            queryset = queryset.filter(bucket_start__lt=end)
+        
+        rollup_models = await queryset.order_by("bucket_start")
+        
+        return [self._to_entity(rollup_model) for rollup_model in rollup_models]
+    
+    async def get_net_tickets_before(self, event_id: int, end: datetime) -> int:
+        """Get an event's tickets sold minus tickets cancelled in buckets before ``end``"""
+        totals = await SalesRollupModel.filter(event_id=event_id, bucket_start__lt=end).annotate(
+            total_sold=Coalesce(Sum("tickets_sold"), 0),
+            total_cancelled=Coalesce(Sum("cancelled_tickets"), 0)
+        ).values("total_sold", "total_cancelled")
+        return totals[0]["total_sold"] - totals[0]["total_cancelled"] if totals else 0
+    
+    async def rebuild(self, event_id: Optional[int] = None) -> int:
+        """Recompute the rollups of one event (or all events) from the bookings
+        table; returns the number of buckets written
+        
+        Call inside a transaction so readers never see a half-rebuilt event.
+        """
+        rollups = SalesRollupModel.all()
+        bookings = BookingModel.all()
+        if event_id is not None:
+            rollups = rollups.filter(event_id=event_id)
+            bookings = bookings.filter(event_id=event_id)
+        await rollups.delete()
+        
+        buckets: Dict[Tuple[int, datetime], SalesRollup] = {}
+        last_id = 0
+        while True:
+            # Keyset over booking IDs: one chunk of plain rows in memory at a time
+            rows = await bookings.filter(id__gt=last_id).order_by("id").limit(
+                self._rebuild_chunk_size
+            ).values("id", "user_id", "event_id", "quantity", "total_amount", "booking_date", "status")
+            for row in rows:
+                booking = Booking.from_row(
+                    id=row["id"],
+                    user_id=row["user_id"],
+                    event_id=row["event_id"],
+                    quantity=row["quantity"],
+                    total_amount=Decimal(str(row["total_amount"])),
+                    booking_date=row["booking_date"],
+                    status=BookingStatus(row["status"])
+                )
+                # Same increments the booking write path records
+                deltas = [SalesRollup.for_booking(booking)]
+                if booking.is_cancelled():
+                    deltas.append(SalesRollup.for_cancellation(booking))
+                for delta in deltas:
+                    key = (delta.event_id, delta.bucket_start)
+                    if key in buckets:
+                        buckets[key].merge(delta)
+                    else:
+                        buckets[key] = delta
+            if len(rows) < self._rebuild_chunk_size:
+                break
+            last_id = rows[-1]["id"]
+        
+        await SalesRollupModel.bulk_create(
+            [
+                SalesRollupModel(
+                    event_id=rollup.event_id,
+                    bucket_start=rollup.bucket_start,
+                    **{counter: getattr(rollup, counter) for counter in self._COUNTERS}
+                )
+                for rollup in buckets.values()
+            ],
+            batch_size=self._rebuild_chunk_size
+        )
+        
+        return len(buckets)
+    
+    @classmethod
+    def _to_entity(cls, rollup_model: SalesRollupModel) -> SalesRollup:
+        """Map a rollup model to the domain entity"""
+        return SalesRollup(
+            event_id=rollup_model.event_id,
+            bucket_start=rollup_model.bucket_start,
+            bookings=rollup_model.bookings,
+            tickets_sold=rollup_model.tickets_sold,
+            revenue=cls._to_amount(rollup_model.revenue),
+            cancellations=rollup_model.cancellations,
+            cancelled_tickets=rollup_model.cancelled_tickets,
+            cancelled_revenue=cls._to_amount(rollup_model.cancelled_revenue)
+        )
+    
+    @staticmethod
+    def _to_amount(value) -> Decimal:
+        """Normalise amounts that SQLite returns after arithmetic updates (e.g. 6E+1)"""
+        return Decimal(str(value)).quantize(Decimal("0.01"))
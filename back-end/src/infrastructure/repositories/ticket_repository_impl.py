@@ -1,12 +1,36 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from tortoise.exceptions import DoesNotExist
 from ...domain.entities.ticket import Ticket, TicketStatus
+from ...domain.entities.ticket_details import TicketDetails
+from ...domain.entities.attendee import AttendeeRecord
+from ...domain.entities.booking import Booking, BookingStatus
+from ...domain.entities.event import Event
+from ...domain.entities.user import User
 from ...domain.repositories.ticket_repository import TicketRepository
 from ..database.models.ticket_model import TicketModel
+from ..database.batch_loader import BatchLoader, RowsById
+from ..database.fast_path import FastQuery
+from ..database.identity_map import forget, forget_all, lookup, remember
+from ..database.raw_sql import get_connection, placeholders
 
 
 class TicketRepositoryImpl(TicketRepository):
     """Tortoise ORM implementation of TicketRepository"""
     
+    # Rows per multi-row INSERT statement in create_many
+    BULK_BATCH_SIZE = 500
+    
+    # Columns of the rows _row_to_ticket maps, in order
+    _ROW_COLUMNS = ("id", "booking_id", "ticket_code", "status")
+    
+    # Raw fast path for the lookup every gate scan makes
+    _BY_CODE_QUERY = FastQuery(TicketModel, _ROW_COLUMNS, '"ticket_code"=$1')
+    
+    def __init__(self, fast_path: bool = False, batch_loading: bool = False):
+        self._fast_path = fast_path
+        # Concurrent get_by_id calls share one query per event-loop tick
+        self._loader = BatchLoader(RowsById(TicketModel, self._ROW_COLUMNS)) if batch_loading else None
+    
     async def create(self, ticket: Ticket) -> Ticket:
         """Create a new ticket"""
         ticket_model = await TicketModel.create(
@@ -15,45 +39,105 @@ class TicketRepositoryImpl(TicketRepository):
             status=ticket.status
         )
         
-        return Ticket(
+        return remember(Ticket.from_row(
             id=ticket_model.id,
             booking_id=ticket_model.booking_id,
             ticket_code=ticket_model.ticket_code,
             status=ticket_model.status
+        ))
+    
+    async def create_many(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Create several tickets in bulk
+        
+        Tickets whose code collides with an existing ticket are skipped; only the
+        tickets that were actually inserted are returned.
+        """
+        if not tickets:
+            return []
+        
+        # Multi-row INSERT; the unique index on ticket_code rejects duplicates
+        # without aborting the statement (ON CONFLICT DO NOTHING / INSERT OR IGNORE)
+        await TicketModel.bulk_create(
+            [
+                TicketModel(
+                    booking_id=ticket.booking_id,
+                    ticket_code=ticket.ticket_code,
+                    status=ticket.status
+                )
+                for ticket in tickets
+            ],
+            batch_size=self.BULK_BATCH_SIZE,
+            ignore_conflicts=True
         )
+        
+        # Read the rows back to learn their IDs and which codes were ours
+        requested = {ticket.ticket_code: ticket.booking_id for ticket in tickets}
+        ticket_models = await TicketModel.filter(
+            ticket_code__in=list(requested.keys())
+        ).order_by("id")
+        
+        return [
+            Ticket.from_row(
+                id=ticket_model.id,
+                booking_id=ticket_model.booking_id,
+                ticket_code=ticket_model.ticket_code,
+                status=ticket_model.status
+            )
+            for ticket_model in ticket_models
+            if requested[ticket_model.ticket_code] == ticket_model.booking_id
+        ]
+    
+    @staticmethod
+    def _row_to_ticket(row: Sequence) -> Ticket:
+        """Ticket from a row in ``_ROW_COLUMNS`` order"""
+        return Ticket.from_row(id=row[0], booking_id=row[1], ticket_code=row[2], status=TicketStatus(row[3]))
     
     async def get_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """Get ticket by ID"""
+        cached = lookup(Ticket, ticket_id)
+        if cached is not None:
+            return cached
+        
+        if self._loader is not None:
+            row = await self._loader.load(ticket_id)
+            return remember(self._row_to_ticket(row)) if row else None
+        
         ticket_model = await TicketModel.get_or_none(id=ticket_id)
         if not ticket_model:
             return None
         
-        return Ticket(
+        return remember(Ticket.from_row(
             id=ticket_model.id,
             booking_id=ticket_model.booking_id,
             ticket_code=ticket_model.ticket_code,
             status=ticket_model.status
-        )
+        ))
     
     async def get_by_ticket_code(self, ticket_code: str) -> Optional[Ticket]:
         """Get ticket by ticket code"""
+        if self._fast_path:
+            row = await self._BY_CODE_QUERY.fetch_one(ticket_code)
+            if not row:
+                return None
+            return remember(self._row_to_ticket(row))
+        
         ticket_model = await TicketModel.get_or_none(ticket_code=ticket_code)
         if not ticket_model:
             return None
         
-        return Ticket(
+        return remember(Ticket.from_row(
             id=ticket_model.id,
             booking_id=ticket_model.booking_id,
             ticket_code=ticket_model.ticket_code,
             status=ticket_model.status
-        )
+        ))
     
     async def get_all(self) -> List[Ticket]:
         """Get all tickets"""
         ticket_models = await TicketModel.all()
         
         return [
-            Ticket(
+            Ticket.from_row(
                 id=ticket_model.id,
                 booking_id=ticket_model.booking_id,
                 ticket_code=ticket_model.ticket_code,
@@ -67,7 +151,7 @@ class TicketRepositoryImpl(TicketRepository):
         ticket_models = await TicketModel.filter(booking_id=booking_id).all()
         
         return [
-            Ticket(
+            Ticket.from_row(
                 id=ticket_model.id,
                 booking_id=ticket_model.booking_id,
                 ticket_code=ticket_model.ticket_code,
@@ -78,17 +162,20 @@ class TicketRepositoryImpl(TicketRepository):
     
     async def update(self, ticket: Ticket) -> Ticket:
         """Update existing ticket"""
-        ticket_model = await TicketModel.get(id=ticket.id)
-        ticket_model.ticket_code = ticket.ticket_code
-        ticket_model.status = ticket.status
-        await ticket_model.save()
-        
-        return Ticket(
-            id=ticket_model.id,
-            booking_id=ticket_model.booking_id,
-            ticket_code=ticket_model.ticket_code,
-            status=ticket_model.status
+        # One UPDATE without reading the row again; the caller loaded the ticket
+        updated_count = await TicketModel.filter(id=ticket.id).update(
+            ticket_code=ticket.ticket_code,
+            status=ticket.status
         )
+        if not updated_count:
+            raise DoesNotExist(f"Ticket {ticket.id} does not exist")
+        
+        return remember(Ticket.from_row(
+            id=ticket.id,
+            booking_id=ticket.booking_id,
+            ticket_code=ticket.ticket_code,
+            status=ticket.status
+        ))
     
     async def delete(self, ticket_id: int) -> bool:
         """Delete ticket by ID"""
@@ -97,6 +184,7 @@ class TicketRepositoryImpl(TicketRepository):
             return False
         
         await ticket_model.delete()
+        forget(Ticket, ticket_id)
         return True
     
     async def exists_by_ticket_code(self, ticket_code: str) -> bool:
@@ -106,4 +194,162 @@ class TicketRepositoryImpl(TicketRepository):
     async def update_status_by_booking_id(self, booking_id: int, status: TicketStatus) -> int:
         """Update ticket status for all tickets in a booking"""
         updated_count = await TicketModel.filter(booking_id=booking_id).update(status=status)
+        forget_all(Ticket)
         return updated_count
+    
+    async def get_ticket_codes_after(self, ticket_id: int, event_id: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Get the IDs and codes of tickets with an ID above ``ticket_id``, optionally for one event only"""
+        queryset = TicketModel.filter(id__gt=ticket_id)
+        if event_id is not None:
+            queryset = queryset.filter(booking__event_id=event_id)
+        
+        return await queryset.order_by("id").values_list("id", "ticket_code")
+    
+    async def use_if_active(self, ticket_code: str) -> bool:
+        """Atomically mark a ticket as used if it is still active
+        
+        Returns True only for the caller whose update made the transition.
+        """
+        updated_count = await TicketModel.filter(
+            ticket_code=ticket_code, status=TicketStatus.ACTIVE
+        ).update(status=TicketStatus.USED)
+        forget_all(Ticket)
+        return updated_count == 1
+    
+    async def get_details_by_codes(self, ticket_codes: List[str]) -> Dict[str, TicketDetails]:
+        """Get tickets with booking, event and user in one joined query, keyed by code
+        
+        Unknown codes are absent from the result.
+        """
+        if not ticket_codes:
+            return {}
+        
+        ticket_models = await TicketModel.filter(
+            ticket_code__in=list(set(ticket_codes))
+        ).select_related("booking__event", "booking__user")
+        
+        return {
+            ticket_model.ticket_code: self._to_details(ticket_model)
+            for ticket_model in ticket_models
+        }
+    
+    async def use_active_tickets(self, ticket_codes: List[str]) -> List[str]:
+        """Atomically mark the given tickets as used where they are still active
+        
+        Returns the codes that this call transitioned; codes that were already
+        used, cancelled or unknown are not returned.
+        """
+        codes = list(set(ticket_codes))
+        if not codes:
+            return []
+        
+        # A single conditional UPDATE: concurrent scanners can never both win a ticket
+        connection = get_connection()
+        sql = (
+            'UPDATE "tickets" SET "status"={status} '
+            'WHERE "status"={active} AND "ticket_code" IN ({codes}) '
+            'RETURNING "ticket_code"'
+        ).format(
+            status=placeholders(connection, 1, start=1),
+            active=placeholders(connection, 1, start=2),
+            codes=placeholders(connection, len(codes), start=3)
+        )
+        rows = await connection.execute_query_dict(
+            sql, [TicketStatus.USED.value, TicketStatus.ACTIVE.value, *codes]
+        )
+        forget_all(Ticket)
+        
+        return [row["ticket_code"] for row in rows]
+    
+    async def count_by_event_id(self, event_id: int) -> int:
+        """Count all tickets issued for an event"""
+        return await TicketModel.filter(booking__event_id=event_id).count()
+    
+    async def get_attendees_page(
+        self,
+        event_id: int,
+        limit: int,
+        after_ticket_id: Optional[int] = None
+    ) -> List[AttendeeRecord]:
+        """Get up to ``limit`` tickets of an event joined with their booking and
+        ticket holder, ordered by ticket ID and starting after ``after_ticket_id``"""
+        queryset = TicketModel.filter(booking__event_id=event_id)
+        if after_ticket_id is not None:
+            queryset = queryset.filter(id__gt=after_ticket_id)
+        
+        # Plain rows from one joined query; no model instances are built
+        rows = await queryset.order_by("id").limit(limit).values(
+            "id",
+            "ticket_code",
+            "status",
+            "booking_id",
+            "booking__status",
+            "booking__booking_date",
+            "booking__quantity",
+            "booking__total_amount",
+            "booking__user_id",
+            "booking__user__name",
+            "booking__user__phone"
+        )
+        
+        return [
+            AttendeeRecord(
+                ticket_id=row["id"],
+                ticket_code=row["ticket_code"],
+                ticket_status=TicketStatus(row["status"]),
+                booking_id=row["booking_id"],
+                booking_status=BookingStatus(row["booking__status"]),
+                booking_date=row["booking__booking_date"],
+                quantity=row["booking__quantity"],
+                total_amount=row["booking__total_amount"],
+                user_id=row["booking__user_id"],
+                user_name=row["booking__user__name"],
+                user_phone=row["booking__user__phone"]
+            )
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _to_details(ticket_model: TicketModel) -> TicketDetails:
+        """Map a ticket model with joined booking, event and user to the aggregate"""
+        booking_model = ticket_model.booking
+        event_model = booking_model.event
+        user_model = booking_model.user
+        
+        return TicketDetails(
+            ticket=Ticket.from_row(
+                id=ticket_model.id,
+                booking_id=ticket_model.booking_id,
+                ticket_code=ticket_model.ticket_code,
+                status=ticket_model.status
+            ),
+            booking=Booking.from_row(
+                id=booking_model.id,
+                user_id=booking_model.user_id,
+                event_id=booking_model.event_id,
+                quantity=booking_model.quantity,
+                total_amount=booking_model.total_amount,
+                booking_date=booking_model.booking_date,
+                status=booking_model.status
+            ),
+            event=Event.from_row(
+                id=event_model.id,
+                title=event_model.title,
+                description=event_model.description,
+                venue=event_model.venue,
+                date_time=event_model.date_time,
+                capacity=event_model.capacity,
+                price=event_model.price,
+                status=event_model.status,
+                created_at=event_model.created_at,
+                total_tickets_sold=event_model.total_tickets_sold,
+                total_revenue=event_model.total_revenue,
+                total_bookings=event_model.total_bookings
+            ),
+            user=User.from_row(
+                id=user_model.id,
+                name=user_model.name,
+                phone=user_model.phone,
+                role=user_model.role
+            )
+        )
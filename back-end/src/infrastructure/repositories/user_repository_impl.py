@@ -1,12 +1,23 @@
-from typing import List, Optional
-from ...domain.entities.user import User
+from typing import List, Optional, Sequence
+from ...domain.entities.user import User, UserRole
 from ...domain.repositories.user_repository import UserRepository
+from ..database.batch_loader import BatchLoader, RowsById
+from ..database.fast_path import FastQuery
+from ..database.identity_map import forget, lookup, remember
 from ..database.models.user_model import UserModel
 
 
 class UserRepositoryImpl(UserRepository):
     """Tortoise ORM implementation of UserRepository"""
     
+    # Raw fast path for the user lookup every booking makes
+    _BY_ID_QUERY = FastQuery(UserModel, ("id", "name", "phone", "role"), '"id"=$1')
+    
+    def __init__(self, fast_path: bool = False, batch_loading: bool = False):
+        self._fast_path = fast_path
+        # Concurrent get_by_id calls share one query per event-loop tick
+        self._loader = BatchLoader(RowsById(UserModel, self._BY_ID_QUERY.columns)) if batch_loading else None
+    
     async def create(self, user: User) -> User:
         """Create a new user"""
         user_model = await UserModel.create(
@@ -15,25 +26,42 @@ class UserRepositoryImpl(UserRepository):
             role=user.role
         )
         
-        return User(
+        return remember(User.from_row(
             id=user_model.id,
             name=user_model.name,
             phone=user_model.phone,
             role=user_model.role
-        )
+        ))
+    
+    @staticmethod
+    def _row_to_user(row: Sequence) -> User:
+        """User from a row in ``_BY_ID_QUERY.columns`` order"""
+        return User.from_row(id=row[0], name=row[1], phone=row[2], role=UserRole(row[3]))
     
     async def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
+        cached = lookup(User, user_id)
+        if cached is not None:
+            return cached
+        
+        if self._loader is not None:
+            row = await self._loader.load(user_id)
+            return remember(self._row_to_user(row)) if row else None
+        
+        if self._fast_path:
+            row = await self._BY_ID_QUERY.fetch_one(user_id)
+            return remember(self._row_to_user(row)) if row else None
+        
         user_model = await UserModel.get_or_none(id=user_id)
         if not user_model:
             return None
         
-        return User(
+        return remember(User.from_row(
             id=user_model.id,
             name=user_model.name,
             phone=user_model.phone,
             role=user_model.role
-        )
+        ))
     
     async def get_by_phone(self, phone: str) -> Optional[User]:
         """Get user by phone number"""
@@ -41,7 +69,7 @@ class UserRepositoryImpl(UserRepository):
         if not user_model:
             return None
         
-        return User(
+        return User.from_row(
             id=user_model.id,
             name=user_model.name,
             phone=user_model.phone,
@@ -53,7 +81,7 @@ class UserRepositoryImpl(UserRepository):
         user_models = await UserModel.all()
         
         return [
-            User(
+            User.from_row(
                 id=user_model.id,
                 name=user_model.name,
                 phone=user_model.phone,
@@ -70,12 +98,12 @@ class UserRepositoryImpl(UserRepository):
         user_model.role = user.role
         await user_model.save()
         
-        return User(
+        return remember(User.from_row(
             id=user_model.id,
             name=user_model.name,
             phone=user_model.phone,
             role=user_model.role
-        )
+        ))
     
     async def delete(self, user_id: int) -> bool:
         """Delete user by ID"""
@@ -84,6 +112,7 @@ class UserRepositoryImpl(UserRepository):
             return False
         
         await user_model.delete()
+        forget(User, user_id)
         return True
     
     async def exists_by_phone(self, phone: str) -> bool:
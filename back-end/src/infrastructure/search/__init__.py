@@ -0,0 +1,5 @@
+from .event_search_index import InMemoryEventSearchIndex
+
+__all__ = [
+    "InMemoryEventSearchIndex"
+]
@@ -0,0 +1,139 @@
+"""
+In-process ranked event search, used where PostgreSQL full-text search is unavailable
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Same relative weights as ts_rank's defaults for the A/B/C labels of search_vector
+FIELD_WEIGHTS = (("title", 1.0), ("venue", 0.4), ("description", 0.2))
+# pg_trgm's default similarity threshold
+SIMILARITY_THRESHOLD = 0.3
+PREFIX_SIMILARITY = 0.8
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of at least two characters"""
+    return [token for token in _TOKEN_PATTERN.findall((text or "").lower()) if len(token) > 1]
+
+
+def trigrams(token: str) -> Set[str]:
+    """Trigrams of a token padded the way pg_trgm pads words"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class InMemoryEventSearchIndex:
+    """Inverted index over event title, venue and description
+
+    Every query word must match an indexed word exactly, as a prefix, or by
+    trigram similarity (typo tolerance). Events are ranked by the summed field
+    weight of their best match per query word.
+    """
+
+    def __init__(self):
+        # token -> {event_id: best field weight}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        # trigram -> tokens containing it, for fuzzy candidate lookup
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._event_tokens: Dict[int, Set[str]] = {}
+        self._is_loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index was filled with the full event catalog"""
+        return self._is_loaded
+
+    def load(self, documents: Iterable[Tuple[int, str, str, str]]) -> None:
+        """Replace the index with (event_id, title, venue, description) documents"""
+        self._postings.clear()
+        self._trigrams.clear()
+        self._event_tokens.clear()
+        for event_id, title, venue, description in documents:
+            self.upsert(event_id, title, venue, description)
+        self._is_loaded = True
+
+    def upsert(self, event_id: int, title: str, venue: str, description: str) -> None:
+        """Index an event, replacing any previous version of it"""
+        self.remove(event_id)
+
+        weights: Dict[str, float] = {}
+        for (_, weight), text in zip(FIELD_WEIGHTS, (title, venue, description)):
+            for token in tokenize(text):
+                weights[token] = max(weights.get(token, 0.0), weight)
+
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for trigram in trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(token)
+            postings[event_id] = weight
+
+        self._event_tokens[event_id] = set(weights)
+
+    def remove(self, event_id: int) -> None:
+        """Drop an event from the index"""
+        for token in self._event_tokens.pop(event_id, ()):
+            postings = self._postings[token]
+            postings.pop(event_id, None)
+            if not postings:
+                del self._postings[token]
+                for trigram in trigrams(token):
+                    tokens = self._trigrams[trigram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._trigrams[trigram]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Best matching (event_id, score) pairs, highest score first; all of them without ``limit``"""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        scores: Dict[int, float] = {}
+        for position, query_token in enumerate(query_tokens):
+            token_scores: Dict[int, float] = {}
+            for token, similarity in self._matching_tokens(query_token):
+                for event_id, weight in self._postings[token].items():
+                    score = weight * similarity
+                    if score > token_scores.get(event_id, 0.0):
+                        token_scores[event_id] = score
+
+            if position == 0:
+                scores = token_scores
+            else:
+                # All query words must match
+                scores = {
+                    event_id: scores[event_id] + score
+                    for event_id, score in token_scores.items()
+                    if event_id in scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def _matching_tokens(self, query_token: str) -> List[Tuple[str, float]]:
+        """Indexed tokens similar enough to ``query_token``, with their similarity"""
+        query_trigrams = trigrams(query_token)
+        shared: Dict[str, int] = {}
+        for trigram in query_trigrams:
+            for token in self._trigrams.get(trigram, ()):
+                shared[token] = shared.get(token, 0) + 1
+
+        matches = []
+        for token, common in shared.items():
+            if token == query_token:
+                similarity = 1.0
+            elif token.startswith(query_token):
+                similarity = PREFIX_SIMILARITY
+            else:
+                similarity = common / (len(query_trigrams) + len(trigrams(token)) - common)
+                if similarity < SIMILARITY_THRESHOLD:
+                    continue
+            matches.append((token, similarity))
+        return matches
@@ -3,6 +3,9 @@ Clean Architecture FastAPI Application
 Event Ticketing System with proper separation of concerns and API versioning
 """
 
+from dataclasses import asdict
+import os
+import time
 from typing import List
 from fastapi import FastAPI, HTTPException, status, Depends, Request
 from fastapi.responses import JSONResponse
@@ -12,6 +15,9 @@ from contextlib import asynccontextmanager
 
 # Infrastructure
 from src.infrastructure.database.connection import init_db, close_db
+from src.infrastructure.database.routing import read_routing_scope
+from src.infrastructure.database.identity_map import identity_map_scope
+from src.container import container
 
 # API versioning
 from src.presentation.api.v1.router import api_v1_router
@@ -28,8 +34,11 @@ from src.presentation.utils.response_utils import prepare_response_data
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    await container.ticket_validation_use_cases.load_ticket_code_index()
     yield
     # Shutdown
+    if container.event_cache:
+        await container.event_cache.close()
     await close_db()
 
 
@@ -50,6 +59,41 @@ app.add_middleware(
 )
 
 
+# Read-your-writes: after a request that wrote, the same client reads from the
+# primary for a short while so replica lag never hides its own booking
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+PRIMARY_STICKY_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+
+@app.middleware("http")
+async def route_reads_after_writes(request: Request, call_next):
+    """Pin reads to the primary for clients that wrote recently"""
+    try:
+        pinned = float(request.cookies.get(PRIMARY_STICKY_COOKIE, "0")) > time.time()
+    except ValueError:
+        pinned = False
+
+    with read_routing_scope(pin_to_primary=pinned) as scope:
+        response = await call_next(request)
+
+    if scope.wrote:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(time.time() + PRIMARY_STICKY_SECONDS),
+            max_age=max(1, int(PRIMARY_STICKY_SECONDS)),
+            httponly=True,
+            samesite="lax"
+        )
+    return response
+
+
+@app.middleware("http")
+async def identity_map_per_request(request: Request, call_next):
+    """Load each user, event, booking and ticket at most once per request by primary key"""
+    with identity_map_scope():
+        return await call_next(request)
+
+
 # Exception handlers for consistent API responses
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -114,7 +158,8 @@ def read_root():
             "endpoints": {
                 "v1": "/api/v1",
                 "docs": "/docs",
-                "health": "/health"
+                "health": "/health",
+                "database_health": "/health/db"
             }
         }
     }
@@ -138,6 +183,41 @@ def health_check():
     )
 
 
+@app.get("/health/db", response_model=ApiResponse[dict])
+async def database_health_check():
+    """Check database connectivity and report connection pool gauges"""
+    monitor = container.database_pool_monitor
+    try:
+        latency_ms = await monitor.ping()
+    except Exception:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "success": False,
+                "message": "Database is unavailable",
+                "data": None
+            }
+        )
+    
+    pool_stats = monitor.stats()
+    data = {
+        "status": "healthy",
+        "latency_ms": latency_ms,
+        "pooled": pool_stats is not None,
+        "pool": None
+    }
+    if pool_stats is not None:
+        data["pool"] = {
+            **asdict(pool_stats),
+            "avg_wait_ms": pool_stats.avg_wait_ms,
+            "utilization": pool_stats.utilization
+        }
+    return ApiResponse.success_response(
+        data=data,
+        message="Database is healthy"
+    )
+
+
 # Additional utility endpoints
 @app.get("/api/v1/architecture", response_model=ApiResponse[dict])
 def get_architecture_info():
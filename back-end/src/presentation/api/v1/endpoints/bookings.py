@@ -2,18 +2,27 @@
 Bookings API v1 endpoints
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from src.presentation.schemas.booking_schemas import (
     BookingCreateSchema, BookingResponseSchema, BookingWithDetailsSchema
 )
-from src.presentation.schemas.api_response_schemas import BookingApiResponse, BookingListApiResponse, ApiResponse, ApiListResponse
-from src.presentation.utils.response_utils import prepare_response_data
+from src.presentation.schemas.api_response_schemas import BookingApiResponse, BookingListApiResponse, BookingPageApiResponse, ApiResponse, ApiListResponse, ApiPageResponse
+from src.presentation.utils.response_utils import prepare_response_data, render_response
 from src.domain.entities.booking import BookingStatus
 from src.container import container
 
 router = APIRouter()
 
+# Page size when a cursor is given without an explicit limit
+DEFAULT_PAGE_SIZE = 100
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
 
 @router.post("", response_model=BookingApiResponse, status_code=status.HTTP_201_CREATED)
 async def create_booking(booking_data: BookingCreateSchema):
@@ -29,30 +38,58 @@ async def create_booking(booking_data: BookingCreateSchema):
 async def get_user_bookings(user_id: int):
     """Get bookings for a specific user with full details"""
     bookings = await container.booking_controller.get_user_bookings(user_id)
-    return ApiListResponse.success_response(
-        data=prepare_response_data(bookings),
+    return render_response(ApiListResponse.success_response(
+        data=bookings,
         message="User bookings retrieved successfully"
-    )
+    ))
 
 
 @router.get("/{booking_id}", response_model=BookingApiResponse)
 async def get_booking_by_id(booking_id: int):
     """Get booking by ID with full details"""
     booking = await container.booking_controller.get_booking_by_id(booking_id)
-    return ApiResponse.success_response(
-        data=prepare_response_data(booking),
+    return render_response(ApiResponse.success_response(
+        data=booking,
         message="Booking retrieved successfully"
-    )
+    ))
 
 
-@router.get("/event/{event_id}", response_model=BookingListApiResponse)
-async def get_event_bookings(event_id: int, admin_user_id: int = 1):
-    """Get bookings for a specific event with full details (admin only)"""
-    bookings = await container.booking_controller.get_event_bookings(event_id, admin_user_id)
-    return ApiListResponse.success_response(
-        data=prepare_response_data(bookings),
-        message="Event bookings retrieved successfully"
+@router.get("/event/{event_id}", response_model=BookingPageApiResponse)
+async def get_event_bookings(
+    event_id: int,
+    admin_user_id: int = 1,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("json", pattern="^(json|ndjson|csv)$", description="json, or stream every booking as ndjson/csv")
+):
+    """Get bookings for a specific event with full details (admin only)
+    
+    ``ndjson`` and ``csv`` stream all bookings (after ``cursor``) with memory use
+    independent of their number; ``limit`` pages the JSON response.
+    """
+    if format in STREAM_MEDIA_TYPES:
+        stream = await container.booking_controller.open_event_bookings_stream(event_id, format, cursor)
+        return StreamingResponse(
+            stream,
+            media_type=STREAM_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="event-{event_id}-bookings.{format}"'}
+        )
+    
+    if limit is None and cursor is None:
+        bookings = await container.booking_controller.get_event_bookings(event_id, admin_user_id)
+        return render_response(ApiPageResponse.success_response(
+            data=bookings,
+            message="Event bookings retrieved successfully"
+        ))
+    
+    page = await container.booking_controller.get_event_bookings_page(
+        event_id, limit or DEFAULT_PAGE_SIZE, cursor
     )
+    return render_response(ApiPageResponse.page_response(
+        data=page.bookings,
+        pagination=prepare_response_data(page.pagination),
+        message="Event bookings retrieved successfully"
+    ))
 
 
 @router.get("/event/{event_id}/stats", response_model=ApiResponse[dict])
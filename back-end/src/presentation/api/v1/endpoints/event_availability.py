@@ -4,13 +4,32 @@ Event availability API endpoints
 
 from typing import List
 from fastapi import APIRouter, Query
-from src.presentation.schemas.event_availability_schemas import EventAvailabilitySchema, MultipleEventAvailabilitySchema
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from src.presentation.schemas.event_availability_schemas import (
+    EventAvailabilitySchema, MultipleEventAvailabilitySchema, AvailabilityCacheStatsSchema
+)
 from src.presentation.schemas.api_response_schemas import ApiResponse
 from src.container import container
 
 router = APIRouter()
 
 
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_events_availability(
+    event_ids: List[int] = Query(..., description="List of event IDs to receive live availability for")
+):
+    """Stream live availability (Server-Sent Events): a snapshot first, then changes caused by bookings"""
+    subscription, stream = await container.event_availability_controller.open_availability_stream(event_ids)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Runs once the response is over, also when the client left before the stream started
+        background=BackgroundTask(subscription.close)
+    )
+
+
 @router.get("/{event_id}", response_model=ApiResponse[EventAvailabilitySchema])
 async def get_event_availability(event_id: int):
     """Get real-time availability for a specific event"""
@@ -41,3 +60,13 @@ async def get_all_active_events_availability():
         data=availability,
         message="All active events availability retrieved successfully"
     )
+
+
+@router.get("/cache/stats", response_model=ApiResponse[AvailabilityCacheStatsSchema])
+async def get_availability_cache_stats():
+    """Get hit/miss counters of the availability cache"""
+    stats = container.event_availability_controller.get_cache_stats()
+    return ApiResponse.success_response(
+        data=stats,
+        message="Availability cache statistics retrieved successfully"
+    )
@@ -2,15 +2,22 @@
 Events API v1 endpoints
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Optional, Union
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, status
+from src.domain.entities.event import EventStatus, EventFilter
+from src.domain.entities.sales_rollup import SalesInterval
 from src.presentation.schemas.event_schemas import EventCreateSchema, EventResponseSchema, EventManagementSchema, EventPatchSchema
-from src.presentation.schemas.api_response_schemas import EventApiResponse, EventListApiResponse, EventManagementApiResponse, ApiResponse, ApiListResponse
-from src.presentation.utils.response_utils import prepare_response_data
+from src.presentation.schemas.sales_schemas import SalesSeriesSchema
+from src.presentation.schemas.api_response_schemas import EventApiResponse, EventListApiResponse, EventPageApiResponse, EventManagementApiResponse, ApiResponse, ApiListResponse, ApiPageResponse
+from src.presentation.utils.response_utils import prepare_response_data, render_response
 from src.container import container
 
 router = APIRouter()
 
+# Page size when a cursor is given without an explicit limit
+DEFAULT_PAGE_SIZE = 50
+
 
 @router.post("", response_model=EventApiResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(event_data: EventCreateSchema, admin_user_id: int = 1):
@@ -22,23 +29,77 @@ async def create_event(event_data: EventCreateSchema, admin_user_id: int = 1):
     )
 
 
-@router.get("", response_model=EventListApiResponse)
-async def list_events():
-    """Get all events"""
-    events = await container.event_controller.get_all_events()
-    return ApiListResponse.success_response(
-        data=prepare_response_data(events),
-        message="Events retrieved successfully"
+# Unpaged lists keep the plain list envelope; only pages carry "pagination"
+@router.get("", response_model=Union[EventListApiResponse, EventPageApiResponse])
+async def list_events(
+    event_status: Optional[EventStatus] = Query(None, alias="status", description="Only events with this status"),
+    venue: Optional[str] = Query(None, description="Only events at this venue (exact match)"),
+    date_from: Optional[datetime] = Query(None, description="Only events starting at or after this time"),
+    date_to: Optional[datetime] = Query(None, description="Only events starting at or before this time"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matching events (one extra query)")
+):
+    """Get events ordered by date, one page at a time when ``limit`` is given
+    
+    Without ``limit`` or ``cursor`` every matching event is returned, as before.
+    """
+    filters = EventFilter(status=event_status, venue=venue, date_from=date_from, date_to=date_to)
+    
+    if limit is None and cursor is None:
+        has_filters = any(value is not None for value in (event_status, venue, date_from, date_to))
+        events = await container.event_controller.get_all_events(filters if has_filters else None)
+        return render_response(ApiListResponse.success_response(
+            data=events,
+            message="Events retrieved successfully"
+        ))
+    
+    page = await container.event_controller.get_events_page(
+        filters, limit or DEFAULT_PAGE_SIZE, cursor, include_total
     )
+    return render_response(ApiPageResponse.page_response(
+        data=page.events,
+        pagination=prepare_response_data(page.pagination),
+        message="Events retrieved successfully"
+    ))
+
+
+@router.get("/search", response_model=EventListApiResponse)
+async def search_events(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in title, venue or description"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    event_status: Optional[EventStatus] = Query(None, alias="status", description="Only events with this status")
+):
+    """Search events by relevance; tolerates typos"""
+    events = await container.event_controller.search_events(q, limit, event_status)
+    return render_response(ApiListResponse.success_response(
+        data=events,
+        message="Events retrieved successfully"
+    ))
 
 
 @router.get("/{event_id}", response_model=EventApiResponse)
 async def get_event(event_id: int):
     """Get event by ID"""
     event = await container.event_controller.get_event_by_id(event_id)
-    return ApiResponse.success_response(
-        data=prepare_response_data(event),
+    return render_response(ApiResponse.success_response(
+        data=event,
         message="Event retrieved successfully"
+    ))
+
+
+@router.get("/{event_id}/sales", response_model=ApiResponse[SalesSeriesSchema])
+async def get_event_sales(
+    event_id: int,
+    interval: SalesInterval = Query(SalesInterval.HOUR, description="Bucket size: hour or day (UTC)"),
+    start: Optional[datetime] = Query(None, description="Only buckets from this time"),
+    end: Optional[datetime] = Query(None, description="Only buckets before this time")
+):
+    """Get an event's sales curve from the pre-aggregated rollups (admin only)"""
+    series = await container.sales_controller.get_sales_series(event_id, interval, start, end)
+    return ApiResponse.success_response(
+        data=prepare_response_data(series),
+        message="Event sales retrieved successfully"
     )
 
 
@@ -76,7 +137,7 @@ async def delete_event(event_id: int, admin_user_id: int = 1):
 async def get_events_for_management():
     """Get all events with statistics for management table view"""
     events = await container.event_controller.get_events_for_management()
-    return ApiListResponse.success_response(
-        data=prepare_response_data(events),
+    return render_response(ApiListResponse.success_response(
+        data=events,
         message="Events management data retrieved successfully"
-    )
+    ))
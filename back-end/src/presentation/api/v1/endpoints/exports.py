@@ -0,0 +1,60 @@
+"""
+Exports API v1 endpoints
+"""
+
+from fastapi import APIRouter, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from src.presentation.schemas.export_schemas import ExportJobSchema
+from src.presentation.schemas.api_response_schemas import ApiResponse
+from src.presentation.utils.response_utils import prepare_response_data
+from src.container import container
+
+router = APIRouter()
+
+
+@router.get("/events/{event_id}/attendees", response_class=StreamingResponse)
+async def stream_event_attendees(
+    event_id: int,
+    format: str = Query("csv", description="csv, or parquet/arrow when pyarrow is installed")
+):
+    """Stream every ticket of an event with its booking and ticket holder"""
+    export = await container.export_controller.open_attendee_stream(event_id, format)
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.file_name}"'}
+    )
+
+
+@router.post(
+    "/events/{event_id}/attendees",
+    response_model=ApiResponse[ExportJobSchema],
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def start_event_attendees_export(
+    event_id: int,
+    format: str = Query("csv", description="csv, or parquet/arrow when pyarrow is installed")
+):
+    """Export every ticket of an event to a file in the background; poll the job for progress"""
+    job = await container.export_controller.start_attendee_export(event_id, format)
+    return ApiResponse.success_response(
+        data=prepare_response_data(job),
+        message="Export started"
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=ApiResponse[ExportJobSchema])
+async def get_export_job(job_id: str):
+    """Get the status and progress of an export job"""
+    job = container.export_controller.get_job(job_id)
+    return ApiResponse.success_response(
+        data=prepare_response_data(job),
+        message="Export job retrieved successfully"
+    )
+
+
+@router.get("/jobs/{job_id}/download", response_class=FileResponse)
+async def download_export(job_id: str):
+    """Download the file of a completed export job"""
+    export_file = container.export_controller.get_job_file(job_id)
+    return FileResponse(export_file.path, media_type=export_file.media_type, filename=export_file.file_name)
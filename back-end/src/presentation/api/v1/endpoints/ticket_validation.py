@@ -10,13 +10,19 @@ from typing import List
 from src.application.use_cases.ticket_validation_use_cases import TicketValidationUseCases
 
 # DTOs
-from src.application.dtos.ticket_dto import TicketValidationRequestDTO, TicketValidationResponseDTO
+from src.application.dtos.ticket_dto import (
+    TicketValidationRequestDTO,
+    TicketValidationResponseDTO,
+    TicketBatchResponseDTO
+)
 
 # Presentation schemas
 from src.presentation.schemas.ticket_validation_schemas import (
     TicketValidationRequest,
     TicketValidationResponse,
-    TicketUseRequest
+    TicketUseRequest,
+    TicketBatchRequest,
+    TicketBatchResponse
 )
 from src.presentation.schemas.api_response_schemas import ApiResponse
 
@@ -120,3 +126,84 @@ async def use_ticket(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error using ticket: {str(e)}"
         )
+
+
+@router.post(
+    "/validate/batch",
+    response_model=ApiResponse[TicketBatchResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Validate a batch of tickets",
+    description="Validate up to 1000 tickets at once; results are returned per code in request order"
+)
+async def validate_tickets(
+    request: TicketBatchRequest,
+    use_cases: TicketValidationUseCases = Depends(get_ticket_validation_use_cases)
+) -> ApiResponse[TicketBatchResponse]:
+    """Validate a batch of tickets"""
+    
+    try:
+        # Execute use case
+        result = await use_cases.validate_tickets(request.ticket_codes)
+        
+        return ApiResponse(
+            success=True,
+            message="Ticket batch validation completed successfully",
+            data=prepare_response_data(_to_batch_response(result))
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error validating tickets: {str(e)}"
+        )
+
+
+@router.post(
+    "/use/batch",
+    response_model=ApiResponse[TicketBatchResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Use a batch of tickets",
+    description="Mark up to 1000 tickets as used in one atomic update; each ticket is admitted at most once"
+)
+async def use_tickets(
+    request: TicketBatchRequest,
+    use_cases: TicketValidationUseCases = Depends(get_ticket_validation_use_cases)
+) -> ApiResponse[TicketBatchResponse]:
+    """Mark a batch of tickets as used"""
+    
+    try:
+        # Execute use case
+        result = await use_cases.use_tickets(request.ticket_codes)
+        
+        return ApiResponse(
+            success=True,
+            message="Ticket batch operation completed successfully",
+            data=prepare_response_data(_to_batch_response(result))
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error using tickets: {str(e)}"
+        )
+
+
+def _to_batch_response(result: TicketBatchResponseDTO) -> TicketBatchResponse:
+    """Convert a batch result DTO to its response schema"""
+    return TicketBatchResponse(
+        results=[
+            TicketValidationResponse(
+                ticket_code=item.ticket_code,
+                status=item.status.value,
+                is_valid=item.is_valid,
+                message=item.message,
+                booking_id=item.booking_id,
+                event_name=item.event_name,
+                event_date=item.event_date,
+                user_name=item.user_name
+            )
+            for item in result.results
+        ],
+        processed=result.processed,
+        succeeded=result.succeeded
+    )
@@ -4,7 +4,7 @@ Main router for version 1 of the API
 """
 
 from fastapi import APIRouter
-from .endpoints import users, events, bookings, event_availability, ticket_validation
+from .endpoints import users, events, bookings, event_availability, ticket_validation, exports
 
 # Create main v1 router
 api_v1_router = APIRouter()
@@ -15,3 +15,4 @@ api_v1_router.include_router(events.router, prefix="/events", tags=["events"])
 api_v1_router.include_router(bookings.router, prefix="/bookings", tags=["bookings"])
 api_v1_router.include_router(event_availability.router, prefix="/availability", tags=["availability"])
 api_v1_router.include_router(ticket_validation.router, prefix="/tickets", tags=["ticket-validation"])
+api_v1_router.include_router(exports.router, prefix="/exports", tags=["exports"])
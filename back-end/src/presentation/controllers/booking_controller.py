@@ -1,15 +1,29 @@
-from typing import List
+import csv
+import io
+from typing import AsyncIterator, List, Optional
 from fastapi import HTTPException, status
 from ...application.use_cases.booking_use_cases import BookingUseCases
 from ...application.use_cases.user_use_cases import UserUseCases
 from ...application.dtos.booking_dto import BookingCreateDTO, BookingResponseDTO, BookingWithDetailsDTO
 from ...domain.entities.booking import BookingStatus
-from ..schemas.booking_schemas import BookingCreateSchema, BookingResponseSchema, BookingWithDetailsSchema
+from ..schemas.booking_schemas import (
+    BookingCreateSchema,
+    BookingResponseSchema,
+    BookingWithDetailsSchema,
+    BookingPageSchema,
+    BookingPaginationSchema
+)
 from ..schemas.user_schemas import UserResponseSchema
 from ..schemas.event_schemas import EventResponseSchema
 from ..schemas.ticket_schemas import TicketResponseSchema
 
 
+CSV_COLUMNS = [
+    "booking_id", "user_id", "user_name", "user_phone", "quantity",
+    "total_amount", "booking_date", "status", "ticket_codes"
+]
+
+
 class BookingController:
     """Controller for booking-related endpoints"""
     
@@ -100,44 +114,7 @@ class BookingController:
             
             bookings = await self._booking_use_cases.get_event_bookings(event_id)
             
-            return [
-                BookingWithDetailsSchema(
-                    id=booking.id,
-                    user_id=booking.user_id,
-                    event_id=booking.event_id,
-                    quantity=booking.quantity,
-                    total_amount=booking.total_amount,
-                    booking_date=booking.booking_date,
-                    status=booking.status,
-                    user=UserResponseSchema(
-                        id=booking.user.id,
-                        name=booking.user.name,
-                        phone=booking.user.phone,
-                        role=booking.user.role
-                    ),
-                    event=EventResponseSchema(
-                        id=booking.event.id,
-                        title=booking.event.title,
-                        description=booking.event.description,
-                        venue=booking.event.venue,
-                        date_time=booking.event.date_time,
-                        capacity=booking.event.capacity,
-                        price=booking.event.price,
-                        status=booking.event.status,
-                        created_at=booking.event.created_at
-                    ),
-                    tickets=[
-                        TicketResponseSchema(
-                            id=ticket.id,
-                            booking_id=ticket.booking_id,
-                            ticket_code=ticket.ticket_code,
-                            status=ticket.status
-                        )
-                        for ticket in booking.tickets
-                    ]
-                )
-                for booking in bookings
-            ]
+            return [self._to_details_schema(booking) for booking in bookings]
         except ValueError as e:
             if "Admin access required" in str(e):
                 raise HTTPException(
@@ -149,6 +126,74 @@ class BookingController:
                 detail=str(e)
             )
     
+    async def get_event_bookings_page(
+        self,
+        event_id: int,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> BookingPageSchema:
+        """Get one page of bookings for a specific event (admin only)"""
+        try:
+            page = await self._booking_use_cases.get_event_bookings_page(event_id, limit, cursor)
+        except ValueError as e:
+            raise self._lookup_error(e)
+        
+        return BookingPageSchema(
+            bookings=[self._to_details_schema(booking) for booking in page.bookings],
+            pagination=BookingPaginationSchema(
+                limit=limit,
+                has_more=page.has_more,
+                next_cursor=page.next_cursor
+            )
+        )
+    
+    async def open_event_bookings_stream(
+        self,
+        event_id: int,
+        export_format: str,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Validate the request, then return the event's bookings as NDJSON or CSV lines"""
+        try:
+            bookings = await self._booking_use_cases.stream_event_bookings(event_id, cursor)
+        except ValueError as e:
+            raise self._lookup_error(e)
+        
+        if export_format == "csv":
+            return self._stream_csv(bookings)
+        return self._stream_ndjson(bookings)
+    
+    async def _stream_ndjson(self, bookings: AsyncIterator[BookingWithDetailsDTO]) -> AsyncIterator[str]:
+        """One JSON document per booking, in the same shape as the list endpoint"""
+        async for booking in bookings:
+            yield self._to_details_schema(booking).model_dump_json() + "\n"
+    
+    async def _stream_csv(self, bookings: AsyncIterator[BookingWithDetailsDTO]) -> AsyncIterator[str]:
+        """One CSV row per booking, ticket codes joined by spaces"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+        
+        async for booking in bookings:
+            writer.writerow([
+                booking.id,
+                booking.user_id,
+                booking.user.name,
+                booking.user.phone,
+                booking.quantity,
+                f"{booking.total_amount:.2f}",
+                booking.booking_date.isoformat(),
+                booking.status.value,
+                " ".join(ticket.ticket_code for ticket in booking.tickets)
+            ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        
+        # Only the header was written when the event has no bookings
+        if buffer.tell():
+            yield buffer.getvalue()
+    
     async def get_booking_by_id(self, booking_id: int) -> BookingWithDetailsSchema:
         """Get booking by ID with full details"""
         try:
@@ -225,3 +270,49 @@ class BookingController:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=str(e)
             )
+    
+    @staticmethod
+    def _to_details_schema(booking: BookingWithDetailsDTO) -> BookingWithDetailsSchema:
+        """Convert a booking details DTO to its response schema"""
+        return BookingWithDetailsSchema(
+            id=booking.id,
+            user_id=booking.user_id,
+            event_id=booking.event_id,
+            quantity=booking.quantity,
+            total_amount=booking.total_amount,
+            booking_date=booking.booking_date,
+            status=booking.status,
+            user=UserResponseSchema(
+                id=booking.user.id,
+                name=booking.user.name,
+                phone=booking.user.phone,
+                role=booking.user.role
+            ),
+            event=EventResponseSchema(
+                id=booking.event.id,
+                title=booking.event.title,
+                description=booking.event.description,
+                venue=booking.event.venue,
+                date_time=booking.event.date_time,
+                capacity=booking.event.capacity,
+                price=booking.event.price,
+                status=booking.event.status,
+                created_at=booking.event.created_at
+            ),
+            tickets=[
+                TicketResponseSchema(
+                    id=ticket.id,
+                    booking_id=ticket.booking_id,
+                    ticket_code=ticket.ticket_code,
+                    status=ticket.status
+                )
+                for ticket in booking.tickets
+            ]
+        )
+    
+    @staticmethod
+    def _lookup_error(error: ValueError) -> HTTPException:
+        """404 for missing resources, 400 for invalid paging parameters"""
+        if "not found" in str(error):
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
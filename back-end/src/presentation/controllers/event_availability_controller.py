@@ -2,18 +2,27 @@
 Event availability controller for handling availability requests
 """
 
-from typing import Dict
+from typing import AsyncIterator, Dict, List, Tuple
 from datetime import datetime
 from fastapi import HTTPException, status
+from ...application.dtos.event_dto import EventAvailabilityDTO
+from ...application.interfaces.availability_hub import AvailabilitySubscription
 from ...application.use_cases.event_availability_use_cases import EventAvailabilityUseCases
-from ..schemas.event_availability_schemas import EventAvailabilitySchema, MultipleEventAvailabilitySchema
+from ..schemas.event_availability_schemas import (
+    EventAvailabilitySchema, MultipleEventAvailabilitySchema, AvailabilityCacheStatsSchema
+)
 
 
 class EventAvailabilityController:
     """Controller for event availability operations"""
     
-    def __init__(self, event_availability_use_cases: EventAvailabilityUseCases):
+    def __init__(
+        self,
+        event_availability_use_cases: EventAvailabilityUseCases,
+        stream_keepalive_seconds: float = 15.0
+    ):
         self._event_availability_use_cases = event_availability_use_cases
+        self._stream_keepalive_seconds = stream_keepalive_seconds
     
     async def get_event_availability(self, event_id: int) -> EventAvailabilitySchema:
         """Get real-time availability for a specific event"""
@@ -101,3 +110,85 @@ class EventAvailabilityController:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error fetching all events availability: {str(e)}"
             )
+    
+    def get_cache_stats(self) -> AvailabilityCacheStatsSchema:
+        """Get availability cache hit/miss counters"""
+        stats = self._event_availability_use_cases.get_cache_stats()
+        if stats is None:
+            return AvailabilityCacheStatsSchema(enabled=False)
+        
+        return AvailabilityCacheStatsSchema(
+            enabled=True,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            size=stats.size,
+            max_size=stats.max_size,
+            hit_ratio=stats.hit_ratio
+        )
+    
+    async def open_availability_stream(
+        self,
+        event_ids: List[int]
+    ) -> Tuple[AvailabilitySubscription, AsyncIterator[str]]:
+        """Subscribe to live availability and return the subscription and a Server-Sent Events stream
+        
+        The stream closes the subscription when it ends, but a stream that never
+        starts (the client went away first) cannot: the caller must close the
+        subscription once the response is over.
+        """
+        try:
+            # Subscribe before taking the snapshot so no change can slip in between
+            subscription = self._event_availability_use_cases.subscribe_availability(event_ids)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE if "Too many live" in str(e)
+                else status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        try:
+            snapshot = await self._event_availability_use_cases.get_multiple_events_availability(event_ids)
+        except Exception:
+            subscription.close()
+            raise
+        
+        return subscription, self._stream_availability(subscription, list(snapshot.values()))
+    
+    async def _stream_availability(
+        self,
+        subscription: AvailabilitySubscription,
+        snapshot: List[EventAvailabilityDTO]
+    ) -> AsyncIterator[str]:
+        """Yield the initial snapshot, then one SSE message per availability change"""
+        try:
+            for availability_dto in snapshot:
+                yield self._format_sse(availability_dto)
+            
+            while True:
+                updates = await subscription.wait(self._stream_keepalive_seconds)
+                if not updates:
+                    # Comment line keeps proxies from closing idle connections
+                    yield ": keepalive\n\n"
+                    continue
+                
+                for availability_dto in updates:
+                    yield self._format_sse(availability_dto)
+        finally:
+            subscription.close()
+    
+    @staticmethod
+    def _format_sse(availability_dto: EventAvailabilityDTO) -> str:
+        """Encode one availability as an SSE 'availability' message"""
+        schema = EventAvailabilitySchema(
+            event_id=availability_dto.event_id,
+            total_capacity=availability_dto.total_capacity,
+            booked_tickets=availability_dto.booked_tickets,
+            available_tickets=availability_dto.available_tickets,
+            occupancy_percentage=availability_dto.occupancy_percentage,
+            is_sold_out=availability_dto.is_sold_out,
+            is_almost_sold_out=availability_dto.is_almost_sold_out,
+            event_status=availability_dto.event_status,
+            last_updated=datetime.now()
+        )
+        return f"event: availability\ndata: {schema.model_dump_json()}\n\n"
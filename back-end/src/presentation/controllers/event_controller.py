@@ -1,9 +1,17 @@
-from typing import List
+from typing import List, Optional
 from fastapi import HTTPException, status
 from ...application.use_cases.event_use_cases import EventUseCases
 from ...application.use_cases.user_use_cases import UserUseCases
 from ...application.dtos.event_dto import EventCreateDTO, EventResponseDTO, EventPatchDTO
-from ..schemas.event_schemas import EventCreateSchema, EventResponseSchema, EventManagementSchema, EventPatchSchema
+from ...domain.entities.event import EventFilter, EventStatus
+from ..schemas.event_schemas import (
+    EventCreateSchema,
+    EventResponseSchema,
+    EventManagementSchema,
+    EventPatchSchema,
+    EventPageSchema,
+    EventPaginationSchema
+)
 
 
 class EventController:
@@ -75,9 +83,9 @@ class EventController:
                 detail=str(e)
             )
     
-    async def get_all_events(self) -> List[EventResponseSchema]:
-        """Get all events"""
-        events = await self._event_use_cases.get_all_events()
+    async def get_all_events(self, filters: Optional[EventFilter] = None) -> List[EventResponseSchema]:
+        """Get all events, optionally filtered"""
+        events = await self._event_use_cases.get_all_events(filters)
         
         return [
             EventResponseSchema(
@@ -94,6 +102,75 @@ class EventController:
             for event in events
         ]
     
+    async def search_events(
+        self,
+        query: str,
+        limit: int = 20,
+        status_filter: Optional[EventStatus] = None
+    ) -> List[EventResponseSchema]:
+        """Search events, best matches first"""
+        try:
+            events = await self._event_use_cases.search_events(query, limit, status_filter)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        return [
+            EventResponseSchema(
+                id=event.id,
+                title=event.title,
+                description=event.description,
+                venue=event.venue,
+                date_time=event.date_time,
+                capacity=event.capacity,
+                price=event.price,
+                status=event.status,
+                created_at=event.created_at
+            )
+            for event in events
+        ]
+    
+    async def get_events_page(
+        self,
+        filters: EventFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> EventPageSchema:
+        """Get one page of events"""
+        try:
+            page = await self._event_use_cases.get_events_page(filters, limit, cursor, include_total)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        return EventPageSchema(
+            events=[
+                EventResponseSchema(
+                    id=event.id,
+                    title=event.title,
+                    description=event.description,
+                    venue=event.venue,
+                    date_time=event.date_time,
+                    capacity=event.capacity,
+                    price=event.price,
+                    status=event.status,
+                    created_at=event.created_at
+                )
+                for event in page.events
+            ],
+            pagination=EventPaginationSchema(
+                limit=limit,
+                has_more=page.has_more,
+                next_cursor=page.next_cursor,
+                total=page.total
+            )
+        )
+    
     async def update_event(self, event_id: int, event_schema: EventCreateSchema, admin_user_id: int = 1) -> EventResponseSchema:
         """Update an existing event (admin only)"""
         try:
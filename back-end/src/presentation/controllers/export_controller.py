@@ -0,0 +1,75 @@
+"""
+Export controller for attendee export requests
+"""
+
+from fastapi import HTTPException, status
+from ...application.dtos.export_dto import ExportJobDTO, ExportJobStatus, ExportFileDTO, ExportStreamDTO
+from ...application.use_cases.export_use_cases import ExportUseCases
+from ..schemas.export_schemas import ExportJobSchema
+
+
+class ExportController:
+    """Controller for export operations"""
+    
+    def __init__(self, export_use_cases: ExportUseCases, download_url_prefix: str):
+        self._export_use_cases = export_use_cases
+        self._download_url_prefix = download_url_prefix
+    
+    async def open_attendee_stream(self, event_id: int, export_format: str) -> ExportStreamDTO:
+        """Validate the request and return the export stream with its file name and media type"""
+        try:
+            return await self._export_use_cases.stream_attendees(event_id, export_format)
+        except ValueError as e:
+            raise self._to_http_error(e)
+    
+    async def start_attendee_export(self, event_id: int, export_format: str) -> ExportJobSchema:
+        """Start a background attendee export"""
+        try:
+            job = await self._export_use_cases.start_attendee_export(event_id, export_format)
+        except ValueError as e:
+            raise self._to_http_error(e)
+        
+        return self._to_schema(job)
+    
+    def get_job(self, job_id: str) -> ExportJobSchema:
+        """Get the progress of an export job"""
+        try:
+            job = self._export_use_cases.get_job(job_id)
+        except ValueError as e:
+            raise self._to_http_error(e)
+        
+        return self._to_schema(job)
+    
+    def get_job_file(self, job_id: str) -> ExportFileDTO:
+        """Get the file of a completed export job"""
+        try:
+            return self._export_use_cases.get_job_file(job_id)
+        except ValueError as e:
+            if "not found" in str(e):
+                raise self._to_http_error(e)
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    def _to_schema(self, job: ExportJobDTO) -> ExportJobSchema:
+        return ExportJobSchema(
+            id=job.id,
+            event_id=job.event_id,
+            format=job.format,
+            status=job.status.value,
+            total_rows=job.total_rows,
+            rows_written=job.rows_written,
+            progress_percentage=job.progress_percentage,
+            created_at=job.created_at,
+            finished_at=job.finished_at,
+            download_url=(
+                f"{self._download_url_prefix}/{job.id}/download"
+                if job.status == ExportJobStatus.COMPLETED else None
+            ),
+            error=job.error
+        )
+    
+    @staticmethod
+    def _to_http_error(error: ValueError) -> HTTPException:
+        """404 for missing resources, 400 for invalid requests"""
+        if "not found" in str(error):
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -0,0 +1,58 @@
+"""
+Sales controller for event sales curve requests
+"""
+
+from typing import Optional
+from datetime import datetime
+from fastapi import HTTPException, status
+from ...domain.entities.sales_rollup import SalesInterval
+from ...application.use_cases.sales_rollup_use_cases import SalesRollupUseCases
+from ..schemas.sales_schemas import SalesPointSchema, SalesSeriesSchema
+
+
+class SalesController:
+    """Controller for event sales operations"""
+    
+    def __init__(self, sales_rollup_use_cases: SalesRollupUseCases):
+        self._sales_rollup_use_cases = sales_rollup_use_cases
+    
+    async def get_sales_series(
+        self,
+        event_id: int,
+        interval: SalesInterval,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> SalesSeriesSchema:
+        """Get an event's sales per hour or day"""
+        try:
+            series = await self._sales_rollup_use_cases.get_sales_series(event_id, interval, start, end)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND if "not found" in str(e)
+                else status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        return SalesSeriesSchema(
+            event_id=series.event_id,
+            interval=series.interval.value,
+            start=series.start,
+            end=series.end,
+            total_net_tickets=series.total_net_tickets,
+            total_net_revenue=series.total_net_revenue,
+            points=[
+                SalesPointSchema(
+                    bucket_start=point.bucket_start,
+                    bookings=point.bookings,
+                    tickets_sold=point.tickets_sold,
+                    revenue=point.revenue,
+                    cancellations=point.cancellations,
+                    cancelled_tickets=point.cancelled_tickets,
+                    cancelled_revenue=point.cancelled_revenue,
+                    net_tickets=point.net_tickets,
+                    net_revenue=point.net_revenue,
+                    cumulative_net_tickets=point.cumulative_net_tickets
+                )
+                for point in series.points
+            ]
+        )
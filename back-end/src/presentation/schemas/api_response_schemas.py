@@ -59,6 +59,21 @@ class ApiListResponse(BaseModel, Generic[T]):
         )
 
 
+class ApiPageResponse(ApiListResponse[T], Generic[T]):
+    """Standard API response format for paginated list endpoints"""
+    pagination: Optional[dict] = None
+    
+    @classmethod
+    def page_response(cls, data: list[T], pagination: dict, message: str = "Operation successful") -> "ApiPageResponse[T]":
+        """Create a successful page response"""
+        return cls(
+            success=True,
+            message=message,
+            data=data,
+            pagination=pagination
+        )
+
+
 # Response types for different data models
 class UserApiResponse(ApiResponse[dict]):
     """API response for user data"""
@@ -85,6 +100,11 @@ class EventListApiResponse(ApiListResponse[dict]):
     pass
 
 
+class EventPageApiResponse(ApiPageResponse[dict]):
+    """API response for event list data, with pagination metadata when paged"""
+    pass
+
+
 class EventManagementApiResponse(ApiListResponse[dict]):
     """API response for event management data with statistics"""
     pass
@@ -93,3 +113,8 @@ class EventManagementApiResponse(ApiListResponse[dict]):
 class BookingListApiResponse(ApiListResponse[dict]):
     """API response for booking list data"""
     pass
+
+
+class BookingPageApiResponse(ApiPageResponse[dict]):
+    """API response for booking list data, with pagination metadata when paged"""
+    pass
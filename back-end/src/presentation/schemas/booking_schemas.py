@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from ...domain.entities.booking import BookingStatus
@@ -44,3 +44,16 @@ class BookingWithDetailsSchema(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class BookingPaginationSchema(BaseModel):
+    """Pydantic schema for keyset pagination metadata"""
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+class BookingPageSchema(BaseModel):
+    """Pydantic schema for one page of bookings"""
+    bookings: List[BookingWithDetailsSchema]
+    pagination: BookingPaginationSchema
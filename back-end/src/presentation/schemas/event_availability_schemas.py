@@ -31,3 +31,14 @@ class MultipleEventAvailabilitySchema(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+class AvailabilityCacheStatsSchema(BaseModel):
+    """Schema for availability cache counters"""
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    max_size: int = 0
+    hit_ratio: float = 0.0
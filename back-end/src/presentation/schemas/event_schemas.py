@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from ...domain.entities.event import EventStatus
@@ -42,6 +43,20 @@ class EventResponseSchema(BaseModel):
         from_attributes = True
 
 
+class EventPaginationSchema(BaseModel):
+    """Pydantic schema for keyset pagination metadata"""
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+class EventPageSchema(BaseModel):
+    """Pydantic schema for one page of events"""
+    events: List[EventResponseSchema]
+    pagination: EventPaginationSchema
+
+
 class EventManagementSchema(BaseModel):
     """Pydantic schema for event management view with statistics"""
     id: int
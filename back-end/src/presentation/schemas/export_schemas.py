@@ -0,0 +1,23 @@
+"""
+Export API Schemas
+Pydantic models for attendee export jobs
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class ExportJobSchema(BaseModel):
+    """Schema for a background export job and its progress"""
+    id: str = Field(..., description="Export job ID")
+    event_id: int = Field(..., description="Exported event")
+    format: str = Field(..., description="Export format (csv, parquet, arrow)")
+    status: str = Field(..., description="pending, running, completed or failed")
+    total_rows: int = Field(..., description="Tickets to export, counted when the job started")
+    rows_written: int = Field(..., description="Tickets written so far")
+    progress_percentage: float = Field(..., description="Share of rows written")
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    download_url: Optional[str] = Field(None, description="Where to fetch the file once completed")
+    error: Optional[str] = Field(None, description="Failure reason")
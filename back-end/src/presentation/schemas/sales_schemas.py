@@ -0,0 +1,36 @@
+"""
+Sales API Schemas
+Pydantic models for event sales curves
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+
+
+class SalesPointSchema(BaseModel):
+    """Schema for the sales of one hour or day"""
+    bucket_start: datetime = Field(..., description="Start of the UTC hour or day")
+    bookings: int
+    tickets_sold: int
+    revenue: Decimal
+    cancellations: int = Field(..., description="Cancelled bookings that were made in this bucket")
+    cancelled_tickets: int
+    cancelled_revenue: Decimal
+    net_tickets: int
+    net_revenue: Decimal
+    cumulative_net_tickets: int = Field(
+        ..., description="Net tickets sold up to the end of this bucket, including sales before the series start"
+    )
+
+
+class SalesSeriesSchema(BaseModel):
+    """Schema for an event's sales curve"""
+    event_id: int
+    interval: str = Field(..., description="hour or day")
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    total_net_tickets: int
+    total_net_revenue: Decimal
+    points: List[SalesPointSchema] = Field(..., description="Buckets with sales, oldest first")
@@ -4,7 +4,7 @@ Pydantic models for request/response validation for ticket validation endpoints
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -30,6 +30,20 @@ class TicketUseRequest(BaseModel):
         return v.strip()
 
 
+class TicketBatchRequest(BaseModel):
+    """Request schema for validating or using a batch of tickets"""
+    ticket_codes: List[str] = Field(
+        ..., min_length=1, max_length=1000, description="Ticket codes to process, at most 1000"
+    )
+    
+    @validator('ticket_codes')
+    def validate_ticket_codes(cls, v):
+        codes = [code.strip() if code else "" for code in v]
+        if any(len(code) < 8 or len(code) > 100 for code in codes):
+            raise ValueError('Each ticket code must be between 8 and 100 characters')
+        return codes
+
+
 class TicketValidationResponse(BaseModel):
     """Response schema for ticket validation"""
     ticket_code: str = Field(..., description="Unique ticket code")
@@ -57,3 +71,10 @@ class TicketValidationResponse(BaseModel):
                 "user_name": "John Doe"
             }
         }
+
+
+class TicketBatchResponse(BaseModel):
+    """Response schema for a batch of ticket validation results"""
+    results: List[TicketValidationResponse] = Field(..., description="Per-code results, in request order")
+    processed: int = Field(..., description="Number of ticket codes processed")
+    succeeded: int = Field(..., description="Number of tickets that are valid (validate) or were used (use)")
@@ -1,9 +1,18 @@
 """
-Response utilities for converting Pydantic models to dictionaries
+Response utilities for converting Pydantic models to dictionaries, or for
+encoding response envelopes straight to JSON
 """
 
+import os
 from typing import Any, Dict, List, Union
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
+
+# Encode read endpoint envelopes in one pass instead of dumping the schemas to
+# dicts and letting FastAPI validate and encode them again. The bytes are the
+# same either way; set to false to go back to the dict path.
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
 
 
 def model_to_dict(model: BaseModel) -> Dict[str, Any]:
@@ -29,3 +38,30 @@ def prepare_response_data(data: Union[BaseModel, List[BaseModel], Dict[str, Any]
             return data
     else:
         return data
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core's serializer
+    
+    Schemas, dataclasses, dicts and plain row tuples are written straight to
+    bytes, with the same output as FastAPI's own encoding of response models
+    (decimals as strings, ISO datetimes).
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def render_response(response: BaseModel) -> Union[BaseModel, FastJSONResponse]:
+    """
+    Return value for an endpoint whose envelope holds schemas (or rows) as data
+    
+    In fast mode the envelope is encoded straight to JSON and FastAPI skips
+    validating it against the endpoint's response_model, which then only
+    documents the response. Otherwise the data is converted to dictionaries as
+    before.
+    """
+    if FAST_JSON_RESPONSES:
+        return FastJSONResponse(response)
+    response.data = prepare_response_data(response.data)
+    return response
@@ -0,0 +1,43 @@
+"""
+Shared test setup: each test gets a fresh in-memory SQLite database
+"""
+
+import os
+import tempfile
+
+# Before anything reads the configuration (the connection module, the container)
+os.environ["DATABASE_URL"] = "sqlite://:memory:"
+os.environ["DATABASE_REPLICA_URLS"] = ""
+os.environ["EXPORT_DIR"] = tempfile.mkdtemp(prefix="exports-")
+
+import httpx
+import pytest
+from src.container import container
+from src.infrastructure.database.connection import close_db, init_db
+from src.main import app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def database():
+    """Connections to a new empty database for the test's duration"""
+    await init_db()
+    yield
+    await close_db()
+
+
+@pytest.fixture
+async def client(database):
+    """HTTP client calling the application in process"""
+    # The container outlives the database: drop rows cached by earlier tests
+    if container.availability_cache:
+        await container.availability_cache.clear()
+    if container.event_cache:
+        await container.event_cache.clear()
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http_client:
+        yield http_client
@@ -0,0 +1,90 @@
+"""
+Loads of one event-loop tick share a single batch, and every caller gets an
+answer: the value, the batch's error, or a cancellation, with no key left
+waiting for a batch that is gone.
+"""
+
+import asyncio
+import pytest
+from src.infrastructure.database.batch_loader import BatchLoader
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingBatchLoad:
+    """``batch_load`` function returning ``key * 10``, recording each batch"""
+    
+    def __init__(self, error: Exception = None):
+        self.batches = []
+        self.error = error
+        self.release = asyncio.Event()
+        self.release.set()
+    
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return {key: key * 10 for key in keys if key != 404}
+
+
+async def test_loads_of_one_tick_share_a_batch(database):
+    batch_load = RecordingBatchLoad()
+    loader = BatchLoader(batch_load, max_batch_size=2)
+    
+    values = await asyncio.gather(*(loader.load(key) for key in [1, 2, 1, 3, 404]))
+    
+    assert values == [10, 20, 10, 30, None]
+    assert batch_load.batches == [[1, 2], [3, 404]]
+    assert (loader.loads, loader.coalesced, loader.batches) == (5, 1, 2)
+    assert not loader._in_flight and not loader._fetches
+
+
+async def test_batch_error_reaches_every_caller_and_is_not_kept(database):
+    batch_load = RecordingBatchLoad(error=RuntimeError("database went away"))
+    loader = BatchLoader(batch_load)
+    
+    results = await asyncio.gather(loader.load(1), loader.load(1), loader.load(2), return_exceptions=True)
+    
+    assert [str(result) for result in results] == ["database went away"] * 3
+    assert not loader._in_flight
+    
+    # The next load runs a new batch instead of sharing the failed one
+    batch_load.error = None
+    assert await loader.load(1) == 10
+    assert batch_load.batches == [[1, 2], [1]]
+
+
+async def test_cancelled_batch_releases_its_callers(database):
+    batch_load = RecordingBatchLoad()
+    batch_load.release.clear()
+    loader = BatchLoader(batch_load)
+    
+    callers = [asyncio.ensure_future(loader.load(key)) for key in [1, 1, 2]]
+    while not batch_load.batches:
+        await asyncio.sleep(0)
+    for fetch in list(loader._fetches):
+        fetch.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+    
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not loader._in_flight and not loader._fetches
+    
+    batch_load.release.set()
+    assert await loader.load(1) == 10
+
+
+async def test_caller_giving_up_does_not_cancel_the_batch(database):
+    batch_load = RecordingBatchLoad()
+    batch_load.release.clear()
+    loader = BatchLoader(batch_load)
+    
+    impatient = asyncio.ensure_future(loader.load(1))
+    patient = asyncio.ensure_future(loader.load(1))
+    while not batch_load.batches:
+        await asyncio.sleep(0)
+    impatient.cancel()
+    batch_load.release.set()
+    
+    assert await patient == 10
+    assert impatient.cancelled()
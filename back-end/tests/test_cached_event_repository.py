@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.application.use_cases.event_availability_use_cases import EventAvailabilityUseCases
+from src.domain.entities.booking import Booking, BookingStatus
+from src.domain.entities.event import EventFilter, EventStatus
+from src.domain.entities.user import User, UserRole
+from src.infrastructure.cache.memory_cache import InMemoryLRUCache
+from src.infrastructure.database.models import EventModel
+from src.infrastructure.repositories import (
+    BookingRepositoryImpl, CachedEventRepository, EventRepositoryImpl, UserRepositoryImpl
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_event(**fields) -> int:
+    """Insert an event row directly, as SQL or an admin tool would"""
+    values = dict(
+        title="Open air",
+        description="Free concert in the park",
+        venue="City Park",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=100,
+        price=Decimal("0.00"),
+        status=EventStatus.ACTIVE,
+    )
+    values.update(fields)
+    return (await EventModel.create(**values)).id
+
+
+async def test_free_event_is_served_from_the_cache(database):
+    event_id = await create_event()
+    events = CachedEventRepository(EventRepositoryImpl(), InMemoryLRUCache(ttl_seconds=60))
+    
+    # First call fills the cache, second one is served from it
+    for _ in range(2):
+        event = await events.get_by_id(event_id)
+        assert event.price == 0
+        assert [event.id for event in await events.get_all()] == [event_id]
+        assert [event.id for event in await events.get_filtered(EventFilter())] == [event_id]
+        assert event_id in await events.get_availability_by_ids([event_id])
+    
+    assert events.get_cache_stats().hits > 0
+
+
+async def test_cached_copies_are_not_shared(database):
+    event_id = await create_event()
+    events = CachedEventRepository(EventRepositoryImpl(), InMemoryLRUCache(ttl_seconds=60))
+    
+    (await events.get_by_id(event_id)).title = "Changed by a caller"
+    
+    assert (await events.get_by_id(event_id)).title == "Open air"
+
+
+async def test_updates_and_bookings_invalidate_the_cache(database):
+    event_id = await create_event(price=Decimal("10.00"))
+    cache = InMemoryLRUCache(ttl_seconds=60)
+    events = CachedEventRepository(EventRepositoryImpl(), cache)
+    # A second worker sharing the cache
+    other_worker = CachedEventRepository(EventRepositoryImpl(), cache)
+    await other_worker.get_by_id(event_id)
+    await other_worker.get_all()
+    
+    event = await events.get_by_id(event_id)
+    event.title = "Open air, second night"
+    await events.update(event)
+    assert (await other_worker.get_by_id(event_id)).title == "Open air, second night"
+    
+    user = await UserRepositoryImpl().create(User(id=None, name="Ann", phone="0811111111", role=UserRole.CUSTOMER))
+    await BookingRepositoryImpl().create(Booking(
+        id=None, user_id=user.id, event_id=event_id, quantity=3,
+        total_amount=Decimal("30.00"), booking_date=datetime.now(timezone.utc), status=BookingStatus.CONFIRMED
+    ))
+    await events.mark_bookings_changed(event_id)
+    assert (await other_worker.get_by_id(event_id)).total_tickets_sold == 3
+    assert (await other_worker.get_all())[0].total_tickets_sold == 3
+    assert (await other_worker.get_availability_by_ids([event_id]))[event_id].total_tickets_sold == 3
+
+
+async def test_availability_follows_bookings_made_in_another_worker(database):
+    event_id = await create_event(price=Decimal("10.00"))
+    cache = InMemoryLRUCache(ttl_seconds=60)
+    # Two workers sharing the cache tier, as the container wires them
+    workers = [
+        EventAvailabilityUseCases(CachedEventRepository(EventRepositoryImpl(), cache))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        assert (await worker.get_event_availability(event_id)).booked_tickets == 0
+        assert (await worker.get_all_active_events_availability())[event_id].booked_tickets == 0
+    
+    user = await UserRepositoryImpl().create(User(id=None, name="Ben", phone="0822222222", role=UserRole.CUSTOMER))
+    await BookingRepositoryImpl().create(Booking(
+        id=None, user_id=user.id, event_id=event_id, quantity=2,
+        total_amount=Decimal("20.00"), booking_date=datetime.now(timezone.utc), status=BookingStatus.CONFIRMED
+    ))
+    await workers[0].notify_availability_changed(event_id)
+    
+    assert (await workers[1].get_event_availability(event_id)).booked_tickets == 2
+    assert (await workers[1].get_all_active_events_availability())[event_id].booked_tickets == 2
+    assert cache.stats().hits > 0
@@ -0,0 +1,47 @@
+"""
+The event list keeps its original envelope when it is not paged; pages add
+"pagination" next to "data". Checked with both response encoders.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.infrastructure.database.models import EventModel
+from src.presentation.utils import response_utils
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=[True, False], ids=["fast-json", "validated"])
+async def events_client(request, client, monkeypatch):
+    """Client of an app encoding envelopes directly or through the response model, with three events"""
+    monkeypatch.setattr(response_utils, "FAST_JSON_RESPONSES", request.param)
+    for day in range(3):
+        await EventModel.create(
+            title=f"Night {day}",
+            description="Listed",
+            venue="Hall",
+            date_time=datetime.now(timezone.utc) + timedelta(days=day + 1),
+            capacity=10,
+            price=Decimal("10.00")
+        )
+    return client
+
+
+async def test_unpaged_list_has_no_pagination(events_client):
+    response = await events_client.get("/api/v1/events")
+    
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert set(body) == {"success", "message", "data"}
+    assert [event["title"] for event in body["data"]] == ["Night 0", "Night 1", "Night 2"]
+
+
+async def test_page_has_pagination(events_client):
+    response = await events_client.get("/api/v1/events", params={"limit": 2})
+    
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert set(body) == {"success", "message", "data", "pagination"}
+    assert [event["title"] for event in body["data"]] == ["Night 0", "Night 1"]
+    assert body["pagination"]["has_more"] is True
@@ -0,0 +1,70 @@
+"""
+Event search on PostgreSQL falls back to the in-process index without migration 006
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+import pytest
+from src.infrastructure.database.models import EventModel
+from src.infrastructure.repositories import EventRepositoryImpl
+from src.infrastructure.repositories import event_repository_impl
+
+pytestmark = pytest.mark.anyio
+
+
+class FakePostgresConnection:
+    """Stands in for a PostgreSQL connection: answers the migration check, records other queries"""
+    
+    capabilities = SimpleNamespace(dialect="postgres")
+    
+    def __init__(self, has_search_vector: bool, has_pg_trgm: bool):
+        self._check_row = {"has_search_vector": has_search_vector, "has_pg_trgm": has_pg_trgm}
+        self.checks = 0
+        self.searches = 0
+    
+    async def execute_query_dict(self, sql, values=None):
+        if "pg_extension" in sql:
+            self.checks += 1
+            return [self._check_row]
+        self.searches += 1
+        return []
+
+
+@pytest.fixture
+async def events(database):
+    for title, venue in (("Jazz Night", "Blue Note"), ("Rock Festival", "Arena")):
+        await EventModel.create(
+            title=title,
+            description="Live music",
+            venue=venue,
+            date_time=datetime.now(timezone.utc) + timedelta(days=30),
+            capacity=100,
+            price=Decimal("30.00")
+        )
+
+
+@pytest.mark.parametrize("has_search_vector, has_pg_trgm", [(False, True), (True, False), (False, False)])
+async def test_search_falls_back_without_migration_006(events, monkeypatch, has_search_vector, has_pg_trgm):
+    connection = FakePostgresConnection(has_search_vector, has_pg_trgm)
+    monkeypatch.setattr(event_repository_impl, "get_connection", lambda: connection)
+    repository = EventRepositoryImpl()
+    
+    for _ in range(2):
+        # Prefix and typo tolerant like the PostgreSQL path
+        assert [event.title for event in await repository.search("jaz")] == ["Jazz Night"]
+    
+    assert connection.checks == 1
+    assert connection.searches == 0
+
+
+async def test_search_uses_postgres_after_migration_006(events, monkeypatch):
+    connection = FakePostgresConnection(has_search_vector=True, has_pg_trgm=True)
+    monkeypatch.setattr(event_repository_impl, "get_connection", lambda: connection)
+    repository = EventRepositoryImpl()
+    
+    await repository.search("jazz")
+    await repository.search("rock")
+    
+    assert connection.checks == 1
+    assert connection.searches == 2
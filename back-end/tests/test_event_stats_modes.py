@@ -0,0 +1,131 @@
+"""
+Event counters stay equal to the confirmed bookings under concurrent writes,
+whether the booking repository (app mode) or the database trigger keeps them.
+Trigger mode needs PostgreSQL: set TEST_POSTGRES_URL to a server where a
+scratch database may be created, otherwise those cases are skipped.
+"""
+
+import asyncio
+import copy
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+import pytest
+from tortoise import Tortoise
+from src.domain.entities.booking import Booking, BookingStatus
+from src.infrastructure.database.connection import build_connection_config, close_db, init_db
+from src.infrastructure.database.models import EventModel, UserModel
+from src.infrastructure.database.routing import PRIMARY_CONNECTION
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl, EventStatsMode
+
+pytestmark = pytest.mark.anyio
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+STATS_TRIGGER_MIGRATION = Path(__file__).parents[1] / "migrations" / "009_fix_event_stats_trigger.sql"
+PRICE = Decimal("12.50")
+
+
+@pytest.fixture(params=[
+    pytest.param((EventStatsMode.APP, "sqlite"), id="app-sqlite"),
+    pytest.param((EventStatsMode.APP, "postgres"), id="app-postgres"),
+    pytest.param((EventStatsMode.TRIGGER, "postgres"), id="trigger-postgres"),
+])
+async def event_stats_mode(request):
+    """Mode under test, with a new empty database that supports it"""
+    mode, backend = request.param
+    if backend == "sqlite":
+        await init_db()
+        yield mode
+        await close_db()
+        return
+    
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    connection = build_connection_config(TEST_POSTGRES_URL)
+    connection["credentials"]["database"] = f"event_stats_{uuid.uuid4().hex[:12]}"
+    await Tortoise.init(
+        config={
+            "connections": {PRIMARY_CONNECTION: connection},
+            "apps": {
+                "models": {
+                    "models": ["src.infrastructure.database.models"],
+                    "default_connection": PRIMARY_CONNECTION,
+                },
+            },
+        },
+        _create_db=True
+    )
+    try:
+        await Tortoise.generate_schemas()
+        if mode == EventStatsMode.TRIGGER:
+            await Tortoise.get_connection(PRIMARY_CONNECTION).execute_script(STATS_TRIGGER_MIGRATION.read_text())
+        yield mode
+    finally:
+        await Tortoise._drop_databases()
+
+
+def with_changes(booking: Booking, **changes) -> Booking:
+    """Copy of ``booking`` with some fields changed, as a use case would save it"""
+    changed = copy.copy(booking)
+    for field, value in changes.items():
+        setattr(changed, field, value)
+    return changed
+
+
+async def test_counters_match_confirmed_bookings_under_concurrent_writes(event_stats_mode):
+    bookings = BookingRepositoryImpl(event_stats_mode=event_stats_mode)
+    user = await UserModel.create(name="Counter Tester", phone="5550117")
+    event = await EventModel.create(
+        title="Counted show",
+        description="Bookings come and go",
+        venue="Main Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=1000,
+        price=PRICE
+    )
+    
+    def new_booking(index: int, status: BookingStatus = BookingStatus.CONFIRMED) -> Booking:
+        quantity = index % 4 + 1
+        return Booking(
+            id=None,
+            user_id=user.id,
+            event_id=event.id,
+            quantity=quantity,
+            total_amount=PRICE * quantity,
+            booking_date=None,
+            status=status
+        )
+    
+    # Every fifth booking starts out cancelled
+    created = await asyncio.gather(*(
+        bookings.create(new_booking(
+            index, BookingStatus.CANCELLED if index % 5 == 0 else BookingStatus.CONFIRMED
+        ))
+        for index in range(40)
+    ))
+    confirmed = [booking for booking in created if booking.is_confirmed()]
+    cancelled = [booking for booking in created if booking.is_cancelled()]
+    
+    await asyncio.gather(
+        # Each cancellation is sent twice, as a double-clicked button would
+        *(bookings.update(with_changes(booking, status=BookingStatus.CANCELLED)) for booking in confirmed[:10] * 2),
+        *(bookings.update(with_changes(booking, status=BookingStatus.CONFIRMED)) for booking in cancelled[:4]),
+        *(bookings.delete(booking.id) for booking in confirmed[10:15] + cancelled[4:]),
+        *(
+            bookings.update(with_changes(
+                booking, quantity=booking.quantity + 1, total_amount=booking.total_amount + PRICE
+            ))
+            for booking in confirmed[15:20]
+        ),
+        *(bookings.create(new_booking(index)) for index in range(40, 50))
+    )
+    
+    [expected] = await bookings.aggregate(event_id=event.id, status=BookingStatus.CONFIRMED)
+    assert expected.booking_count == 32 - 10 + 4 - 5 + 10
+    
+    event = await EventModel.get(id=event.id)
+    assert event.total_tickets_sold == expected.total_quantity
+    assert event.total_revenue == expected.total_amount
+    assert event.total_bookings == expected.booking_count
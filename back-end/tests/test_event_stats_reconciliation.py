@@ -0,0 +1,126 @@
+"""
+The reconciliation job reports event counters that drifted from the
+confirmed bookings and writes the recomputed values back; incremental runs
+only look at events whose bookings changed since the previous run.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+import reconcile_event_stats
+from src.domain.entities.booking import Booking, BookingStatus
+from src.infrastructure.database.models import EventModel, UserModel
+from src.infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+
+pytestmark = pytest.mark.anyio
+
+PRICE = Decimal("20.00")
+
+
+@pytest.fixture
+def run_job(database, monkeypatch, tmp_path, capsys):
+    """Runs the job against the test database and returns what it printed"""
+    # The test database is already open, and closing it would discard it
+    async def keep_database():
+        pass
+    
+    monkeypatch.setattr(reconcile_event_stats, "init_db", keep_database)
+    monkeypatch.setattr(reconcile_event_stats, "close_db", keep_database)
+    
+    async def run(full: bool = False) -> str:
+        capsys.readouterr()
+        await reconcile_event_stats.reconcile_event_stats(
+            full=full,
+            dry_run=False,
+            state_file=str(tmp_path / "state.json"),
+            batch_size=2,
+            safety_margin=timedelta(0)
+        )
+        return capsys.readouterr().out
+    
+    return run
+
+
+@pytest.fixture
+async def book(database):
+    """Creates an event and returns a function booking ``quantity`` tickets of it"""
+    user = await UserModel.create(name="Drift Tester", phone="0812345678")
+    bookings = BookingRepositoryImpl()
+    
+    async def create_event(title: str) -> int:
+        event = await EventModel.create(
+            title=title,
+            description="Counted by the reconciliation job",
+            venue="Main Hall",
+            date_time=datetime.now(timezone.utc) + timedelta(days=30),
+            capacity=100,
+            price=PRICE
+        )
+        return event.id
+    
+    async def book_tickets(event_id: int, quantity: int) -> None:
+        await bookings.create(Booking(
+            id=None,
+            user_id=user.id,
+            event_id=event_id,
+            quantity=quantity,
+            total_amount=PRICE * quantity,
+            booking_date=None,
+            status=BookingStatus.CONFIRMED
+        ))
+    
+    return create_event, book_tickets
+
+
+async def corrupt(event_id: int) -> None:
+    """Overwrite an event's counters, as a lost update or a manual edit would"""
+    await EventModel.filter(id=event_id).update(total_tickets_sold=99, total_revenue=Decimal("1.00"))
+
+
+async def counters(event_id: int) -> tuple:
+    event = await EventModel.get(id=event_id)
+    return event.total_tickets_sold, event.total_revenue, event.total_bookings
+
+
+async def test_full_run_reports_and_repairs_drift(run_job, book):
+    create_event, book_tickets = book
+    event_ids = [await create_event(f"Show {number}") for number in range(3)]
+    for event_id in event_ids:
+        await book_tickets(event_id, 2)
+        await book_tickets(event_id, 1)
+    await corrupt(event_ids[1])
+    
+    output = await run_job(full=True)
+    
+    assert "Events checked: 3" in output
+    assert "Events drifted: 1 (33.33%)" in output
+    assert "Events repaired: 1" in output
+    assert "Drift: 96 tickets, 59.00 revenue, 0 bookings" in output
+    assert f"Event {event_ids[1]}: tickets 99 -> 3, revenue 1.00 -> 60.00, bookings 2 -> 2" in output
+    for event_id in event_ids:
+        assert await counters(event_id) == (3, Decimal("60.00"), 2)
+    
+    # Nothing is left to repair
+    assert "Events drifted: 0" in await run_job(full=True)
+
+
+async def test_incremental_run_only_checks_events_booked_since_the_last_run(run_job, book):
+    create_event, book_tickets = book
+    booked_again, untouched = await create_event("Booked again"), await create_event("Untouched")
+    await book_tickets(booked_again, 1)
+    await book_tickets(untouched, 1)
+    assert "Events checked: 2" in await run_job(full=True)
+    
+    await book_tickets(booked_again, 2)
+    await corrupt(booked_again)
+    await corrupt(untouched)
+    output = await run_job()
+    
+    assert "incremental since" in output
+    assert "Events checked: 1" in output
+    assert "Events repaired: 1" in output
+    assert await counters(booked_again) == (3, Decimal("60.00"), 2)
+    # Its bookings did not change, so only the next full run finds the drift
+    assert await counters(untouched) == (99, Decimal("1.00"), 1)
+    assert "Events repaired: 1" in await run_job(full=True)
+    assert await counters(untouched) == (1, Decimal("20.00"), 1)
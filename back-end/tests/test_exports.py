@@ -0,0 +1,176 @@
+"""
+Attendee export files are named after the writer's format, streamed or written
+in the background, and hold every ticket of the event exactly once whatever
+the chunk size; a failed background job reports why
+"""
+
+import asyncio
+import csv
+import io
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.application.dtos.export_dto import ExportJobStatus
+from src.application.use_cases.export_use_cases import ExportUseCases
+from src.container import container
+from src.infrastructure.database.models import EventModel, TicketModel, UserModel
+from src.infrastructure.export import PYARROW_AVAILABLE, ArrowExportWriter, CsvExportWriter, ParquetExportWriter
+
+pytestmark = pytest.mark.anyio
+
+needs_pyarrow = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="columnar exports need pyarrow")
+FORMATS = [
+    ("csv", "csv"),
+    pytest.param("parquet", "parquet", marks=needs_pyarrow),
+    # Arrow IPC streams are .arrows, not .arrow (the file format)
+    pytest.param("arrow", "arrows", marks=needs_pyarrow),
+]
+WRITERS = {"csv": CsvExportWriter, "parquet": ParquetExportWriter, "arrow": ArrowExportWriter}
+
+
+@pytest.fixture
+async def event_id(client):
+    user = await UserModel.create(name="Exporter", phone="5550199")
+    event = await EventModel.create(
+        title="Export night",
+        description="Attendees to export",
+        venue="Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=10,
+        price=Decimal("15.00")
+    )
+    response = await client.post("/api/v1/bookings", json={"user_id": user.id, "event_id": event.id, "quantity": 2})
+    assert response.status_code == 201, response.text
+    return event.id
+
+
+@pytest.mark.parametrize("export_format, extension", FORMATS)
+async def test_streamed_export_file_name(client, event_id, export_format, extension):
+    response = await client.get(f"/api/v1/exports/events/{event_id}/attendees", params={"format": export_format})
+    
+    assert response.status_code == 200, response.text
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="event-{event_id}-attendees.{extension}"'
+    )
+
+
+@pytest.mark.parametrize("export_format, extension", FORMATS)
+async def test_background_export_file_name(client, event_id, export_format, extension):
+    response = await client.post(f"/api/v1/exports/events/{event_id}/attendees", params={"format": export_format})
+    assert response.status_code == 202, response.text
+    job_id = response.json()["data"]["id"]
+    
+    for _ in range(100):
+        job = (await client.get(f"/api/v1/exports/jobs/{job_id}")).json()["data"]
+        if job["status"] == "completed":
+            break
+        await asyncio.sleep(0.01)
+    
+    assert job["status"] == "completed", job
+    response = await client.get(f"/api/v1/exports/jobs/{job_id}/download")
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith(f'.{extension}"')
+
+
+def exported_ticket_codes(export_format: str, data: bytes) -> list:
+    """Ticket codes of an export, in file order"""
+    if export_format == "csv":
+        return [row["ticket_code"] for row in csv.DictReader(io.StringIO(data.decode("utf-8")))]
+    
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    if export_format == "parquet":
+        table = pq.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    return table.column("ticket_code").to_pylist()
+
+
+def export_use_cases(export_dir: str, chunk_size: int, **writers) -> ExportUseCases:
+    """Export use cases reading ``chunk_size`` tickets per query"""
+    return ExportUseCases(
+        container.ticket_repository,
+        container.event_repository,
+        writers or WRITERS,
+        export_dir=export_dir,
+        chunk_size=chunk_size
+    )
+
+
+async def finished_job(use_cases: ExportUseCases, job_id: str):
+    for _ in range(100):
+        job = use_cases.get_job(job_id)
+        if job.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Export job still {job.status.value}")
+
+
+@pytest.fixture
+async def ticket_codes(event_id, client) -> list:
+    """Codes of the event's tickets in ID order, ten in all, and tickets of another event"""
+    user = await UserModel.create(name="Late Exporter", phone="0812345678")
+    other_event = await EventModel.create(
+        title="Other night",
+        description="Attendees not to export",
+        venue="Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=31),
+        capacity=10,
+        price=Decimal("15.00")
+    )
+    # Interleaved with the event's bookings, so its ticket IDs fall between theirs
+    for booked_event_id, quantity in [(event_id, 3), (other_event.id, 2), (event_id, 5), (other_event.id, 1)]:
+        response = await client.post(
+            "/api/v1/bookings", json={"user_id": user.id, "event_id": booked_event_id, "quantity": quantity}
+        )
+        assert response.status_code == 201, response.text
+    
+    return await TicketModel.filter(booking__event_id=event_id).order_by("id").values_list("ticket_code", flat=True)
+
+
+# Chunks that split bookings, end exactly on the last ticket, or hold every ticket at once
+@pytest.mark.parametrize("chunk_size", [1, 3, 5, 10, 64])
+@pytest.mark.parametrize("export_format, extension", FORMATS)
+async def test_export_holds_every_ticket_once(event_id, ticket_codes, tmp_path, export_format, extension, chunk_size):
+    assert len(ticket_codes) == 10
+    use_cases = export_use_cases(str(tmp_path), chunk_size)
+    
+    stream = await use_cases.stream_attendees(event_id, export_format)
+    streamed = b"".join([chunk async for chunk in stream.chunks])
+    assert exported_ticket_codes(export_format, streamed) == ticket_codes
+    
+    job = await finished_job(use_cases, (await use_cases.start_attendee_export(event_id, export_format)).id)
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+    assert job.rows_written == job.total_rows == len(ticket_codes)
+    with open(use_cases.get_job_file(job.id).path, "rb") as export_file:
+        assert exported_ticket_codes(export_format, export_file.read()) == ticket_codes
+
+
+class BrokenCsvExportWriter(CsvExportWriter):
+    """Fails on the second chunk, as a full disk or a bad row would"""
+    
+    def __init__(self):
+        super().__init__()
+        self._chunks = 0
+    
+    def write(self, records):
+        self._chunks += 1
+        if self._chunks == 2:
+            raise OSError("No space left on device")
+        return super().write(records)
+
+
+async def test_failed_export_job_reports_its_error(event_id, tmp_path):
+    use_cases = export_use_cases(str(tmp_path), chunk_size=1, csv=BrokenCsvExportWriter)
+    
+    job = await finished_job(use_cases, (await use_cases.start_attendee_export(event_id, "csv")).id)
+    
+    assert job.status == ExportJobStatus.FAILED
+    assert job.error == "No space left on device"
+    assert job.rows_written == 1
+    assert job.finished_at is not None
+    # Neither the partial file nor a finished one is left behind
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(ValueError, match="Export job is failed"):
+        use_cases.get_job_file(job.id)
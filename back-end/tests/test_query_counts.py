@@ -0,0 +1,99 @@
+"""
+Queries each endpoint sends, counted from the statements Tortoise logs.
+A rise means a request started loading something again that the identity map
+or a combined statement used to cover; lower the numbers when a change saves
+queries.
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.infrastructure.database.models import EventModel, TicketModel, UserModel
+
+pytestmark = pytest.mark.anyio
+
+# Method, URL, request options and the statements the request sends; the
+# URL and options are filled in with the ids and a ticket code of a booking
+ENDPOINT_QUERIES = [
+    pytest.param(
+        "POST", "/api/v1/bookings", {"json": {"user_id": "{user_id}", "event_id": "{event_id}", "quantity": 1}}, 8,
+        id="create booking"
+    ),
+    pytest.param("GET", "/api/v1/bookings/{booking_id}", {}, 2, id="get booking"),
+    pytest.param("GET", "/api/v1/bookings/user/{user_id}", {}, 3, id="user bookings"),
+    pytest.param("GET", "/api/v1/bookings/event/{event_id}", {}, 3, id="event bookings"),
+    pytest.param(
+        "PUT", "/api/v1/bookings/{booking_id}/status", {"params": {"status": "cancelled"}}, 6, id="cancel booking"
+    ),
+    pytest.param("PATCH", "/api/v1/events/{event_id}", {"json": {"title": "Renamed"}}, 2, id="patch event"),
+    pytest.param(
+        "POST", "/api/v1/tickets/validate", {"json": {"ticket_code": "{ticket_code}"}}, 1, id="validate ticket"
+    ),
+    pytest.param("POST", "/api/v1/tickets/use", {"json": {"ticket_code": "{ticket_code}"}}, 2, id="use ticket"),
+]
+
+
+class QueryLog(logging.Handler):
+    """Statements logged by every Tortoise database client"""
+    
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.statements = []
+    
+    def emit(self, record: logging.LogRecord):
+        self.statements.append(record.getMessage())
+
+
+@contextmanager
+def logged_queries():
+    """Collect the statements sent while the block runs"""
+    log = QueryLog()
+    logger = logging.getLogger("tortoise.db_client")
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(log)
+    try:
+        yield log
+    finally:
+        logger.removeHandler(log)
+        logger.setLevel(level)
+
+
+def fill_in(value, ids: dict):
+    """``value`` with every ``{name}`` placeholder replaced by ``ids[name]``"""
+    if isinstance(value, dict):
+        return {key: fill_in(item, ids) for key, item in value.items()}
+    if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+        return ids[value[1:-1]]
+    return value
+
+
+@pytest.fixture
+async def booking_ids(client) -> dict:
+    """Ids of a confirmed two-ticket booking made through the API, and one of its ticket codes"""
+    user = await UserModel.create(name="Query Counter", phone="0812345678")
+    event = await EventModel.create(
+        title="Counted queries",
+        description="Every statement is logged",
+        venue="Main Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=100,
+        price=Decimal("15.00")
+    )
+    response = await client.post("/api/v1/bookings", json={"user_id": user.id, "event_id": event.id, "quantity": 2})
+    assert response.status_code == 201, response.text
+    
+    booking_id = response.json()["data"]["id"]
+    ticket = await TicketModel.filter(booking_id=booking_id).order_by("id").first()
+    return {"booking_id": booking_id, "user_id": user.id, "event_id": event.id, "ticket_code": ticket.ticket_code}
+
+
+@pytest.mark.parametrize("method, url, options, expected", ENDPOINT_QUERIES)
+async def test_endpoint_query_count(client, booking_ids, method, url, options, expected):
+    with logged_queries() as log:
+        response = await client.request(method, url.format(**booking_ids), **fill_in(options, booking_ids))
+    
+    assert response.status_code < 300, response.text
+    assert len(log.statements) == expected, "\n".join(log.statements)
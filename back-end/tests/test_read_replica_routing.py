@@ -0,0 +1,107 @@
+"""
+Reads go to the replica, writes and locking reads to the primary, and a
+client's reads follow its own writes to the primary (read-your-writes).
+The primary and the replica are separate SQLite files holding different
+users, so every result shows which database answered.
+"""
+
+import httpx
+import pytest
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+from tortoise.utils import get_schema_sql
+from src.infrastructure.database.connection import build_connection_config
+from src.infrastructure.database.models import UserModel
+from src.infrastructure.database.routing import PRIMARY_CONNECTION, configure_replicas, read_routing_scope
+from src.main import PRIMARY_STICKY_COOKIE, app
+
+pytestmark = pytest.mark.anyio
+
+REPLICA_CONNECTION = "replica_0"
+
+
+@pytest.fixture
+async def replicated_database(tmp_path):
+    """A primary and a replica database; the replica's rows differ from the primary's"""
+    configure_replicas([REPLICA_CONNECTION])
+    await Tortoise.init(config={
+        "connections": {
+            PRIMARY_CONNECTION: build_connection_config(f"sqlite://{tmp_path / 'primary.db'}"),
+            REPLICA_CONNECTION: build_connection_config(f"sqlite://{tmp_path / 'replica.db'}"),
+        },
+        "apps": {
+            "models": {
+                "models": ["src.infrastructure.database.models"],
+                "default_connection": PRIMARY_CONNECTION,
+            },
+        },
+        "routers": ["src.infrastructure.database.routing.ReplicaRouter"],
+    })
+    await Tortoise.generate_schemas()
+    replica = Tortoise.get_connection(REPLICA_CONNECTION)
+    await replica.execute_script(get_schema_sql(Tortoise.get_connection(PRIMARY_CONNECTION), safe=False))
+    
+    await UserModel.create(name="Primary User", phone="5550001")
+    await replica.execute_insert(
+        "INSERT INTO users (name, phone, role) VALUES (?, ?, ?)", ["Replica User", "5550002", "customer"]
+    )
+    yield
+    await Tortoise.close_connections()
+    configure_replicas([])
+
+
+async def names(connection_name: str) -> list:
+    """User names stored in one database, read from it directly"""
+    rows = await Tortoise.get_connection(connection_name).execute_query_dict("SELECT name FROM users ORDER BY id")
+    return [row["name"] for row in rows]
+
+
+async def test_reads_use_the_replica(replicated_database):
+    with read_routing_scope():
+        assert await UserModel.all().values_list("name", flat=True) == ["Replica User"]
+        assert await UserModel.get_or_none(phone="5550001") is None
+
+
+async def test_writes_use_the_primary(replicated_database):
+    with read_routing_scope() as scope:
+        await UserModel.create(name="New User", phone="5550003")
+    
+    assert scope.wrote
+    assert await names(PRIMARY_CONNECTION) == ["Primary User", "New User"]
+    assert await names(REPLICA_CONNECTION) == ["Replica User"]
+
+
+async def test_locking_reads_use_the_primary(replicated_database):
+    with read_routing_scope():
+        assert [user.name for user in await UserModel.select_for_update().all()] == ["Primary User"]
+        async with in_transaction(PRIMARY_CONNECTION):
+            user = await UserModel.select_for_update().get(phone="5550001")
+            # Plain reads inside the transaction stay on the primary as well
+            assert await UserModel.all().values_list("name", flat=True) == ["Primary User"]
+    assert user.name == "Primary User"
+
+
+async def test_reads_after_a_write_use_the_primary(replicated_database):
+    with read_routing_scope():
+        await UserModel.filter(phone="5550001").update(name="Renamed User")
+        assert await UserModel.all().values_list("name", flat=True) == ["Renamed User"]
+    
+    # A new scope (the next request without the cookie) reads the replica again
+    with read_routing_scope():
+        assert await UserModel.all().values_list("name", flat=True) == ["Replica User"]
+
+
+async def test_primary_cookie_routes_the_next_requests_to_the_primary(replicated_database):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/users", json={"name": "Cookie User", "phone": "0812345678"})
+        assert response.status_code == 201, response.text
+        sticky = response.cookies.get(PRIMARY_STICKY_COOKIE)
+        assert sticky is not None
+        client.cookies.clear()
+        
+        response = await client.get("/api/v1/users", headers={"Cookie": f"{PRIMARY_STICKY_COOKIE}={sticky}"})
+        assert [user["name"] for user in response.json()["data"]] == ["Primary User", "Cookie User"]
+        
+        response = await client.get("/api/v1/users")
+        assert [user["name"] for user in response.json()["data"]] == ["Replica User"]
+        assert PRIMARY_STICKY_COOKIE not in response.cookies
@@ -0,0 +1,80 @@
+"""
+Sales rollups kept up by the booking write path equal the rollups rebuilt
+from the bookings table, and a sales curve starting mid-sale counts the
+tickets sold before its start in its running total.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.container import container
+from src.domain.entities.sales_rollup import SalesRollup, sales_bucket_start
+from src.infrastructure.database.models import EventModel, UserModel
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def event_id(client) -> int:
+    event = await EventModel.create(
+        title="Rolled up",
+        description="Sales counted per hour",
+        venue="Main Hall",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=100,
+        price=Decimal("25.00")
+    )
+    return event.id
+
+
+async def rollups(event_id: int) -> list:
+    return await container.sales_rollup_repository.get_by_event_id(event_id)
+
+
+async def test_incremental_rollups_equal_a_rebuild(client, event_id):
+    user = await UserModel.create(name="Rollup Tester", phone="0812345678")
+    booking_ids = []
+    for quantity in (1, 2, 3, 4):
+        response = await client.post(
+            "/api/v1/bookings", json={"user_id": user.id, "event_id": event_id, "quantity": quantity}
+        )
+        assert response.status_code == 201, response.text
+        booking_ids.append(response.json()["data"]["id"])
+    
+    for booking_id, status in [
+        (booking_ids[1], "cancelled"),
+        (booking_ids[2], "cancelled"),
+        (booking_ids[2], "confirmed"),
+        (booking_ids[3], "cancelled"),
+        (booking_ids[3], "confirmed"),
+        (booking_ids[3], "cancelled"),
+    ]:
+        response = await client.put(f"/api/v1/bookings/{booking_id}/status", params={"status": status})
+        assert response.status_code == 200, response.text
+    
+    incremental = await rollups(event_id)
+    assert sum(rollup.net_tickets for rollup in incremental) == 1 + 3
+    assert sum(rollup.cancellations for rollup in incremental) == 2
+    
+    await container.sales_rollup_use_cases.rebuild_rollups(event_id)
+    assert await rollups(event_id) == incremental
+
+
+async def test_running_total_includes_sales_before_the_start(event_id):
+    first_hour = sales_bucket_start(datetime.now(timezone.utc)) - timedelta(hours=3)
+    for hours, tickets_sold, cancelled_tickets in [(0, 5, 1), (1, 3, 0), (2, 2, 2), (3, 4, 0)]:
+        await container.sales_rollup_repository.increment(SalesRollup(
+            event_id=event_id,
+            bucket_start=first_hour + timedelta(hours=hours),
+            bookings=1,
+            tickets_sold=tickets_sold,
+            cancelled_tickets=cancelled_tickets
+        ))
+    
+    series = await container.sales_rollup_use_cases.get_sales_series(
+        event_id, start=first_hour + timedelta(hours=2, minutes=30)
+    )
+    
+    assert [point.net_tickets for point in series.points] == [0, 4]
+    assert [point.cumulative_net_tickets for point in series.points] == [7, 11]
+    assert series.total_net_tickets == 4
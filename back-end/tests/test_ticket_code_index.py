@@ -0,0 +1,113 @@
+"""
+The gate-side ticket code index rejects codes that were never issued without
+asking the database, and never turns away a real ticket: not one sold by
+another process after the index was filled, not one already used.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.application.dtos.ticket_dto import TicketValidationRequestDTO
+from src.application.use_cases.ticket_validation_use_cases import TicketValidationUseCases
+from src.container import container
+from src.domain.entities.ticket import TicketStatus
+from src.infrastructure.cache.ticket_code_index import SortedHashTicketCodeIndex
+from src.infrastructure.database.models import EventModel, TicketModel, UserModel
+from tests.test_query_counts import logged_queries
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def book_ticket(client):
+    """Books one ticket of a show through the API and returns its code"""
+    user = await UserModel.create(name="Gate Tester", phone="0812345678")
+    event = await EventModel.create(
+        title="Late sales",
+        description="Tickets sold while the doors are open",
+        venue="Arena",
+        date_time=datetime.now(timezone.utc) + timedelta(days=1),
+        capacity=100,
+        price=Decimal("30.00")
+    )
+    
+    async def book() -> str:
+        response = await client.post("/api/v1/bookings", json={"user_id": user.id, "event_id": event.id, "quantity": 1})
+        assert response.status_code == 201, response.text
+        ticket = await TicketModel.get(booking_id=response.json()["data"]["id"])
+        return ticket.ticket_code
+    
+    return book
+
+
+def gate(index: SortedHashTicketCodeIndex) -> TicketValidationUseCases:
+    """Validation use cases of a gate process holding ``index``"""
+    return TicketValidationUseCases(
+        container.ticket_repository,
+        container.booking_repository,
+        container.event_repository,
+        container.user_repository,
+        index
+    )
+
+
+async def validate(use_cases: TicketValidationUseCases, ticket_code: str):
+    return await use_cases.validate_ticket(TicketValidationRequestDTO(ticket_code=ticket_code))
+
+
+async def test_ticket_sold_after_the_index_loaded_is_valid(book_ticket):
+    first_code = await book_ticket()
+    use_cases = gate(SortedHashTicketCodeIndex())
+    await use_cases.load_ticket_code_index()
+    
+    # Sold through the API process, which does not share the gate's index
+    later_code = await book_ticket()
+    
+    validation = await validate(use_cases, later_code)
+    assert validation.is_valid, validation.message
+    assert validation.user_name == "Gate Tester"
+    assert use_cases.ticket_code_index.watermark > 0
+    assert (await validate(use_cases, first_code)).is_valid
+
+
+async def test_ticket_sold_after_the_snapshot_is_valid(book_ticket, tmp_path):
+    await book_ticket()
+    exporter = gate(SortedHashTicketCodeIndex())
+    await exporter.load_ticket_code_index()
+    exporter.ticket_code_index.save_snapshot(str(tmp_path / "tickets.idx"))
+    
+    later_code = await book_ticket()
+    snapshot = SortedHashTicketCodeIndex.from_snapshot(str(tmp_path / "tickets.idx"))
+    assert snapshot.watermark == exporter.ticket_code_index.watermark
+    
+    validation = await validate(gate(snapshot), later_code)
+    assert validation.is_valid, validation.message
+
+
+async def test_rescan_of_a_used_ticket_says_it_was_used(book_ticket):
+    ticket_code = await book_ticket()
+    use_cases = gate(SortedHashTicketCodeIndex())
+    await use_cases.load_ticket_code_index()
+    
+    first = await use_cases.use_ticket(ticket_code)
+    again = await use_cases.use_ticket(ticket_code)
+    
+    assert first.message == "Ticket has been successfully used"
+    assert again.status == TicketStatus.USED
+    assert again.message == "Ticket has already been used"
+    assert again.user_name == "Gate Tester"
+    assert again.booking_id == first.booking_id
+
+
+async def test_never_issued_code_skips_the_ticket_lookup(book_ticket):
+    await book_ticket()
+    use_cases = gate(SortedHashTicketCodeIndex())
+    await use_cases.load_ticket_code_index()
+    
+    with logged_queries() as log:
+        validation = await validate(use_cases, "TKT-20000101-FORGED00")
+    
+    assert not validation.is_valid
+    assert validation.message == "Ticket not found"
+    # Only the catch-up on tickets issued since the index was filled
+    assert len(log.statements) == 1, log.statements
@@ -0,0 +1,65 @@
+"""
+A ticket scanned at many gates at once is admitted exactly once
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from src.domain.entities.ticket import TicketStatus
+from src.infrastructure.database.models import EventModel, TicketModel, UserModel
+
+pytestmark = pytest.mark.anyio
+
+SCANNERS = 50
+
+
+async def book_ticket(client, quantity: int = 1) -> list:
+    """Book tickets of a new event through the API and return their codes"""
+    user = await UserModel.create(name="Gate Tester", phone="5550100")
+    event = await EventModel.create(
+        title="Stadium show",
+        description="One entrance, many gates",
+        venue="Stadium",
+        date_time=datetime.now(timezone.utc) + timedelta(days=30),
+        capacity=100,
+        price=Decimal("20.00")
+    )
+    response = await client.post(
+        "/api/v1/bookings", json={"user_id": user.id, "event_id": event.id, "quantity": quantity}
+    )
+    assert response.status_code == 201, response.text
+    
+    booking_id = response.json()["data"]["id"]
+    return await TicketModel.filter(booking_id=booking_id).order_by("id").values_list("ticket_code", flat=True)
+
+
+async def test_concurrent_scans_use_a_ticket_once(client):
+    [ticket_code] = await book_ticket(client)
+    
+    responses = await asyncio.gather(*(
+        client.post("/api/v1/tickets/use", json={"ticket_code": ticket_code}) for _ in range(SCANNERS)
+    ))
+    
+    assert [response.status_code for response in responses] == [200] * SCANNERS
+    messages = [response.json()["data"]["message"] for response in responses]
+    assert messages.count("Ticket has been successfully used") == 1
+    assert messages.count("Ticket has already been used") == SCANNERS - 1
+    assert (await TicketModel.get(ticket_code=ticket_code)).status == TicketStatus.USED
+
+
+async def test_concurrent_batch_scans_use_each_ticket_once(client):
+    ticket_codes = await book_ticket(client, quantity=3)
+    
+    # Every gate scans the whole group; each ticket must get in through one gate only
+    responses = await asyncio.gather(*(
+        client.post("/api/v1/tickets/use/batch", json={"ticket_codes": ticket_codes}) for _ in range(SCANNERS)
+    ))
+    
+    assert [response.status_code for response in responses] == [200] * SCANNERS
+    results = [result for response in responses for result in response.json()["data"]["results"]]
+    for ticket_code in ticket_codes:
+        messages = [result["message"] for result in results if result["ticket_code"] == ticket_code]
+        assert messages.count("Ticket has been successfully used") == 1
+        assert messages.count("Ticket has already been used") == SCANNERS - 1
+    assert sum(response.json()["data"]["succeeded"] for response in responses) == len(ticket_codes)
@@ -1,8 +1,13 @@
 import { ApplicationConfig, provideZoneChangeDetection } from '@angular/core'
 import { provideRouter } from '@angular/router'
-import { provideHttpClient, withFetch } from '@angular/common/http'
+import {
+    provideHttpClient,
+    withFetch,
+    withInterceptors,
+} from '@angular/common/http'
 
 import { routes } from './app.routes'
+import { credentialsInterceptor } from './core/interceptors'
 import {
     provideClientHydration,
     withEventReplay,
@@ -13,6 +18,9 @@ export const appConfig: ApplicationConfig = {
         provideZoneChangeDetection({ eventCoalescing: true }),
         provideRouter(routes),
         provideClientHydration(withEventReplay()),
-        provideHttpClient(withFetch()),
+        provideHttpClient(
+            withFetch(),
+            withInterceptors([credentialsInterceptor])
+        ),
     ],
 }
@@ -0,0 +1,15 @@
+import { HttpInterceptorFn } from '@angular/common/http'
+import { environment } from '../../../environments/environment'
+
+/**
+ * Send cookies with cross-origin API requests.
+ * The API marks a browser that just wrote with the db_primary_until cookie so
+ * its next reads go to the primary database instead of a lagging replica; the
+ * browser only stores and returns that cookie when credentials are included.
+ */
+export const credentialsInterceptor: HttpInterceptorFn = (req, next) => {
+    if (!req.url.startsWith(environment.apiUrl)) {
+        return next(req)
+    }
+    return next(req.clone({ withCredentials: true }))
+}
@@ -0,0 +1 @@
+export * from './credentials.interceptor'
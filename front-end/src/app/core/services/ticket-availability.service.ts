@@ -9,6 +9,7 @@ import {
 } from 'rxjs/operators'
 import { ApiService } from './api.service'
 import { DevModeService } from './dev-mode.service'
+import { environment } from '../../../environments/environment'
 
 export interface TicketAvailability {
     eventId: number
@@ -40,6 +41,8 @@ export class TicketAvailabilityService {
     private isPollingSubject = new BehaviorSubject<boolean>(false)
     private trackedEventIds = new Set<number>()
     private pollingSubscription: any
+    private eventSource: EventSource | null = null
+    private streamEventKey = ''
 
     public availability$ = this.availabilitySubject.asObservable()
     public isPolling$ = this.isPollingSubject.asObservable()
@@ -71,6 +74,9 @@ export class TicketAvailabilityService {
         // Stop polling if no events to track
         if (this.trackedEventIds.size === 0) {
             this.stopPolling()
+        } else if (this.eventSource) {
+            // Resubscribe the live stream without the event
+            this.connectStream()
         }
     }
 
@@ -170,6 +176,10 @@ export class TicketAvailabilityService {
      */
     private startPolling(): void {
         if (this.isPollingSubject.value) {
+            // Tracked events may have changed; resubscribe the live stream
+            if (this.eventSource) {
+                this.connectStream()
+            }
             return // Already polling
         }
 
@@ -178,7 +188,16 @@ export class TicketAvailabilityService {
         // Initial fetch
         this.fetchAvailability()
 
-        // Set up polling interval
+        // Prefer server-pushed updates, poll only when streaming is unavailable
+        if (!this.connectStream()) {
+            this.startPollingTimer()
+        }
+    }
+
+    /**
+     * Set up polling interval
+     */
+    private startPollingTimer(): void {
         this.pollingSubscription = timer(
             this.POLLING_INTERVAL,
             this.POLLING_INTERVAL
@@ -187,10 +206,66 @@ export class TicketAvailabilityService {
         })
     }
 
+    /**
+     * Subscribe to live availability changes (Server-Sent Events)
+     */
+    private connectStream(): boolean {
+        if (
+            this.devModeService.isDevMode ||
+            typeof EventSource === 'undefined' ||
+            this.trackedEventIds.size === 0
+        ) {
+            return false
+        }
+
+        const eventKey = Array.from(this.trackedEventIds)
+            .sort((a, b) => a - b)
+            .map(id => `event_ids=${id}`)
+            .join('&')
+        if (this.eventSource && eventKey === this.streamEventKey) {
+            return true
+        }
+
+        this.closeStream()
+        const source = new EventSource(
+            `${environment.apiUrl}/availability/stream?${eventKey}`
+        )
+        source.addEventListener('availability', (message: MessageEvent) => {
+            const eventData = JSON.parse(message.data)
+            this.availabilitySubject.next({
+                ...this.availabilitySubject.value,
+                [eventData.event_id]: this.mapAvailability(eventData),
+            })
+        })
+        source.onerror = () => {
+            // Fall back to polling if the stream cannot be kept open
+            this.closeStream()
+            if (this.isPollingSubject.value && !this.pollingSubscription) {
+                this.startPollingTimer()
+            }
+        }
+
+        this.eventSource = source
+        this.streamEventKey = eventKey
+        return true
+    }
+
+    /**
+     * Close the live availability stream
+     */
+    private closeStream(): void {
+        if (this.eventSource) {
+            this.eventSource.close()
+            this.eventSource = null
+            this.streamEventKey = ''
+        }
+    }
+
     /**
      * Stop polling for availability updates
      */
     private stopPolling(): void {
+        this.closeStream()
         if (this.pollingSubscription) {
             this.pollingSubscription.unsubscribe()
             this.pollingSubscription = null
@@ -240,19 +315,7 @@ export class TicketAvailabilityService {
                         const eventId = parseInt(eventIdStr)
                         const eventData = response.events[eventId]
 
-                        availability[eventId] = {
-                            eventId: eventData.event_id,
-                            totalCapacity: eventData.total_capacity,
-                            bookedTickets: eventData.booked_tickets,
-                            availableTickets: eventData.available_tickets,
-                            occupancyPercentage: eventData.occupancy_percentage,
-                            isSoldOut: eventData.is_sold_out,
-                            isAlmostSoldOut: eventData.is_almost_sold_out,
-                            eventStatus: eventData.event_status,
-                            lastUpdated: new Date(
-                                eventData.last_updated || Date.now()
-                            ),
-                        }
+                        availability[eventId] = this.mapAvailability(eventData)
                     })
 
                     this.availabilitySubject.next(availability)
@@ -260,6 +323,23 @@ export class TicketAvailabilityService {
             })
     }
 
+    /**
+     * Map API availability payload to the client model
+     */
+    private mapAvailability(eventData: any): TicketAvailability {
+        return {
+            eventId: eventData.event_id,
+            totalCapacity: eventData.total_capacity,
+            bookedTickets: eventData.booked_tickets,
+            availableTickets: eventData.available_tickets,
+            occupancyPercentage: eventData.occupancy_percentage,
+            isSoldOut: eventData.is_sold_out,
+            isAlmostSoldOut: eventData.is_almost_sold_out,
+            eventStatus: eventData.event_status,
+            lastUpdated: new Date(eventData.last_updated || Date.now()),
+        }
+    }
+
     /**
      * Generate mock availability data for development
      */